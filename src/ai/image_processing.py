@@ -8,6 +8,7 @@ to improve OCR results and visual analysis capabilities.
 import os
 import cv2
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional, List, Union
 from PIL import Image, ImageEnhance, ImageFilter
 
@@ -46,6 +47,64 @@ def load_image(image_path: str) -> Optional[np.ndarray]:
         return None
 
 
+@lru_cache(maxsize=256)
+def _read_gray_cached(image_path: str, mtime_ns: int, size: int) -> Optional[np.ndarray]:
+    """
+    Decode an image as grayscale, cached by path, modification time and size.
+    
+    Args:
+        image_path: Absolute path to the image file
+        mtime_ns: Modification time of the file (part of the cache key)
+        size: Size of the file in bytes (part of the cache key)
+        
+    Returns:
+        Optional[np.ndarray]: Read-only grayscale image or None if decoding fails
+    """
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    
+    if image is not None:
+        # The array is shared by every caller hitting the cache
+        image.setflags(write=False)
+        
+    return image
+
+
+def load_image_gray(image_path: str) -> Optional[np.ndarray]:
+    """
+    Load an image from file path directly as single-channel grayscale.
+    
+    Decoding straight to grayscale avoids a separate BGR decode and
+    conversion pass for consumers that only need intensity (e.g. matching).
+    Decoded images are kept in an LRU cache that is invalidated when the
+    file changes; the returned array is read-only, copy it before editing.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        Optional[np.ndarray]: Grayscale image as numpy array or None if loading fails
+    """
+    try:
+        if not os.path.exists(image_path):
+            logger.error(f"Image file not found: {image_path}")
+            return None
+            
+        # Load image with OpenCV (or reuse the cached decode)
+        stat = os.stat(image_path)
+        image = _read_gray_cached(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+        
+        if image is None:
+            logger.error(f"Failed to load image: {image_path}")
+            return None
+            
+        logger.debug(f"Grayscale image loaded: {image_path}, shape: {image.shape}")
+        return image
+        
+    except Exception as e:
+        logger.error(f"Error loading image {image_path}: {str(e)}")
+        return None
+
+
 def save_image(image: np.ndarray, output_path: str) -> bool:
     """
     Save an image to a file.
@@ -19,6 +19,25 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Instructions sent unchanged with every request as the system message. They
+# come before any page-specific content, so the request prefix stays
+# byte-identical across calls and can be served from the provider's prompt cache
+_SYSTEM_PROMPT = (
+    "You are an AI assistant helping automate job applications on Naukri.com. "
+    "Your task is to analyze the current state of the webpage and decide what action to take next. "
+    "You will be provided with text extracted from the page using OCR and information about UI elements detected.\n\n"
+    "Based on this information, decide what action to take next. "
+    "Respond with a JSON object containing:\n"
+    "1. action_type: The type of action to take (click, type, select, scroll, wait, navigate, next_job)\n"
+    "2. Additional parameters needed for the action (e.g., coordinates, selector, text)\n"
+    "3. reason: A brief explanation of why this action was chosen\n\n"
+    "Example response formats:\n"
+    "For clicking: {\"action_type\": \"click\", \"coordinates\": [x, y], \"reason\": \"Clicking apply button\"}\n"
+    "For typing: {\"action_type\": \"type\", \"element_label\": \"Email\", \"text\": \"user@example.com\", \"reason\": \"Filling email field\"}\n"
+    "For waiting: {\"action_type\": \"wait\", \"wait_seconds\": 3, \"reason\": \"Waiting for page to load\"}\n"
+    "For moving to next job: {\"action_type\": \"next_job\", \"reason\": \"Current job not suitable\"}\n"
+)
+
 
 def get_llm_decision(
     extracted_text: str,
@@ -44,11 +63,12 @@ def get_llm_decision(
         # Configure the OpenAI API
         _configure_llm_api(llm_config)
         
-        # Construct the prompt
-        prompt = _construct_prompt(extracted_text, ui_elements, context)
+        # Construct the prompt; context goes in its own message after it
+        prompt = _construct_prompt(extracted_text, ui_elements)
+        context_message = _construct_context_message(context) if context else None
         
         # Get response from the LLM
-        response = _query_llm(prompt, llm_config)
+        response = _query_llm(prompt, llm_config, context_message)
         
         # Parse the response into a structured action
         action = _parse_llm_response(response)
@@ -81,34 +101,29 @@ def _configure_llm_api(llm_config: Dict[str, Any]) -> None:
 
 def _construct_prompt(
     extracted_text: str,
-    ui_elements: List[Dict[str, Any]],
-    context: Dict[str, Any] = None
+    ui_elements: List[Dict[str, Any]]
 ) -> str:
     """
-    Construct a prompt for the LLM.
+    Construct the page-specific part of the prompt for the LLM.
+    
+    The fixed instructions are sent separately as _SYSTEM_PROMPT, and any
+    decision context as its own message (see _construct_context_message).
     
     Args:
         extracted_text: Text extracted from the screenshot
         ui_elements: List of detected UI elements and their properties
-        context: Additional context for the decision
     
     Returns:
         str: Formatted prompt
     """
-    # Start with a clear system instruction
-    system_instruction = (
-        "You are an AI assistant helping automate job applications on Naukri.com. "
-        "Your task is to analyze the current state of the webpage and decide what action to take next. "
-        "You will be provided with text extracted from the page using OCR and information about UI elements detected."
-    )
-    
     # Add description of the page content
     page_content = (
         f"Here is the text extracted from the current page:\n\n"
         f"{extracted_text[:3000]}..."  # Limit text length to avoid token limits
     )
     
-    # Add UI element descriptions
+    # Add UI element descriptions; elements are listed on their own rather
+    # than matched against OCR word boxes, so this stays a short linear pass
     ui_description = "Detected UI elements:\n"
     for i, element in enumerate(ui_elements[:20]):  # Limit to top 20 elements
         ui_description += f"{i+1}. Type: {element['type']}, "
@@ -133,52 +148,42 @@ def _construct_prompt(
         
         ui_description += "\n"
     
-    # Add context information if available
-    context_description = ""
-    if context:
-        context_description = "Additional context:\n"
-        
-        # Add recovery context if applicable
-        if context.get('recovery', False):
-            context_description += (
-                "Previous action failed and we are attempting to recover. "
-                f"Failed action: {context.get('failed_action', {}).get('action_type', 'unknown')}\n"
-            )
-        
-        # Add other context information
-        for key, value in context.items():
-            if key not in ['recovery', 'failed_action']:
-                context_description += f"{key}: {value}\n"
-    
-    # Add instructions for the response format
-    response_instructions = (
-        "Based on this information, decide what action to take next. "
-        "Respond with a JSON object containing:\n"
-        "1. action_type: The type of action to take (click, type, select, scroll, wait, navigate, next_job)\n"
-        "2. Additional parameters needed for the action (e.g., coordinates, selector, text)\n"
-        "3. reason: A brief explanation of why this action was chosen\n\n"
-        "Example response formats:\n"
-        "For clicking: {\"action_type\": \"click\", \"coordinates\": [x, y], \"reason\": \"Clicking apply button\"}\n"
-        "For typing: {\"action_type\": \"type\", \"element_label\": \"Email\", \"text\": \"user@example.com\", \"reason\": \"Filling email field\"}\n"
-        "For waiting: {\"action_type\": \"wait\", \"wait_seconds\": 3, \"reason\": \"Waiting for page to load\"}\n"
-        "For moving to next job: {\"action_type\": \"next_job\", \"reason\": \"Current job not suitable\"}\n"
-    )
-    
-    # Combine all parts into the final prompt
-    prompt = f"{system_instruction}\n\n{page_content}\n\n{ui_description}\n\n{context_description}\n\n{response_instructions}"
+    # Combine the page-specific parts into the prompt
+    prompt = f"{page_content}\n\n{ui_description}"
     
     logger.debug(f"Constructed LLM prompt with {len(prompt)} characters")
     return prompt
 
 
+def _construct_context_message(context: Dict[str, Any]) -> str:
+    """
+    Construct the message carrying additional decision context.
+    
+    Args:
+        context: Additional context for the decision (e.g., recovery details)
+    
+    Returns:
+        str: Context message with the context serialized as JSON
+    """
+    message = "Additional context:\n"
+    
+    # Add recovery context if applicable
+    if context.get('recovery', False):
+        message += "Previous action failed and we are attempting to recover.\n"
+    
+    # Values that are not JSON-serializable (e.g. WebElements) are stringified
+    return message + json.dumps(context, default=str, sort_keys=True)
+
+
 @retry(tries=3, delay=1, backoff=2)
-def _query_llm(prompt: str, llm_config: Dict[str, Any]) -> str:
+def _query_llm(prompt: str, llm_config: Dict[str, Any], context_message: Optional[str] = None) -> str:
     """
     Query the LLM API with the constructed prompt.
     
     Args:
         prompt: Formatted prompt
         llm_config: LLM configuration dictionary
+        context_message: Optional context sent as a separate message after the prompt
     
     Returns:
         str: LLM response
@@ -193,9 +198,11 @@ def _query_llm(prompt: str, llm_config: Dict[str, Any]) -> str:
         
         # Build the messages array
         messages = [
-            {"role": "system", "content": "You are an AI assistant helping automate job applications."},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
+        if context_message:
+            messages.append({"role": "user", "content": context_message})
         
         # Extract only the API key for client initialization - ignore all other params
         api_key = llm_config.get('api_key')
@@ -8,31 +8,37 @@ It uses OpenCV for basic element detection and can be extended to use more advan
 import os
 import cv2
 import numpy as np
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
 
-def detect_ui_elements(image_path: str) -> List[Dict[str, Any]]:
+def detect_ui_elements(image_path: Union[str, np.ndarray]) -> List[Dict[str, Any]]:
     """
     Detect UI elements in a screenshot.
     
     Args:
-        image_path: Path to the screenshot image
+        image_path: Path to the screenshot image or an already decoded BGR image
     
     Returns:
         List[Dict[str, Any]]: List of detected UI elements with their properties
     """
-    logger.info(f"Detecting UI elements in image: {image_path}")
+    if isinstance(image_path, np.ndarray):
+        logger.info("Detecting UI elements in in-memory image")
+        img = image_path
+    else:
+        logger.info(f"Detecting UI elements in image: {image_path}")
+        img = None
     
     try:
-        # Read the image
-        img = cv2.imread(image_path)
+        # Read the image unless it was passed in decoded
         if img is None:
-            logger.error(f"Failed to load image: {image_path}")
-            return []
+            img = cv2.imread(image_path)
+            if img is None:
+                logger.error(f"Failed to load image: {image_path}")
+                return []
             
         # Get image dimensions
         height, width, _ = img.shape
@@ -40,7 +46,8 @@ def detect_ui_elements(image_path: str) -> List[Dict[str, Any]]:
         # Create a list to store detected elements
         ui_elements = []
         
-        # Detect different types of UI elements
+        # Detect different types of UI elements; these are contour and color
+        # heuristics with no neural model, so there are no weights to quantize
         buttons = detect_buttons(img)
         ui_elements.extend(buttons)
         
@@ -63,6 +70,9 @@ def detect_ui_elements(image_path: str) -> List[Dict[str, Any]]:
             element['center_x'] = x + w // 2
             element['center_y'] = y + h // 2
         
+        # Elements stay as dicts: their consumers (the LLM prompt and the
+        # decision cache key) format them one by one and never run numeric
+        # passes over all boxes that an array layout would speed up
         logger.info(f"Detected {len(ui_elements)} UI elements")
         return ui_elements
         
@@ -6,8 +6,12 @@ It handles text detection, recognition, and provides bounding boxes for interact
 """
 
 import os
+import re
 import json
-from typing import List, Dict, Any, Tuple, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple, Optional, Union
 import logging
 
 import numpy as np
@@ -16,6 +20,13 @@ from PIL import Image
 import pytesseract
 from pytesseract import Output
 
+# tesserocr keeps a Tesseract engine loaded in-process; it is optional, and
+# without it every OCR call goes through a pytesseract subprocess
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -24,32 +35,207 @@ logger = get_logger()
 # Uncomment and modify this line if tesseract is not in your PATH
 # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
+# Each pytesseract call spawns a fresh tesseract process; OpenMP thread spin-up
+# costs far more than it saves on screenshot-sized images, so run single-threaded
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# Label keywords indicating a form field
+_FORM_LABEL_RE = re.compile('|'.join([
+    'name', 'email', 'phone', 'address', 'city', 'state', 'zip', 'country',
+    'username', 'password', 'confirm', 'first', 'last', 'middle',
+    'company', 'job', 'title', 'experience', 'education', 'skill'
+]))
+
+# Field types in priority order with the label keywords that select them
+_FIELD_TYPE_KEYWORDS = (
+    ('email', ('email',)),
+    ('password', ('password', 'pwd')),
+    ('phone', ('phone', 'mobile', 'cell')),
+    ('date', ('date', 'birth', 'dob')),
+    ('select', ('select', 'choose', 'option')),
+    ('file', ('upload', 'file', 'resume', 'cv')),
+    ('checkbox', ('check', 'agree', 'accept', 'terms')),
+)
+_KEYWORD_TO_FIELD_TYPE = {
+    keyword: (priority, field_type)
+    for priority, (field_type, keywords) in enumerate(_FIELD_TYPE_KEYWORDS)
+    for keyword in keywords
+}
+# Lookahead so overlapping keywords are all reported
+_FIELD_TYPE_RE = re.compile('(?=(' + '|'.join(_KEYWORD_TO_FIELD_TYPE) + '))')
+
+# Common button text patterns
+_BUTTON_TEXT_RE = re.compile('|'.join([
+    'submit', 'apply', 'login', 'sign', 'send', 'next', 'previous',
+    'save', 'cancel', 'continue', 'upload', 'search', 'ok', 'yes', 'no'
+]))
+
+# LRU cache of OCR position results keyed by image identity and confidence
+_OCR_CACHE_SIZE = 32
+_ocr_cache: 'OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], ...]]' = OrderedDict()
+
+# Set once the tessdata language pack has been read into the OS page cache
+_tessdata_warmed = False
+
+# Resident tesserocr engine, the language it was loaded for, and a lock since
+# one engine cannot process two images at once
+_tess_api = None
+_tess_api_language: Optional[str] = None
+_tess_api_lock = threading.Lock()
 
-def extract_text_from_screenshot(screenshot_path: str, ocr_config: Dict[str, Any] = None) -> str:
+
+def _warm_tessdata(ocr_config: Optional[Dict[str, Any]] = None) -> None:
     """
-    Extract all text from a screenshot using OCR.
+    Point TESSDATA_PREFIX at the tessdata directory and pre-read the language pack.
+    
+    Every tesseract subprocess reloads the traineddata file; reading it once here
+    keeps it hot in the OS page cache for all subsequent invocations.
+    
+    Args:
+        ocr_config: Optional OCR configuration settings
+    """
+    global _tessdata_warmed
+    
+    if _tessdata_warmed:
+        return
+    
+    # Hold the engine lock so a concurrent extraction waits for TESSDATA_PREFIX,
+    # and only mark the pack as warmed once the work is done
+    with _tess_api_lock:
+        if _tessdata_warmed:
+            return
+        
+        try:
+            tessdata_dir = os.environ.get('TESSDATA_PREFIX')
+            if not tessdata_dir and ocr_config and 'tesseract_path' in ocr_config:
+                candidate = os.path.join(os.path.dirname(ocr_config['tesseract_path']), 'tessdata')
+                if os.path.isdir(candidate):
+                    tessdata_dir = candidate
+                    os.environ['TESSDATA_PREFIX'] = tessdata_dir
+            
+            if not tessdata_dir:
+                return
+            
+            language = (ocr_config or {}).get('language', 'eng')
+            for lang in language.split('+'):
+                traineddata = os.path.join(tessdata_dir, f"{lang}.traineddata")
+                if os.path.isfile(traineddata):
+                    with open(traineddata, 'rb') as f:
+                        while f.read(1 << 20):
+                            pass
+                    logger.debug(f"Warmed tessdata language pack: {traineddata}")
+                    
+        except OSError as e:
+            logger.debug(f"Could not warm tessdata language pack: {str(e)}")
+        finally:
+            _tessdata_warmed = True
+
+
+def _get_tess_api(ocr_config: Optional[Dict[str, Any]] = None):
+    """
+    Get the resident tesserocr engine, loading it on first use.
     
     Args:
-        screenshot_path: Path to the screenshot image file
         ocr_config: Optional OCR configuration settings
     
+    Returns:
+        tesserocr.PyTessBaseAPI or None: Engine for the configured language, or
+            None if tesserocr is unavailable or failed to initialize
+    """
+    global _tess_api, _tess_api_language
+    
+    if tesserocr is None:
+        return None
+    
+    language = (ocr_config or {}).get('language', 'eng')
+    if _tess_api_language == language:
+        return _tess_api
+    
+    if _tess_api is not None:
+        _tess_api.End()
+    _tess_api, _tess_api_language = None, language
+    
+    try:
+        kwargs = {'lang': language}
+        if os.environ.get('TESSDATA_PREFIX'):
+            kwargs['path'] = os.environ['TESSDATA_PREFIX']
+        _tess_api = tesserocr.PyTessBaseAPI(**kwargs)
+        logger.info(f"Loaded resident Tesseract engine for language '{language}'")
+    except RuntimeError as e:
+        logger.warning(f"Could not load tesserocr engine, using pytesseract: {str(e)}")
+    
+    return _tess_api
+
+
+def warm_up_ocr(ocr_config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Load OCR resources ahead of the first extraction.
+    
+    Pre-reads the tessdata language pack and, when tesserocr is available,
+    loads the resident engine, so the first screenshot is not slower than
+    the rest.
+    
+    Args:
+        ocr_config: Optional OCR configuration settings
+    """
+    _warm_tessdata(ocr_config)
+    with _tess_api_lock:
+        _get_tess_api(ocr_config)
+
+
+def extract_text_from_screenshot(screenshot_path: Union[str, np.ndarray], ocr_config: Dict[str, Any] = None) -> str:
+    """
+    Extract all text from a screenshot using OCR.
+    
+    Args:
+        screenshot_path: Path to the screenshot image file or a BGR image array
+        ocr_config: Optional OCR configuration settings; 'scale' shrinks
+            image arrays by that factor before OCR (default 1.0) and 'psm'
+            sets Tesseract's page segmentation mode (e.g. 11 for sparse text)
+    
     Returns:
         str: Extracted text from the entire screenshot
     """
     try:
-        # Open the image with PIL
-        img = Image.open(screenshot_path)
+        # Use the decoded array as grayscale, otherwise open the image with PIL;
+        # pytesseract re-encodes arrays to a temporary PNG, so passing a single
+        # channel (and optionally fewer pixels) makes that step cheaper
+        if isinstance(screenshot_path, np.ndarray):
+            img = screenshot_path
+            if img.ndim == 3:
+                img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            
+            scale = float((ocr_config or {}).get('scale', 1.0))
+            if scale < 1.0:
+                img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            img = Image.open(screenshot_path)
         
         # Configure Tesseract path if provided in config
         if ocr_config and 'tesseract_path' in ocr_config:
             pytesseract.pytesseract.tesseract_cmd = ocr_config['tesseract_path']
         
-        # Extract text using pytesseract
-        config_options = ''
-        if ocr_config and 'language' in ocr_config:
-            config_options += f"-l {ocr_config['language']}"
-            
-        extracted_text = pytesseract.image_to_string(img, config=config_options)
+        _warm_tessdata(ocr_config)
+        
+        psm = (ocr_config or {}).get('psm')
+        
+        with _tess_api_lock:
+            tess_api = _get_tess_api(ocr_config)
+            if tess_api is not None:
+                # Reuse the loaded engine instead of starting tesseract again
+                tess_api.SetPageSegMode(int(psm) if psm is not None else tesserocr.PSM.AUTO)
+                tess_api.SetImage(Image.fromarray(img) if isinstance(img, np.ndarray) else img)
+                extracted_text = tess_api.GetUTF8Text()
+        
+        if tess_api is None:
+            # Extract text using pytesseract
+            config_options = ''
+            if ocr_config and 'language' in ocr_config:
+                config_options += f"-l {ocr_config['language']}"
+            if psm is not None:
+                config_options += f" --psm {int(psm)}"
+                
+            extracted_text = pytesseract.image_to_string(img, config=config_options)
         
         logger.info(f"Extracted {len(extracted_text)} characters from screenshot")
         return extracted_text
@@ -59,46 +245,127 @@ def extract_text_from_screenshot(screenshot_path: str, ocr_config: Dict[str, Any
         return ""
 
 
+def _image_to_columns(img: Union[Image.Image, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Run tesseract on an image and parse its TSV output into typed columns.
+    
+    Args:
+        img: PIL image or image array to run OCR on
+    
+    Returns:
+        Dict[str, np.ndarray]: 'text' as a string array and 'left', 'top',
+            'width', 'height' and 'conf' (truncated to int) as int32 arrays
+    """
+    lines = pytesseract.image_to_data(img, output_type=Output.STRING).splitlines()
+    header = lines[0].split('\t')
+    
+    # The text column may be empty but is always the last one
+    rows = [line.split('\t', len(header) - 1) for line in lines[1:]]
+    rows = [row for row in rows if len(row) == len(header)]
+    columns = dict(zip(header, map(list, zip(*rows)))) if rows else {}
+    
+    # Numeric columns are converted in bulk by numpy instead of per cell
+    return {
+        'text': np.asarray(columns.get('text', []), dtype=str),
+        'left': np.asarray(columns.get('left', []), dtype=str).astype(np.int32),
+        'top': np.asarray(columns.get('top', []), dtype=str).astype(np.int32),
+        'width': np.asarray(columns.get('width', []), dtype=str).astype(np.int32),
+        'height': np.asarray(columns.get('height', []), dtype=str).astype(np.int32),
+        'conf': np.asarray(columns.get('conf', []), dtype=str).astype(np.float32).astype(np.int32),
+    }
+
+
+def _image_cache_key(image: Union[str, np.ndarray]) -> Tuple[Any, ...]:
+    """
+    Build a cache key identifying the content of an image.
+    
+    Args:
+        image: Path to an image file or an image array
+    
+    Returns:
+        Tuple: Key that changes whenever the image content changes
+    """
+    if isinstance(image, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(image).tobytes(), digest_size=8).digest()
+        return ('array', image.shape, digest)
+    
+    stat = os.stat(image)
+    return ('path', os.path.abspath(image), stat.st_mtime_ns, stat.st_size)
+
+
 def extract_text_with_positions(
-    screenshot_path: str, 
-    min_confidence: float = 0.5
+    screenshot_path: Union[str, np.ndarray], 
+    min_confidence: float = 0.5,
+    roi: Optional[Tuple[int, int, int, int]] = None
 ) -> List[Dict[str, Any]]:
     """
     Extract text along with position information from a screenshot.
     
+    Results are cached by image content, so repeated analyses of the same
+    frame (e.g. form fields followed by buttons) only run tesseract once.
+    
     Args:
-        screenshot_path: Path to the screenshot image file
+        screenshot_path: Path to the screenshot image file or an image array
         min_confidence: Minimum confidence threshold for text detection
+        roi: Optional region (x, y, width, height) to restrict OCR to, e.g. the
+            changed area reported by screenshot.diff_bbox; positions are still
+            returned in full-image coordinates
     
     Returns:
         List[Dict]: List of dictionaries containing text and position data
     """
     try:
-        # Open the image with PIL
-        img = Image.open(screenshot_path)
-        
-        # Extract data using pytesseract with output formatting
-        data = pytesseract.image_to_data(img, output_type=Output.DICT)
-        
-        # Process the OCR results
-        text_results = []
+        cache_key = (_image_cache_key(screenshot_path), min_confidence, roi)
+        cached = _ocr_cache.get(cache_key)
+        if cached is not None:
+            _ocr_cache.move_to_end(cache_key)
+            logger.debug(f"Reusing cached OCR result ({len(cached)} text elements)")
+            return [dict(text_info) for text_info in cached]
         
-        for i in range(len(data['text'])):
-            # Skip empty text and text with low confidence
-            if int(data['conf'][i]) < min_confidence * 100 or data['text'][i].strip() == '':
-                continue
-                
-            # Create a dictionary with the text and its position
-            text_info = {
-                'text': data['text'][i],
-                'x': data['left'][i],
-                'y': data['top'][i],
-                'width': data['width'][i],
-                'height': data['height'][i],
-                'confidence': int(data['conf'][i]) / 100
+        # Open the image with PIL
+        if isinstance(screenshot_path, np.ndarray):
+            img = screenshot_path
+        else:
+            img = Image.open(screenshot_path)
+        
+        # Crop to the region of interest so tesseract only sees that area
+        offset_x, offset_y = 0, 0
+        if roi is not None:
+            offset_x, offset_y, roi_width, roi_height = roi
+            if isinstance(img, np.ndarray):
+                img = img[offset_y:offset_y + roi_height, offset_x:offset_x + roi_width]
+            else:
+                img = img.crop((offset_x, offset_y, offset_x + roi_width, offset_y + roi_height))
+        
+        # Extract data using pytesseract as typed columns
+        data = _image_to_columns(img)
+        
+        # Skip empty text and text with low confidence
+        keep = (data['conf'] >= min_confidence * 100) & (np.char.strip(data['text']) != '')
+        
+        # Create a dictionary with the text and its position for each element
+        text_results = [
+            {
+                'text': text,
+                'x': x + offset_x,
+                'y': y + offset_y,
+                'width': width,
+                'height': height,
+                'confidence': conf / 100
             }
-            
-            text_results.append(text_info)
+            for text, x, y, width, height, conf in zip(
+                data['text'][keep].tolist(),
+                data['left'][keep].tolist(),
+                data['top'][keep].tolist(),
+                data['width'][keep].tolist(),
+                data['height'][keep].tolist(),
+                data['conf'][keep].tolist()
+            )
+        ]
+        
+        _ocr_cache[cache_key] = tuple(dict(text_info) for text_info in text_results)
+        if len(_ocr_cache) > _OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
         
         logger.info(f"Extracted {len(text_results)} text elements with position data")
         return text_results
@@ -131,20 +398,25 @@ def find_text_on_screen(
         # Normalize target text for comparison
         target_text_lower = target_text.lower().strip()
         
-        # Find matching elements
+        # Find matching elements; an exact match is also a substring match, so
+        # a single vectorized substring search over all tokens covers both
         matches = []
         
-        for element in text_elements:
-            element_text = element['text'].lower().strip()
+        if text_elements:
+            texts = np.char.lower(np.char.strip(
+                np.asarray([element['text'] for element in text_elements], dtype=str)
+            ))
+            hits = np.flatnonzero(np.char.find(texts, target_text_lower) >= 0)
             
-            # Check for exact matches or if target is a substring
-            if element_text == target_text_lower or target_text_lower in element_text:
-                matches.append((
-                    element['x'],
-                    element['y'],
-                    element['width'],
-                    element['height']
-                ))
+            matches = [
+                (
+                    text_elements[i]['x'],
+                    text_elements[i]['y'],
+                    text_elements[i]['width'],
+                    text_elements[i]['height']
+                )
+                for i in hits
+            ]
         
         if matches:
             logger.info(f"Found '{target_text}' at {len(matches)} locations on screen")
@@ -169,10 +441,6 @@ def extract_form_fields(screenshot_path: str) -> List[Dict[str, Any]]:
         List[Dict]: Information about detected form fields
     """
     try:
-        # Open image with OpenCV for form field detection
-        img = cv2.imread(screenshot_path)
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
         # Extract text with positions
         text_positions = extract_text_with_positions(screenshot_path)
         
@@ -182,11 +450,7 @@ def extract_form_fields(screenshot_path: str) -> List[Dict[str, Any]]:
         for i, text_elem in enumerate(text_positions):
             # Look for common form field label patterns
             text = text_elem['text'].lower()
-            if any(keyword in text for keyword in [
-                'name', 'email', 'phone', 'address', 'city', 'state', 'zip', 'country',
-                'username', 'password', 'confirm', 'first', 'last', 'middle',
-                'company', 'job', 'title', 'experience', 'education', 'skill'
-            ]):
+            if _FORM_LABEL_RE.search(text):
                 # Look for an input field below or to the right of this label
                 field_x = text_elem['x'] + text_elem['width'] + 20  # Approx field position
                 field_y = text_elem['y']
@@ -218,26 +482,10 @@ def _guess_field_type(label_text: str) -> str:
     """
     label_text = label_text.lower()
     
-    if any(keyword in label_text for keyword in ['email']):
-        return 'email'
-    
-    elif any(keyword in label_text for keyword in ['password', 'pwd']):
-        return 'password'
-    
-    elif any(keyword in label_text for keyword in ['phone', 'mobile', 'cell']):
-        return 'phone'
-    
-    elif any(keyword in label_text for keyword in ['date', 'birth', 'dob']):
-        return 'date'
-    
-    elif any(keyword in label_text for keyword in ['select', 'choose', 'option']):
-        return 'select'
-    
-    elif any(keyword in label_text for keyword in ['upload', 'file', 'resume', 'cv']):
-        return 'file'
-    
-    elif any(keyword in label_text for keyword in ['check', 'agree', 'accept', 'terms']):
-        return 'checkbox'
+    # Keywords may overlap within one label; the highest-priority type wins
+    matched = [_KEYWORD_TO_FIELD_TYPE[m.group(1)] for m in _FIELD_TYPE_RE.finditer(label_text)]
+    if matched:
+        return min(matched)[1]
     
     # Default to text for most fields
     return 'text'
@@ -254,25 +502,17 @@ def detect_buttons(screenshot_path: str) -> List[Dict[str, Any]]:
         List[Dict]: Information about detected buttons
     """
     try:
-        # Load image with OpenCV
-        img = cv2.imread(screenshot_path)
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
         # Extract text with positions for button labels
         text_positions = extract_text_with_positions(screenshot_path)
         
         # Find button-like elements
         buttons = []
         
-        # Common button text patterns
-        button_texts = ['submit', 'apply', 'login', 'sign', 'send', 'next', 'previous', 
-                        'save', 'cancel', 'continue', 'upload', 'search', 'ok', 'yes', 'no']
-        
         for text_elem in text_positions:
             text = text_elem['text'].lower()
             
             # Check if text matches common button patterns
-            if any(btn_text in text for btn_text in button_texts) or len(text) < 15:
+            if _BUTTON_TEXT_RE.search(text):
                 buttons.append({
                     'text': text_elem['text'],
                     'position': (
@@ -333,36 +573,30 @@ def extract_table_data(screenshot_path: str) -> List[List[str]]:
         img = Image.open(screenshot_path)
         
         # Extract text with position data
-        text_data = pytesseract.image_to_data(img, output_type=Output.DICT)
-        
-        # Group text by line (based on top position)
-        lines = {}
-        for i in range(len(text_data['text'])):
-            if text_data['text'][i].strip() == '':
-                continue
-                
-            line_y = text_data['top'][i]
-            # Group lines that are within 5 pixels of each other
-            line_key = line_y // 5 * 5
-            
-            if line_key not in lines:
-                lines[line_key] = []
-                
-            lines[line_key].append({
-                'text': text_data['text'][i],
-                'x': text_data['left'][i],
-                'conf': text_data['conf'][i]
-            })
-        
-        # Sort each line by x position
-        for line_key in lines:
-            lines[line_key].sort(key=lambda item: item['x'])
-        
-        # Convert to 2D array
-        table_data = []
-        for line_key in sorted(lines.keys()):
-            row = [item['text'] for item in lines[line_key]]
-            table_data.append(row)
+        text_data = _image_to_columns(img)
+        
+        # Drop empty tokens before grouping
+        keep = np.char.strip(text_data['text']) != ''
+        text = text_data['text'][keep]
+        
+        if text.size == 0:
+            logger.info("Extracted table with 0 rows")
+            return []
+        
+        # Group lines that are within 5 pixels of each other and order each
+        # line by x position with a single lexsort (row first, then left).
+        # lexsort is stable, so tokens with equal row and x keep tesseract's
+        # reading order, matching the previous dict-and-sort grouping
+        rows = text_data['top'][keep] // 5
+        left = text_data['left'][keep]
+        order = np.lexsort((left, rows))
+        
+        rows = rows[order]
+        text = text[order]
+        
+        # Split the sorted tokens wherever the row key changes
+        boundaries = np.flatnonzero(np.diff(rows)) + 1
+        table_data = [row.tolist() for row in np.split(text, boundaries)]
         
         logger.info(f"Extracted table with {len(table_data)} rows")
         return table_data
@@ -10,6 +10,7 @@ import time
 from datetime import datetime
 from typing import Optional, Tuple, Dict
 
+import cv2
 import numpy as np
 import pyautogui
 from PIL import Image
@@ -18,6 +19,12 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Maximum possible squared error per grayscale pixel
+_MAX_PIXEL_ERROR = 255 ** 2
+
+# Number of horizontal bands scanned by the early-exit change check
+_CHANGE_SCAN_BANDS = 4
+
 
 def capture_screenshot(output_dir: str = "screenshots", filename: Optional[str] = None) -> str:
     """
@@ -247,16 +254,17 @@ def detect_page_change(
             f"temp_compare_{int(start_time)}.png"
         )
         
+        # The reference frame never changes, so decode it only once
+        initial = _load_grayscale(initial_screenshot_path)
+        
         while time.time() - start_time < timeout:
             # Capture current state
             pyautogui.screenshot().save(temp_screenshot_path)
-            
-            # Compare with initial screenshot
-            similarity = calculate_similarity(initial_screenshot_path, temp_screenshot_path)
+            current = _load_grayscale(temp_screenshot_path, size=initial.shape[::-1])
             
             # If similarity is below threshold, page has changed
-            if similarity < similarity_threshold:
-                logger.info(f"Page change detected (similarity: {similarity:.4f})")
+            if _differs_beyond(initial, current, similarity_threshold):
+                logger.info(f"Page change detected (similarity below {similarity_threshold:.4f})")
                 
                 # Clean up temp file
                 if os.path.exists(temp_screenshot_path):
@@ -279,6 +287,53 @@ def detect_page_change(
         return False
 
 
+def _load_grayscale(image_path: str, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """
+    Load an image as a grayscale array, optionally resized.
+    
+    Args:
+        image_path: Path to the image
+        size: Optional (width, height) to resize to if the image differs
+    
+    Returns:
+        np.ndarray: Grayscale image as a uint8 array
+    """
+    img = Image.open(image_path)
+    
+    if size is not None and img.size != tuple(size):
+        img = img.resize(tuple(size))
+    
+    return np.asarray(img.convert('L'))
+
+
+def _differs_beyond(arr1: np.ndarray, arr2: np.ndarray, similarity_threshold: float) -> bool:
+    """
+    Check whether two grayscale images have similarity below a threshold.
+    
+    The squared error is accumulated band by band and the scan stops as soon as
+    the error budget implied by the threshold is exceeded, so localized changes
+    are detected without diffing the whole frame.
+    
+    Args:
+        arr1: First grayscale image
+        arr2: Second grayscale image of the same shape
+        similarity_threshold: Similarity below which the images count as different
+    
+    Returns:
+        bool: True if calculate_similarity would fall below the threshold
+    """
+    budget = (1 - similarity_threshold) * _MAX_PIXEL_ERROR * arr1.size
+    band_height = max(1, -(-arr1.shape[0] // _CHANGE_SCAN_BANDS))
+    
+    sse = 0.0
+    for top in range(0, arr1.shape[0], band_height):
+        sse += cv2.norm(arr1[top:top + band_height], arr2[top:top + band_height], cv2.NORM_L2SQR)
+        if sse > budget:
+            return True
+    
+    return False
+
+
 def calculate_similarity(img1_path: str, img2_path: str) -> float:
     """
     Calculate similarity between two images.
@@ -291,27 +346,19 @@ def calculate_similarity(img1_path: str, img2_path: str) -> float:
         float: Similarity score (0-1, higher means more similar)
     """
     try:
-        # Load images
-        img1 = Image.open(img1_path)
-        img2 = Image.open(img2_path)
-        
-        # Ensure both images are the same size
-        if img1.size != img2.size:
-            img2 = img2.resize(img1.size)
+        # Load images (grayscale for simplicity), resizing the second to match
+        arr1 = _load_grayscale(img1_path)
+        arr2 = _load_grayscale(img2_path, size=arr1.shape[::-1])
         
-        # Convert to numpy arrays (grayscale for simplicity)
-        arr1 = np.array(img1.convert('L'))
-        arr2 = np.array(img2.convert('L'))
-        
-        # Calculate mean squared error
-        mse = np.mean((arr1 - arr2) ** 2)
+        # Calculate mean squared error; cv2.norm accumulates in double
+        # precision, avoiding uint8 wrap-around in the pixel difference
+        mse = cv2.norm(arr1, arr2, cv2.NORM_L2SQR) / arr1.size
         
         # Convert to similarity score (1 = identical, 0 = completely different)
         if mse == 0:
             return 1.0
         
-        max_error = 255 ** 2  # Maximum possible error per pixel
-        similarity = 1 - (mse / max_error)
+        similarity = 1 - (mse / _MAX_PIXEL_ERROR)
         
         return similarity
         
@@ -320,6 +367,40 @@ def calculate_similarity(img1_path: str, img2_path: str) -> float:
         return 0.0
 
 
+def diff_bbox(
+    img1_path: str,
+    img2_path: str,
+    pixel_threshold: int = 16
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Find the bounding box of the region that differs between two images.
+    
+    The result can be passed as the ``roi`` of OCR calls so that only the
+    changed part of the page is re-processed.
+    
+    Args:
+        img1_path: Path to the first image
+        img2_path: Path to the second image
+        pixel_threshold: Minimum grayscale difference for a pixel to count as changed
+    
+    Returns:
+        Optional[Tuple]: Changed region as (x, y, width, height), or None if nothing changed
+    """
+    try:
+        arr1 = _load_grayscale(img1_path)
+        arr2 = _load_grayscale(img2_path, size=arr1.shape[::-1])
+        
+        changed = cv2.findNonZero((cv2.absdiff(arr1, arr2) > pixel_threshold).astype(np.uint8))
+        if changed is None:
+            return None
+        
+        return tuple(int(v) for v in cv2.boundingRect(changed))
+        
+    except Exception as e:
+        logger.error(f"Error calculating changed region: {str(e)}")
+        return None
+
+
 def get_screen_dimensions() -> Tuple[int, int]:
     """
     Get the screen dimensions.
@@ -9,14 +9,448 @@ form fields, and other interactive elements.
 import os
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional, Union
-import time
 
 from src.utils.logger import get_logger
 import src.ai.image_processing as img_proc
 
 logger = get_logger()
 
+# Pyramid levels stop once the template's smaller side would drop below this
+PYRAMID_MIN_TEMPLATE_DIM = 20
+
+# Padding (pixels) of the search window around a coarse peak at each finer level
+PYRAMID_REFINE_PADDING = 4
+
+# Coarse-level threshold slack to tolerate downsampling noise
+PYRAMID_THRESHOLD_SLACK = 0.1
+
+# Methods with normalized scores that stay comparable across pyramid levels
+PYRAMID_METHODS = (cv2.TM_CCOEFF_NORMED, cv2.TM_CCORR_NORMED)
+
+# Worker threads for matching independent templates/screenshots; OpenCV keeps
+# its own thread pool too, so only use half the cores to avoid oversubscription
+MATCH_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# Encoder settings favouring write speed for debug/visualization artifacts
+FAST_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+FAST_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# How often each template path won find_best_template_match, used to try
+# likely templates first
+_best_match_counts: Dict[str, int] = {}
+
+# Largest max_results for which NMS first tries a partial top-k candidate pool
+TOP_K_MAX_RESULTS = 20
+
+
+def _pyramid_levels(template_shape: Tuple[int, ...]) -> int:
+    """
+    Number of pyramid levels usable for a template of the given shape.
+    
+    Args:
+        template_shape: Shape of the template image
+    
+    Returns:
+        int: Number of times the template can be halved while staying
+            at least PYRAMID_MIN_TEMPLATE_DIM pixels on its smaller side
+    """
+    h, w = template_shape[:2]
+    levels = 0
+    
+    while min((h + 1) // 2, (w + 1) // 2) >= PYRAMID_MIN_TEMPLATE_DIM:
+        h, w = (h + 1) // 2, (w + 1) // 2
+        levels += 1
+        
+    return levels
+
+
+def _build_pyramid(image: np.ndarray, levels: int) -> Tuple[np.ndarray, ...]:
+    """
+    Build a Gaussian pyramid of an image.
+    
+    Args:
+        image: Full resolution image
+        levels: Number of downsampled levels to add
+    
+    Returns:
+        Tuple[np.ndarray, ...]: Images from full resolution (index 0) to coarsest
+    """
+    pyramid = [image]
+    
+    for _ in range(levels):
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+        
+    return tuple(pyramid)
+
+
+@lru_cache(maxsize=8)
+def _load_pyramid(image_path: str, mtime: float, levels: int) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Load an image as grayscale and build its pyramid, cached by path and modification time.
+    
+    Args:
+        image_path: Path to the image
+        mtime: Modification time of the file (part of the cache key)
+        levels: Number of downsampled levels
+    
+    Returns:
+        Optional[Tuple[np.ndarray, ...]]: Image pyramid or None if loading fails
+    """
+    image = img_proc.load_image_gray(image_path)
+    
+    if image is None:
+        return None
+        
+    return _build_pyramid(image, levels)
+
+
+def _write_params(output_path: str, fast_io: bool) -> List[int]:
+    """
+    Encoder parameters for cv2.imwrite based on the output file type.
+    
+    Args:
+        output_path: Path of the image to write
+        fast_io: Whether to favour encoding speed over file size
+    
+    Returns:
+        List[int]: Parameters for cv2.imwrite (empty for OpenCV defaults)
+    """
+    if not fast_io:
+        return []
+        
+    ext = os.path.splitext(output_path)[1].lower()
+    
+    if ext == '.png':
+        return FAST_PNG_PARAMS
+    if ext in ('.jpg', '.jpeg'):
+        return FAST_JPEG_PARAMS
+    return []
+
+
+@dataclass
+class Matches:
+    """
+    Match candidates stored as parallel arrays, one entry per match.
+    
+    Sorting, suppression and filtering operate on whole arrays; matches are
+    converted to tuples only when returned from the public functions.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    ws: np.ndarray
+    hs: np.ndarray
+    scores: np.ndarray
+    angles: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        w: Union[int, np.ndarray],
+        h: Union[int, np.ndarray],
+        scores: np.ndarray,
+        angles: Optional[np.ndarray] = None
+    ) -> 'Matches':
+        """
+        Build matches, broadcasting a shared template size to every entry.
+        
+        Args:
+            xs: Match left edges
+            ys: Match top edges
+            w: Match widths (scalar if all matches share one size)
+            h: Match heights (scalar if all matches share one size)
+            scores: Match confidences
+            angles: Optional match rotation angles
+        
+        Returns:
+            Matches: The matches as parallel arrays
+        """
+        return cls(
+            np.asarray(xs, dtype=np.intp),
+            np.asarray(ys, dtype=np.intp),
+            np.broadcast_to(np.asarray(w, dtype=np.intp), np.shape(scores)),
+            np.broadcast_to(np.asarray(h, dtype=np.intp), np.shape(scores)),
+            np.asarray(scores, dtype=np.float32),
+            angles
+        )
+    
+    def take(self, indices: np.ndarray) -> 'Matches':
+        """
+        Select a subset of matches.
+        
+        Args:
+            indices: Indices (or boolean mask) of the matches to keep
+        
+        Returns:
+            Matches: The selected matches, in the order given
+        """
+        return Matches(
+            self.xs[indices], self.ys[indices], self.ws[indices], self.hs[indices],
+            self.scores[indices],
+            self.angles[indices] if self.angles is not None else None
+        )
+    
+    def to_list(self) -> List[Tuple]:
+        """
+        Convert to the tuple records returned by the public functions.
+        
+        Returns:
+            List[Tuple]: Matches as (x, y, w, h, confidence), with the angle
+                appended when the matches carry angles
+        """
+        records = zip(
+            self.xs.tolist(), self.ys.tolist(), self.ws.tolist(), self.hs.tolist(),
+            self.scores.tolist()
+        )
+        if self.angles is None:
+            return list(records)
+        return [record + (angle,) for record, angle in zip(records, self.angles.tolist())]
+
+
+def _empty_matches() -> Matches:
+    """
+    Create a Matches instance without any entries.
+    
+    Returns:
+        Matches: Empty matches
+    """
+    empty = np.empty(0, dtype=np.intp)
+    return Matches(empty, empty, empty, empty, np.empty(0, dtype=np.float32))
+
+
+def _nms(matches: Matches, max_results: int, relative_to_smaller: bool = False) -> Matches:
+    """
+    Greedy non-maximum suppression over candidate boxes.
+    
+    Candidates are visited best-first; each kept box suppresses all remaining
+    candidates overlapping it, computed for all candidates at once with numpy.
+    
+    Args:
+        matches: Candidate matches
+        max_results: Maximum number of boxes to keep
+        relative_to_smaller: If True, suppress when the intersection exceeds half
+            the smaller box's area; otherwise when IoU exceeds 0.5
+    
+    Returns:
+        Matches: Kept matches, best first
+    """
+    xs, ys, ws, hs = matches.xs, matches.ys, matches.ws, matches.hs
+    
+    # Sort by confidence (descending), keeping scan order for ties
+    remaining = np.argsort(-matches.scores, kind='stable')
+    keep = []
+    
+    while remaining.size and len(keep) < max_results:
+        best = remaining[0]
+        keep.append(best)
+        
+        rest = remaining[1:]
+        x, y, w, h = xs[best], ys[best], ws[best], hs[best]
+        
+        # Intersection of the kept box with every remaining candidate
+        intersection_width = np.maximum(0, np.minimum(xs[rest] + ws[rest], x + w) - np.maximum(xs[rest], x))
+        intersection_height = np.maximum(0, np.minimum(ys[rest] + hs[rest], y + h) - np.maximum(ys[rest], y))
+        intersection_area = intersection_width * intersection_height
+        
+        # Compare against half of the reference area instead of dividing
+        rest_areas = ws[rest] * hs[rest]
+        if relative_to_smaller:
+            limit = 0.5 * np.minimum(rest_areas, w * h)
+        else:
+            limit = 0.5 * (rest_areas + w * h - intersection_area)
+            
+        remaining = rest[intersection_area <= limit]
+        
+    return matches.take(np.array(keep, dtype=np.intp))
+
+
+def _coarse_to_fine_match(
+    screenshot_pyramid: Tuple[np.ndarray, ...],
+    template_pyramid: Tuple[np.ndarray, ...],
+    threshold: float,
+    method: int,
+    max_candidates: int
+) -> Matches:
+    """
+    Match a template at the coarsest pyramid level and refine each peak downwards.
+    
+    Args:
+        screenshot_pyramid: Screenshot pyramid (full resolution first)
+        template_pyramid: Template pyramid with the same number of levels
+        threshold: Matching threshold at full resolution
+        method: Normalized template matching method
+        max_candidates: Maximum number of coarse peaks to refine
+    
+    Returns:
+        Matches: Full resolution matches that reach the threshold
+    """
+    top_level = len(template_pyramid) - 1
+    coarse_template = template_pyramid[top_level]
+    
+    # Match over the whole (small) coarsest screenshot
+    result = cv2.matchTemplate(screenshot_pyramid[top_level], coarse_template, method)
+    ys, xs = np.where(result >= threshold - PYRAMID_THRESHOLD_SLACK)
+    
+    th, tw = coarse_template.shape[:2]
+    peaks = _nms(Matches.from_arrays(xs, ys, tw, th, result[ys, xs]), max_candidates)
+    
+    # Refine each peak within a small window at every finer level
+    refined = []
+    for x, y, score in zip(peaks.xs.tolist(), peaks.ys.tolist(), peaks.scores.tolist()):
+        for level in range(top_level - 1, -1, -1):
+            screenshot = screenshot_pyramid[level]
+            template = template_pyramid[level]
+            th, tw = template.shape[:2]
+            
+            x0 = max(0, 2 * x - PYRAMID_REFINE_PADDING)
+            y0 = max(0, 2 * y - PYRAMID_REFINE_PADDING)
+            x1 = min(screenshot.shape[1], 2 * x + tw + PYRAMID_REFINE_PADDING)
+            y1 = min(screenshot.shape[0], 2 * y + th + PYRAMID_REFINE_PADDING)
+            
+            window = screenshot[y0:y1, x0:x1]
+            if window.shape[0] < th or window.shape[1] < tw:
+                break
+                
+            _, score, _, location = cv2.minMaxLoc(cv2.matchTemplate(window, template, method))
+            x, y = x0 + location[0], y0 + location[1]
+        else:
+            if score >= threshold:
+                refined.append((x, y, score))
+                
+    if not refined:
+        return _empty_matches()
+        
+    xs, ys, scores = zip(*refined)
+    th, tw = template_pyramid[0].shape[:2]
+    return Matches.from_arrays(xs, ys, tw, th, scores)
+
+
+def _find_template_core(
+    screenshot_pyramid: Tuple[np.ndarray, ...],
+    template: np.ndarray,
+    threshold: float,
+    method: int,
+    max_results: int
+) -> Matches:
+    """
+    Find an already loaded template within an already loaded screenshot.
+    
+    Args:
+        screenshot_pyramid: Grayscale screenshot pyramid from _load_pyramid/_build_pyramid;
+            missing coarser levels are built on demand
+        template: Grayscale template image
+        threshold: Matching threshold (0-1, higher = more strict matching)
+        method: Template matching method to use
+        max_results: Maximum number of results to return
+    
+    Returns:
+        Matches: Found matches, best first
+    """
+    screenshot = screenshot_pyramid[0]
+    
+    # Get template dimensions
+    h, w = template.shape[:2]
+    
+    # Large templates with normalized methods are matched coarse-to-fine
+    levels = _pyramid_levels(template.shape) if method in PYRAMID_METHODS else 0
+    
+    if levels > 0:
+        if len(screenshot_pyramid) <= levels:
+            missing = levels - len(screenshot_pyramid) + 1
+            screenshot_pyramid += _build_pyramid(screenshot_pyramid[-1], missing)[1:]
+            
+        candidates = _coarse_to_fine_match(
+            screenshot_pyramid,
+            _build_pyramid(template, levels),
+            threshold,
+            method,
+            max_results * 4
+        )
+    else:
+        # Apply template matching. OpenCV's CPU matchTemplate already computes
+        # the correlation with a blockwise DFT and derives the normalized
+        # methods from integral images, so large templates need no separate
+        # frequency-domain path here (and normalized ones use the pyramid)
+        result = cv2.matchTemplate(screenshot, template, method)
+        sqdiff = method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]
+        
+        # A single best match only needs the extremum of the result map
+        if max_results == 1:
+            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+            score, (x, y) = (1.0 - min_val, min_loc) if sqdiff else (max_val, max_loc)
+            if score < threshold:
+                return _empty_matches()
+            return Matches.from_arrays([x], [y], w, h, [score])
+        
+        # Different handling based on the method
+        if sqdiff:
+            # For these methods, smaller values indicate better matches
+            ys, xs = np.where(result <= 1.0 - threshold)
+            scores = 1.0 - result[ys, xs]
+        else:
+            # For other methods, larger values indicate better matches
+            ys, xs = np.where(result >= threshold)
+            scores = result[ys, xs]
+            
+        candidates = Matches.from_arrays(xs, ys, w, h, scores)
+        
+        # For few results, try NMS on a small pool of the best candidates first.
+        # Greedy NMS visits candidates best-first, so if the pool already yields
+        # max_results matches they are exactly what the full candidate set gives
+        pool_size = max_results * 4
+        if max_results <= TOP_K_MAX_RESULTS and len(candidates) > pool_size:
+            pool = np.sort(np.argpartition(-candidates.scores, pool_size)[:pool_size])
+            results = _nms(candidates.take(pool), max_results)
+            
+            if len(results) == max_results:
+                return results
+    
+    # Extract top non-overlapping matches up to max_results
+    return _nms(candidates, max_results)
+
+
+def _load_screenshot_pyramid(screenshot_path: str, levels: int = 0) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Load a screenshot pyramid through the (path, mtime) keyed cache.
+    
+    Args:
+        screenshot_path: Path to the screenshot image
+        levels: Number of downsampled levels to build
+    
+    Returns:
+        Optional[Tuple[np.ndarray, ...]]: Screenshot pyramid or None if loading fails
+    """
+    if not os.path.exists(screenshot_path):
+        logger.error(f"Image file not found: {screenshot_path}")
+        return None
+        
+    return _load_pyramid(screenshot_path, os.path.getmtime(screenshot_path), levels)
+
+
+def _required_levels(templates: List[Optional[np.ndarray]], method: int) -> int:
+    """
+    Deepest pyramid level any of the given templates will be matched at.
+    
+    Args:
+        templates: Loaded templates (None entries are ignored)
+        method: Template matching method
+    
+    Returns:
+        int: Number of screenshot pyramid levels to prebuild
+    """
+    if method not in PYRAMID_METHODS:
+        return 0
+        
+    return max((_pyramid_levels(t.shape) for t in templates if t is not None), default=0)
+
 
 def find_template(
     screenshot_path: str,
@@ -40,80 +474,17 @@ def find_template(
     """
     try:
         # Load images
-        screenshot = img_proc.load_image(screenshot_path)
-        template = img_proc.load_image(template_path)
+        template = img_proc.load_image_gray(template_path)
+        screenshot_pyramid = (
+            _load_screenshot_pyramid(screenshot_path, _required_levels([template], method))
+            if template is not None else None
+        )
         
-        if screenshot is None or template is None:
+        if screenshot_pyramid is None or template is None:
             logger.error("Failed to load screenshot or template image")
             return []
         
-        # Get template dimensions
-        h, w = template.shape[:2]
-        
-        # Convert to grayscale if they have different channels
-        if len(screenshot.shape) != len(template.shape):
-            logger.debug("Converting images to grayscale for matching")
-            screenshot = img_proc.convert_to_grayscale(screenshot)
-            template = img_proc.convert_to_grayscale(template)
-        
-        # Apply template matching
-        result = cv2.matchTemplate(screenshot, template, method)
-        
-        # Find locations where matching exceeds the threshold
-        locations = []
-        
-        # Different handling based on the method
-        if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
-            # For these methods, smaller values indicate better matches
-            matches = np.where(result <= 1.0 - threshold)
-            scores = 1.0 - result[matches[0], matches[1]]
-        else:
-            # For other methods, larger values indicate better matches
-            matches = np.where(result >= threshold)
-            scores = result[matches[0], matches[1]]
-        
-        # Convert to list of (y, x, score) and sort by score
-        match_list = []
-        for i in range(len(matches[0])):
-            match_list.append((matches[0][i], matches[1][i], scores[i]))
-        
-        # Sort by confidence (descending)
-        match_list.sort(key=lambda x: x[2], reverse=True)
-        
-        # Extract top matches up to max_results
-        results = []
-        
-        for i, (y, x, score) in enumerate(match_list):
-            if i >= max_results:
-                break
-                
-            # Check if this match overlaps with any previous match
-            overlapping = False
-            for rx, ry, rw, rh, _ in results:
-                # Calculate IoU (Intersection over Union)
-                x1_min, y1_min = x, y
-                x1_max, y1_max = x + w, y + h
-                x2_min, y2_min = rx, ry
-                x2_max, y2_max = rx + rw, ry + rh
-                
-                # Calculate intersection area
-                intersection_width = max(0, min(x1_max, x2_max) - max(x1_min, x2_min))
-                intersection_height = max(0, min(y1_max, y2_max) - max(y1_min, y2_min))
-                intersection_area = intersection_width * intersection_height
-                
-                # Calculate union area
-                union_area = (w * h) + (rw * rh) - intersection_area
-                
-                # Calculate IoU
-                iou = intersection_area / union_area if union_area > 0 else 0
-                
-                # Check if IoU exceeds threshold (e.g., 0.5)
-                if iou > 0.5:
-                    overlapping = True
-                    break
-            
-            if not overlapping:
-                results.append((x, y, w, h, float(score)))
+        results = _find_template_core(screenshot_pyramid, template, threshold, method, max_results).to_list()
         
         logger.info(f"Found {len(results)} matches for template {os.path.basename(template_path)}")
         return results
@@ -132,6 +503,10 @@ def find_multiple_templates(
     """
     Find multiple templates in a single screenshot.
     
+    The screenshot (and its pyramid) is loaded once and shared by all templates.
+    Per-window screenshot sums used for normalization depend on each template's
+    size, so they are left to matchTemplate's internal integral images.
+    
     Args:
         screenshot_path: Path to the screenshot image
         template_paths: List of paths to template images
@@ -145,14 +520,33 @@ def find_multiple_templates(
     try:
         results = {}
         
-        for template_path in template_paths:
-            template_results = find_template(
-                screenshot_path, 
-                template_path, 
-                threshold, 
-                method
-            )
-            
+        templates = {path: img_proc.load_image_gray(path) for path in template_paths}
+        screenshot_pyramid = _load_screenshot_pyramid(
+            screenshot_path, _required_levels(list(templates.values()), method)
+        )
+        
+        if screenshot_pyramid is None:
+            logger.error(f"Failed to load screenshot: {screenshot_path}")
+            return {template_path: [] for template_path in template_paths}
+        
+        def match(template_path: str, template: Optional[np.ndarray]) -> List[Tuple[int, int, int, int, float]]:
+            if template is None:
+                return []
+            try:
+                return _find_template_core(screenshot_pyramid, template, threshold, method, 5).to_list()
+            except Exception as e:
+                logger.error(f"Error matching template {template_path}: {str(e)}")
+                return []
+        
+        # matchTemplate releases the GIL, so templates are matched concurrently
+        with ThreadPoolExecutor(max_workers=MATCH_WORKERS) as executor:
+            matched = list(executor.map(match, templates.keys(), templates.values()))
+        
+        for (template_path, template), template_results in zip(templates.items(), matched):
+            if template is None:
+                logger.error(f"Failed to load template image: {template_path}")
+            else:
+                logger.info(f"Found {len(template_results)} matches for template {os.path.basename(template_path)}")
             results[template_path] = template_results
         
         return results
@@ -213,16 +607,21 @@ def visualize_template_matches(
     screenshot_path: str,
     template_path: str,
     matches: List[Tuple[int, int, int, int, float]],
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    fast_io: bool = True
 ) -> str:
     """
     Visualize template matches on the screenshot.
     
+    The screenshot is loaded uncached and annotated in place, so no copy of
+    the full frame is made; the file on disk is never modified.
+    
     Args:
         screenshot_path: Path to the screenshot image
         template_path: Path to the template image
         matches: List of match tuples (x, y, w, h, confidence)
         output_path: Path to save the visualization (optional)
+        fast_io: Use fast, lightly compressed encoding (PNG level 1 / JPEG quality 85)
     
     Returns:
         str: Path to the saved visualization image
@@ -235,8 +634,8 @@ def visualize_template_matches(
             logger.error(f"Failed to load screenshot: {screenshot_path}")
             return ""
         
-        # Create a copy for visualization
-        vis_image = screenshot.copy()
+        # Draw directly on the freshly loaded image; nothing else references it
+        vis_image = screenshot
         
         # Generate default output path if not provided
         if output_path is None:
@@ -248,22 +647,18 @@ def visualize_template_matches(
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Draw rectangles for each match
-        for i, (x, y, w, h, confidence) in enumerate(matches):
-            # Draw the rectangle
-            color = (0, 255, 0)  # Green
-            thickness = 2
+        # Drawing style shared by all matches
+        color = (0, 255, 0)  # Green
+        thickness = 2
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # Draw rectangles for each match, labelled with its confidence
+        for x, y, w, h, confidence in matches:
             cv2.rectangle(vis_image, (x, y), (x + w, y + h), color, thickness)
-            
-            # Add text with confidence
-            text = f"{confidence:.2f}"
-            cv2.putText(
-                vis_image, text, (x, y - 10),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, thickness
-            )
+            cv2.putText(vis_image, f"{confidence:.2f}", (x, y - 10), font, 0.7, color, thickness)
         
         # Save the visualization
-        cv2.imwrite(output_path, vis_image)
+        cv2.imwrite(output_path, vis_image, _write_params(output_path, fast_io))
         
         logger.info(f"Template match visualization saved to {output_path}")
         return output_path
@@ -277,7 +672,8 @@ def create_element_template(
     screenshot_path: str,
     region: Tuple[int, int, int, int],
     output_dir: str = "templates",
-    template_name: Optional[str] = None
+    template_name: Optional[str] = None,
+    fast_io: bool = True
 ) -> str:
     """
     Create a template image from a region of a screenshot.
@@ -287,6 +683,7 @@ def create_element_template(
         region: Region to extract as (x, y, width, height)
         output_dir: Directory to save the template
         template_name: Name for the template file (optional)
+        fast_io: Use fast, lightly compressed encoding (PNG level 1 / JPEG quality 85)
     
     Returns:
         str: Path to the saved template image
@@ -316,7 +713,7 @@ def create_element_template(
         
         # Save the template
         output_path = os.path.join(output_dir, template_name)
-        cv2.imwrite(output_path, template)
+        cv2.imwrite(output_path, template, _write_params(output_path, fast_io))
         
         logger.info(f"Created template from region ({x}, {y}, {width}, {height}) and saved to {output_path}")
         return output_path
@@ -334,6 +731,8 @@ def find_in_multiple_screenshots(
     """
     Find a template in multiple screenshots.
     
+    The template is loaded once and reused for every screenshot.
+    
     Args:
         template_path: Path to the template image
         screenshot_paths: List of paths to screenshot images
@@ -346,14 +745,37 @@ def find_in_multiple_screenshots(
     try:
         results = {}
         
-        for screenshot_path in screenshot_paths:
-            matches = find_template(
-                screenshot_path,
-                template_path,
-                threshold=threshold
-            )
-            
-            results[screenshot_path] = matches
+        template = img_proc.load_image_gray(template_path)
+        
+        if template is None:
+            logger.error(f"Failed to load template image: {template_path}")
+            return {screenshot_path: [] for screenshot_path in screenshot_paths}
+        
+        levels = _required_levels([template], cv2.TM_CCOEFF_NORMED)
+        
+        def match(screenshot_path: str) -> List[Tuple[int, int, int, int, float]]:
+            try:
+                screenshot_pyramid = _load_screenshot_pyramid(screenshot_path, levels)
+                
+                if screenshot_pyramid is None:
+                    logger.error(f"Failed to load screenshot: {screenshot_path}")
+                    return []
+                    
+                return _find_template_core(
+                    screenshot_pyramid,
+                    template,
+                    threshold,
+                    cv2.TM_CCOEFF_NORMED,
+                    5
+                ).to_list()
+            except Exception as e:
+                logger.error(f"Error matching template in screenshot {screenshot_path}: {str(e)}")
+                return []
+        
+        # Decoding and matchTemplate release the GIL, so screenshots are processed concurrently
+        with ThreadPoolExecutor(max_workers=MATCH_WORKERS) as executor:
+            for screenshot_path, matches in zip(screenshot_paths, executor.map(match, screenshot_paths)):
+                results[screenshot_path] = matches
         
         return results
         
@@ -365,15 +787,21 @@ def find_in_multiple_screenshots(
 def find_best_template_match(
     screenshot_path: str,
     template_paths: List[str],
-    threshold: float = 0.8
+    threshold: float = 0.8,
+    sufficient_confidence: Optional[float] = 0.95
 ) -> Tuple[Optional[str], Optional[Tuple[int, int, int, int, float]]]:
     """
     Find which template best matches the screenshot.
     
+    Templates that won previous searches are tried first, and the search stops
+    as soon as a match reaches sufficient_confidence.
+    
     Args:
         screenshot_path: Path to the screenshot image
         template_paths: List of paths to template images
         threshold: Matching threshold
+        sufficient_confidence: Confidence at which a match is accepted without
+            trying the remaining templates (None to always try every template)
     
     Returns:
         Tuple[Optional[str], Optional[Tuple[int, int, int, int, float]]]: 
@@ -384,20 +812,41 @@ def find_best_template_match(
         best_match = None
         best_confidence = 0.0
         
-        for template_path in template_paths:
-            matches = find_template(
-                screenshot_path,
-                template_path,
-                threshold=threshold,
-                max_results=1
+        # Most frequently winning templates first (stable for ties)
+        ordered_paths = sorted(template_paths, key=lambda path: -_best_match_counts.get(path, 0))
+        
+        templates = {path: img_proc.load_image_gray(path) for path in ordered_paths}
+        screenshot_pyramid = _load_screenshot_pyramid(
+            screenshot_path, _required_levels(list(templates.values()), cv2.TM_CCOEFF_NORMED)
+        )
+        
+        if screenshot_pyramid is None:
+            logger.error(f"Failed to load screenshot: {screenshot_path}")
+            return None, None
+        
+        for template_path, template in templates.items():
+            if template is None:
+                logger.error(f"Failed to load template image: {template_path}")
+                continue
+                
+            matches = _find_template_core(
+                screenshot_pyramid,
+                template,
+                threshold,
+                cv2.TM_CCOEFF_NORMED,
+                1
             )
             
-            if matches and matches[0][4] > best_confidence:
-                best_confidence = matches[0][4]
-                best_match = matches[0]
+            if len(matches) and matches.scores[0] > best_confidence:
+                best_match = matches.to_list()[0]
+                best_confidence = best_match[4]
                 best_template = template_path
+                
+                if sufficient_confidence is not None and best_confidence >= sufficient_confidence:
+                    break
         
         if best_template:
+            _best_match_counts[best_template] = _best_match_counts.get(best_template, 0) + 1
             logger.info(f"Best template match: {os.path.basename(best_template)} with confidence {best_confidence:.4f}")
         else:
             logger.warning("No template matched above the threshold")
@@ -428,39 +877,106 @@ def find_similar_regions(
         List[Tuple[int, int, int, int, float]]: Similar regions as (x, y, w, h, similarity)
     """
     try:
-        # Create a temporary template from the region
-        temp_template_path = create_element_template(
-            screenshot_path,
-            region,
-            output_dir="temp_templates",
-            template_name=f"temp_template_{int(time.time())}.png"
-        )
+        # Use the region itself (an in-memory view of the screenshot) as the template
+        x, y, width, height = region
+        levels = _pyramid_levels((height, width))
+        screenshot_pyramid = _load_screenshot_pyramid(screenshot_path, levels)
         
-        if not temp_template_path:
-            logger.error("Failed to create temporary template from region")
+        if screenshot_pyramid is None:
+            logger.error(f"Failed to load screenshot: {screenshot_path}")
             return []
         
-        # Find similar regions using the temporary template
-        similar_regions = find_template(
-            screenshot_path,
-            temp_template_path,
-            threshold=threshold,
-            max_results=max_results
-        )
+        template = screenshot_pyramid[0][y:y+height, x:x+width]
         
-        # Clean up temporary template
-        try:
-            os.remove(temp_template_path)
-        except Exception as e:
-            logger.warning(f"Failed to remove temporary template: {str(e)}")
+        if template.size == 0:
+            logger.error(f"Region {region} lies outside the screenshot")
+            return []
         
-        return similar_regions
+        # Find similar regions using the region template
+        return _find_template_core(
+            screenshot_pyramid,
+            template,
+            threshold,
+            cv2.TM_CCOEFF_NORMED,
+            max_results
+        ).to_list()
         
     except Exception as e:
         logger.error(f"Error finding similar regions: {str(e)}")
         return []
 
 
+@lru_cache(maxsize=64)
+def _rotated_template_set(
+    template_path: str,
+    mtime: float,
+    angle_range: Tuple[float, float],
+    angle_step: float
+) -> Tuple[Tuple[np.ndarray, Optional[np.ndarray], int, int, float], ...]:
+    """
+    Load a template and rotate it to every angle in a range, cached per template file.
+    
+    Args:
+        template_path: Path to the template image
+        mtime: Modification time of the template (part of the cache key)
+        angle_range: Range of angles to rotate to (min, max)
+        angle_step: Angle increment between rotations
+    
+    Returns:
+        Tuple: (rotated_template, mask, width, height, angle) for each distinct
+            angle, or an empty tuple if the template cannot be loaded. The mask
+            marks pixels that came from the template (None when unrotated)
+    """
+    gray_template = img_proc.load_image_gray(template_path)
+    
+    if gray_template is None:
+        return ()
+    
+    # Get template dimensions
+    h, w = gray_template.shape
+    
+    rotated_set = []
+    angles = np.arange(angle_range[0], angle_range[1] + angle_step, angle_step)
+    
+    for angle in dict.fromkeys(float(a) for a in angles):
+        # The unrotated template needs no warp
+        if angle == 0:
+            rotated_set.append((gray_template, None, w, h, angle))
+            continue
+            
+        # Get rotation matrix
+        center = (w // 2, h // 2)
+        rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        
+        # Calculate new dimensions
+        cos = np.abs(rotation_matrix[0, 0])
+        sin = np.abs(rotation_matrix[0, 1])
+        new_w = int((h * sin) + (w * cos))
+        new_h = int((h * cos) + (w * sin))
+        
+        # Adjust rotation matrix
+        rotation_matrix[0, 2] += (new_w / 2) - center[0]
+        rotation_matrix[1, 2] += (new_h / 2) - center[1]
+        
+        # Rotate the template
+        rotated_template = cv2.warpAffine(
+            gray_template, rotation_matrix, (new_w, new_h),
+            flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT,
+            borderValue=255
+        )
+        
+        # Mask out the constant fill around the rotated template so it does
+        # not take part in the correlation
+        mask = cv2.warpAffine(
+            np.full_like(gray_template, 255), rotation_matrix, (new_w, new_h),
+            flags=cv2.INTER_NEAREST, borderMode=cv2.BORDER_CONSTANT,
+            borderValue=0
+        )
+        rotated_set.append((rotated_template, mask, new_w, new_h, angle))
+        
+    return tuple(rotated_set)
+
+
 def match_rotated_template(
     screenshot_path: str,
     template_path: str,
@@ -483,101 +999,52 @@ def match_rotated_template(
             Matches as (x, y, w, h, confidence, angle)
     """
     try:
-        import time
-        
-        # Load images
-        screenshot = img_proc.load_image(screenshot_path)
-        template = img_proc.load_image(template_path)
+        # Load images directly as grayscale
+        gray_screenshot = img_proc.load_image_gray(screenshot_path)
+        rotated_set = (
+            _rotated_template_set(
+                template_path, os.path.getmtime(template_path),
+                tuple(angle_range), angle_step
+            )
+            if os.path.exists(template_path) else None
+        )
         
-        if screenshot is None or template is None:
+        if gray_screenshot is None or not rotated_set:
             logger.error("Failed to load screenshot or template image")
             return []
         
-        # Convert to grayscale
-        gray_screenshot = img_proc.convert_to_grayscale(screenshot)
-        gray_template = img_proc.convert_to_grayscale(template)
-        
-        # Get template dimensions
-        h, w = gray_template.shape
-        
-        # Check angles
-        best_matches = []
-        
-        for angle in np.arange(angle_range[0], angle_range[1] + angle_step, angle_step):
-            # Skip angle 0 if it's been checked before
-            if angle == 0 and len(best_matches) > 0:
-                continue
-                
-            # Rotate template
-            if angle != 0:
-                # Get rotation matrix
-                center = (w // 2, h // 2)
-                rotation_matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
-                
-                # Calculate new dimensions
-                cos = np.abs(rotation_matrix[0, 0])
-                sin = np.abs(rotation_matrix[0, 1])
-                new_w = int((h * sin) + (w * cos))
-                new_h = int((h * cos) + (w * sin))
-                
-                # Adjust rotation matrix
-                rotation_matrix[0, 2] += (new_w / 2) - center[0]
-                rotation_matrix[1, 2] += (new_h / 2) - center[1]
-                
-                # Rotate the template
-                rotated_template = cv2.warpAffine(
-                    gray_template, rotation_matrix, (new_w, new_h),
-                    flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT,
-                    borderValue=255
-                )
-            else:
-                rotated_template = gray_template
-                new_w, new_h = w, h
+        def match_angle(rotation: Tuple[np.ndarray, Optional[np.ndarray], int, int, float]) -> Matches:
+            rotated_template, mask, w, h, angle = rotation
             
-            # Match the rotated template
-            result = cv2.matchTemplate(gray_screenshot, rotated_template, cv2.TM_CCOEFF_NORMED)
-            matches = np.where(result >= threshold)
-            
-            # Process matches
-            for y, x in zip(matches[0], matches[1]):
-                confidence = result[y, x]
+            # Match the rotated template, ignoring the border outside its mask
+            if mask is None:
+                result = cv2.matchTemplate(gray_screenshot, rotated_template, cv2.TM_CCOEFF_NORMED)
+            else:
+                result = cv2.matchTemplate(gray_screenshot, rotated_template, cv2.TM_CCOEFF_NORMED, mask=mask)
+                # Masked normalization divides by zero on flat screenshot areas
+                np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
                 
-                # Add to matches with angle info
-                best_matches.append((x, y, new_w, new_h, float(confidence), angle))
+            ys, xs = np.where(result >= threshold)
+            scores = result[ys, xs]
+            return Matches.from_arrays(xs, ys, w, h, scores, np.full(scores.shape, angle))
         
-        # Sort by confidence (descending)
-        best_matches.sort(key=lambda x: x[4], reverse=True)
+        # Each angle is independent and matchTemplate releases the GIL
+        with ThreadPoolExecutor(max_workers=MATCH_WORKERS) as executor:
+            per_angle = list(executor.map(match_angle, rotated_set))
         
-        # Filter overlapping matches
-        filtered_matches = []
-        for match in best_matches:
-            x1, y1, w1, h1 = match[0], match[1], match[2], match[3]
-            
-            # Check if this match overlaps with any better match
-            overlapping = False
-            for fm in filtered_matches:
-                x2, y2, w2, h2 = fm[0], fm[1], fm[2], fm[3]
-                
-                # Calculate overlap
-                overlap_x = max(0, min(x1 + w1, x2 + w2) - max(x1, x2))
-                overlap_y = max(0, min(y1 + h1, y2 + h2) - max(y1, y2))
-                overlap_area = overlap_x * overlap_y
-                
-                # Calculate areas
-                area1 = w1 * h1
-                area2 = w2 * h2
-                
-                # Check if there's significant overlap
-                if overlap_area > 0.5 * min(area1, area2):
-                    overlapping = True
-                    break
-            
-            if not overlapping:
-                filtered_matches.append(match)
-                
-                # Limit number of results
-                if len(filtered_matches) >= 5:
-                    break
+        # Concatenate candidates from all angles into flat arrays
+        candidates = Matches(
+            np.concatenate([m.xs for m in per_angle]),
+            np.concatenate([m.ys for m in per_angle]),
+            np.concatenate([m.ws for m in per_angle]),
+            np.concatenate([m.hs for m in per_angle]),
+            np.concatenate([m.scores for m in per_angle]),
+            np.concatenate([m.angles for m in per_angle])
+        )
+        
+        # Filter overlapping matches: a kept match suppresses candidates that
+        # overlap more than half of the smaller of the two boxes
+        filtered_matches = _nms(candidates, 5, relative_to_smaller=True).to_list()
         
         logger.info(f"Found {len(filtered_matches)} rotated matches for template {os.path.basename(template_path)}")
         return filtered_matches
@@ -15,6 +15,7 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -23,9 +24,23 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
 from src.utils.logger import get_logger
+from src.utils.helper_functions import WAIT_POLL_FREQUENCY
 
 logger = get_logger()
 
+# Driver executable paths resolved by webdriver-manager, reused across sessions
+_chromedriver_path: Optional[str] = None
+_geckodriver_path: Optional[str] = None
+
+# Selenium locator strategies keyed by their By attribute name (e.g. "XPATH")
+BY_METHODS = {
+    name: getattr(By, name)
+    for name in (
+        "ID", "CSS_SELECTOR", "XPATH", "NAME", "CLASS_NAME",
+        "TAG_NAME", "LINK_TEXT", "PARTIAL_LINK_TEXT"
+    )
+}
+
 
 def initialize_browser(browser_config: Dict[str, Any]) -> WebDriver:
     """
@@ -66,10 +81,16 @@ def _setup_chrome_browser(headless: bool) -> WebDriver:
     Returns:
         WebDriver: Configured Chrome WebDriver
     """
+    global _chromedriver_path
+    
     options = ChromeOptions()
     
     if headless:
-        options.add_argument("--headless")
+        options.add_argument("--headless=new")
+    
+    # Return from navigation at DOMContentLoaded instead of waiting for every
+    # third-party sub-resource; callers wait explicitly for what they need
+    options.page_load_strategy = 'eager'
     
     # Common options for better automation
     options.add_argument("--no-sandbox")
@@ -82,13 +103,16 @@ def _setup_chrome_browser(headless: bool) -> WebDriver:
     # Set user agent to avoid detection
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
     
-    # Use webdriver-manager to automatically download and manage ChromeDriver
-    service = ChromeService(ChromeDriverManager().install())
+    # Use webdriver-manager to automatically download and manage ChromeDriver;
+    # resolve it only once per process since install() checks versions remotely
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    service = ChromeService(_chromedriver_path)
     
     driver = webdriver.Chrome(service=service, options=options)
     
-    # Set default timeout
-    driver.implicitly_wait(10)
+    # No implicit wait: explicit WebDriverWaits are used instead, and an
+    # implicit wait would stall every negative find_elements probe
     
     logger.info("Chrome browser initialized successfully")
     return driver
@@ -104,6 +128,8 @@ def _setup_firefox_browser(headless: bool) -> WebDriver:
     Returns:
         WebDriver: Configured Firefox WebDriver
     """
+    global _geckodriver_path
+    
     options = FirefoxOptions()
     
     if headless:
@@ -119,13 +145,16 @@ def _setup_firefox_browser(headless: bool) -> WebDriver:
     options.set_preference("general.useragent.override", 
                           "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:88.0) Gecko/20100101 Firefox/88.0")
     
-    # Use webdriver-manager to automatically download and manage GeckoDriver
-    service = FirefoxService(GeckoDriverManager().install())
+    # Use webdriver-manager to automatically download and manage GeckoDriver;
+    # resolve it only once per process since install() checks versions remotely
+    if _geckodriver_path is None:
+        _geckodriver_path = GeckoDriverManager().install()
+    service = FirefoxService(_geckodriver_path)
     
     driver = webdriver.Firefox(service=service, options=options)
     
-    # Set default timeout
-    driver.implicitly_wait(10)
+    # No implicit wait: explicit WebDriverWaits are used instead, and an
+    # implicit wait would stall every negative find_elements probe
     
     logger.info("Firefox browser initialized successfully")
     return driver
@@ -182,11 +211,9 @@ def wait_for_element(driver: WebDriver, by_method: str, selector: str, timeout:
     Returns:
         bool: True if element was found, False otherwise
     """
-    from selenium.webdriver.common.by import By
-    
     try:
-        by_class = getattr(By, by_method.upper())
-        WebDriverWait(driver, timeout).until(
+        by_class = BY_METHODS[by_method.upper()]
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.presence_of_element_located((by_class, selector))
         )
         return True
@@ -210,10 +237,8 @@ def is_element_present(driver: WebDriver, by_method: str, selector: str) -> bool
     Returns:
         bool: True if element is present, False otherwise
     """
-    from selenium.webdriver.common.by import By
-    
     try:
-        by_class = getattr(By, by_method.upper())
+        by_class = BY_METHODS[by_method.upper()]
         return len(driver.find_elements(by_class, selector)) > 0
     except Exception as e:
         logger.error(f"Error checking if element is present: {str(e)}")
@@ -233,11 +258,9 @@ def safe_click(driver: WebDriver, by_method: str, selector: str, timeout: int =
     Returns:
         bool: True if click was successful, False otherwise
     """
-    from selenium.webdriver.common.by import By
-    
     try:
-        by_class = getattr(By, by_method.upper())
-        element = WebDriverWait(driver, timeout).until(
+        by_class = BY_METHODS[by_method.upper()]
+        element = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.element_to_be_clickable((by_class, selector))
         )
         element.click()
@@ -263,11 +286,9 @@ def safe_send_keys(driver: WebDriver, by_method: str, selector: str, text: str,
     Returns:
         bool: True if operation was successful, False otherwise
     """
-    from selenium.webdriver.common.by import By
-    
     try:
-        by_class = getattr(By, by_method.upper())
-        element = WebDriverWait(driver, timeout).until(
+        by_class = BY_METHODS[by_method.upper()]
+        element = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
             EC.element_to_be_clickable((by_class, selector))
         )
         
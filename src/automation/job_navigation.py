@@ -5,18 +5,23 @@ This module handles navigating and filtering job listings on Naukri.com.
 It provides functions for searching jobs, applying filters, and navigating through listings.
 """
 
+import re
 import time
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.keys import Keys
 
 from src.utils.logger import get_logger
-from src.automation.browser_automation import safe_click, safe_send_keys, is_element_present, wait_for_element
+from src.automation.browser_automation import (
+    safe_click, safe_send_keys, is_element_present, wait_for_element, WAIT_POLL_FREQUENCY
+)
 
 logger = get_logger()
 
@@ -24,7 +29,9 @@ logger = get_logger()
 JOB_SEARCH_URL = "https://www.naukri.com/jobs-in-india"
 RECOMMENDED_JOBS_URL = "https://www.naukri.com/recommended-jobs"
 
-# Element selectors for job navigation
+# Element selectors for job navigation. CSS attribute-substring selectors are
+# used wherever no text match is needed, as browsers evaluate them natively
+# and much faster than XPath contains() expressions
 JOB_NAV_SELECTORS = {
     "search_box": {
         "by": "ID",
@@ -35,35 +42,370 @@ JOB_NAV_SELECTORS = {
         "selector": "//button[contains(@class, 'search-btn') or contains(text(), 'Search')]"
     },
     "location_filter": {
-        "by": "XPATH",
-        "selector": "//input[contains(@placeholder, 'Location') or contains(@placeholder, 'location')]"
+        "by": "CSS_SELECTOR",
+        "selector": "input[placeholder*='Location'], input[placeholder*='location']"
     },
     "experience_filter": {
-        "by": "XPATH",
-        "selector": "//input[contains(@placeholder, 'Experience') or contains(@placeholder, 'experience')]"
+        "by": "CSS_SELECTOR",
+        "selector": "input[placeholder*='Experience'], input[placeholder*='experience']"
     },
     "job_listings": {
-        "by": "XPATH",
-        "selector": "//article[contains(@class, 'job-card') or contains(@class, 'jobTuple')]"
+        "by": "CSS_SELECTOR",
+        "selector": "article[class*='job-card'], article[class*='jobTuple']"
+    },
+    "listing_titles": {
+        "by": "CSS_SELECTOR",
+        "selector": "article[class*='job-card'] a[class*='title'], article[class*='jobTuple'] a[class*='title']"
     },
     "next_page": {
-        "by": "XPATH",
-        "selector": "//a[contains(@class, 'next') or contains(@class, 'pagination-next')]"
+        "by": "CSS_SELECTOR",
+        "selector": "a[class*='next']"
     },
     "job_title": {
-        "by": "XPATH",
-        "selector": "//a[contains(@class, 'title') or contains(@class, 'job-title')]"
+        "by": "CSS_SELECTOR",
+        "selector": "a[class*='title']"
+    },
+    # Link used to open a job card. A union of title links with any link
+    # resolves to the card's first link, so no title classes are tested
+    "job_card_link": {
+        "by": "CSS_SELECTOR",
+        "selector": "a"
     },
     "apply_button": {
         "by": "XPATH",
-        "selector": "//button[contains(text(), 'Apply') or contains(@class, 'apply')]"
+        "selector": "//button[(contains(text(), 'Apply') or contains(@class, 'apply')) and not(@disabled) and not(@hidden)]"
     },
     "job_details": {
+        "by": "CSS_SELECTOR",
+        "selector": "div[class*='job-desc'], div[class*='description']"
+    },
+    # What the apply button opens: the in-page application form, drawer or
+    # dialog, or the confirmation of a one-click application
+    "application_form": {
+        "by": "CSS_SELECTOR",
+        "selector": "[role='dialog'], div[class*='chatbot'], div[class*='apply-form'], "
+                    "div[class*='applyForm'], div[class*='apply-message'], span[class*='applied']"
+    },
+    # Fallbacks used when the primary selectors above find nothing
+    "alternative_job_listings": {
+        "by": "CSS_SELECTOR",
+        "selector": "div[class*='jobTuple'], div[class*='job-card'], "
+                    "article[class*='job'], div[class*='job-container']"
+    },
+    "active_job": {
+        "by": "CSS_SELECTOR",
+        "selector": "article[class*='active'], article[class*='selected'], "
+                    "div[class*='active'], div[class*='selected']"
+    },
+    "alternative_location_filter": {
+        "by": "CSS_SELECTOR",
+        "selector": "input[placeholder*='Location'], input[placeholder*='City'], "
+                    "input[id*='location'], input[class*='location']"
+    },
+    "experience_dropdown": {
+        "by": "XPATH",
+        "selector": "//div[contains(text(), 'Experience') or contains(@class, 'experience')]"
+    },
+    # Fields of an open job details page
+    "details_title": {
+        "by": "CSS_SELECTOR",
+        "selector": "h1[class*='title'], div[class*='title'], h1"
+    },
+    "details_company": {
+        "by": "CSS_SELECTOR",
+        "selector": "a[class*='company'], a[class*='org'], div[class*='company']"
+    },
+    "details_company_label": {
+        "by": "XPATH",
+        "selector": "//div[contains(text(), 'Company:')]/following-sibling::*"
+    },
+    "details_location": {
+        "by": "CSS_SELECTOR",
+        "selector": "[class*='location'], [class*='loc']"
+    },
+    "details_location_label": {
         "by": "XPATH",
-        "selector": "//div[contains(@class, 'job-desc') or contains(@class, 'description')]"
+        "selector": "//*[contains(text(), 'Location:')]/following-sibling::*"
+    },
+    "details_experience": {
+        "by": "XPATH",
+        "selector": "//*[contains(text(), 'Year') or contains(text(), 'Experience')]/parent::* | "
+                    "//*[contains(text(), 'Experience:')]/following-sibling::*"
+    },
+    "details_description": {
+        "by": "CSS_SELECTOR",
+        "selector": "[class*='job-desc'], [class*='description'], [id*='job-desc']"
     }
 }
 
+# Job details fields and the selectors they are read from, together forming a
+# union; text-labelled siblings are only reachable through XPath
+_DETAIL_FIELDS = (
+    ("title", ("details_title",)),
+    ("company", ("details_company", "details_company_label")),
+    ("location", ("details_location", "details_location_label")),
+    ("experience", ("details_experience",)),
+    ("description", ("details_description",)),
+)
+
+# For each list of (By strategy, selector) pairs in arguments[0], returns the
+# trimmed text of the element matched by any pair that comes first in
+# document order, like the first match of their union, or null where nothing
+# matches
+_FIRST_MATCH_TEXTS_JS = """
+    return arguments[0].map(function (locators) {
+        var first = null;
+        for (var i = 0; i < locators.length; i++) {
+            var element = locators[i][0] === 'xpath'
+                ? document.evaluate(locators[i][1], document, null,
+                                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : document.querySelector(locators[i][1]);
+            if (element && (first === null ||
+                            element.compareDocumentPosition(first) & Node.DOCUMENT_POSITION_FOLLOWING)) {
+                first = element;
+            }
+        }
+        return first === null ? null : first.innerText.trim();
+    });
+"""
+
+# Experience strings such as "3-5 years", "3+ years" or "3 yrs"
+_EXPERIENCE_RE = re.compile(r'(\d+)\s*(?:-\s*(\d+)|(\+))?\s*(?:years?|yrs?)?')
+
+# Clicks the first visible, enabled button that looks like an apply button and
+# returns whether one was found
+_CLICK_APPLY_JS = """
+    var buttons = document.querySelectorAll('button');
+    for (var i = 0; i < buttons.length; i++) {
+        var button = buttons[i];
+        var isApply = button.textContent.toLowerCase().includes('apply') ||
+                      button.className.toString().includes('apply');
+        if (isApply && !button.disabled && button.getClientRects().length > 0) {
+            button.click();
+            return true;
+        }
+    }
+    return false;
+"""
+
+# Returns the links and labels whose own text contains both arguments[0] and
+# arguments[1] (the minimum and maximum years of an experience option)
+_FIND_EXPERIENCE_OPTIONS_JS = """
+    var minYears = arguments[0], maxYears = arguments[1];
+    return Array.prototype.filter.call(document.querySelectorAll('a, label'), function (option) {
+        var text = '';
+        for (var i = 0; i < option.childNodes.length; i++) {
+            if (option.childNodes[i].nodeType === Node.TEXT_NODE) {
+                text += option.childNodes[i].nodeValue;
+            }
+        }
+        return text.includes(minYears) && text.includes(maxYears);
+    });
+"""
+
+# Selectors resolved once into (By strategy, selector) locator tuples
+_RESOLVED_SELECTORS = {
+    key: (getattr(By, value["by"]), value["selector"])
+    for key, value in JOB_NAV_SELECTORS.items()
+}
+
+# Extracts title, url, company, location, experience and description from the
+# job card elements passed as arguments[0], mirroring the per-card XPaths
+_EXTRACT_JOB_CARDS_JS = """
+    function textOf(card, selector) {
+        var element = card.querySelector(selector);
+        return element ? element.innerText.trim() : null;
+    }
+    
+    function experienceOf(card) {
+        var elements = card.querySelectorAll('*');
+        for (var i = 0; i < elements.length; i++) {
+            var nodes = elements[i].childNodes;
+            for (var j = 0; j < nodes.length; j++) {
+                if (nodes[j].nodeType === Node.TEXT_NODE &&
+                        /Year|Experience/.test(nodes[j].nodeValue)) {
+                    return elements[i].innerText.trim();
+                }
+            }
+        }
+        return null;
+    }
+    
+    return Array.prototype.map.call(arguments[0], function (card) {
+        var title = card.querySelector("a[class*='title'], a[class*='job-title']") ||
+                    card.querySelector('a');
+        var company = textOf(card, "a[class*='company'], a[class*='org']");
+        var location = textOf(card, "[class*='location'], [class*='loc']");
+        var experience = experienceOf(card);
+        var description = textOf(card, "[class*='desc'], [class*='description']");
+        return {
+            title: title ? title.innerText.trim() : 'Unknown Title',
+            url: title ? title.href : null,
+            company: company === null ? 'Unknown Company' : company,
+            location: location === null ? 'Unknown Location' : location,
+            experience: experience === null ? 'Not specified' : experience,
+            description: description === null ? '' : description
+        };
+    });
+"""
+
+
+def _find_first(context: Any, selector_key: str) -> Optional[WebElement]:
+    """
+    Find the first element matching a JOB_NAV_SELECTORS entry.
+    
+    Uses find_element, which stops at the first match, instead of serializing
+    every match through find_elements only to keep the first one.
+    
+    Args:
+        context: WebDriver or WebElement to search within
+        selector_key: Key of the selector in JOB_NAV_SELECTORS
+    
+    Returns:
+        Optional[WebElement]: First matching element, or None if there is none
+    """
+    try:
+        return context.find_element(*_RESOLVED_SELECTORS[selector_key])
+    except NoSuchElementException:
+        return None
+
+
+def _wait_for_first(driver: WebDriver, selector_key: str, timeout: int = 10) -> Optional[WebElement]:
+    """
+    Wait for the first element matching a JOB_NAV_SELECTORS entry to be present.
+    
+    The driver has no implicit wait, so lookups on a page that may still be
+    rendering go through this instead of find_element.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        selector_key: Key of the selector in JOB_NAV_SELECTORS
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        Optional[WebElement]: First matching element, or None on timeout
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located(_RESOLVED_SELECTORS[selector_key])
+        )
+    except TimeoutException:
+        return None
+
+
+def _first_job_listing(driver: WebDriver) -> Optional[WebElement]:
+    """
+    Get the first job listing element currently on the page.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        Optional[WebElement]: First job listing, or None if there are none
+    """
+    return _find_first(driver, "job_listings")
+
+
+def _wait_for_job_listings(
+    driver: WebDriver,
+    stale_element: Optional[WebElement] = None,
+    timeout: int = 10
+) -> bool:
+    """
+    Wait for job listings to be present, optionally after old results are replaced.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        stale_element: Element from the previous results that should go stale first
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        bool: True if job listings are present, False on timeout
+    """
+    try:
+        wait = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+        if stale_element is not None:
+            wait.until(EC.staleness_of(stale_element))
+        wait.until(EC.presence_of_element_located(_RESOLVED_SELECTORS["job_listings"]))
+        return True
+    except TimeoutException:
+        logger.warning("Timed out waiting for job listings to load")
+        return False
+
+
+def _wait_for_page_ready(driver: WebDriver, timeout: int = 10) -> bool:
+    """
+    Wait for the current document to finish parsing.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        bool: True if the document is ready, False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
+        return True
+    except TimeoutException:
+        logger.warning("Timed out waiting for page to load")
+        return False
+
+
+def _wait_for_application_form(driver: WebDriver, original_handles: List[str], timeout: int = 10) -> bool:
+    """
+    Wait for the apply button to open the application form.
+    
+    The form usually opens within the current document, which never returns to
+    the "loading" state, so the wait is on the form itself or on a new tab.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        original_handles: Window handles before the click
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        bool: True if the form or a new tab appeared, False on timeout
+    """
+    form_present = EC.presence_of_element_located(_RESOLVED_SELECTORS["application_form"])
+    new_window = EC.new_window_is_opened(original_handles)
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            lambda d: new_window(d) or form_present(d)
+        )
+        return True
+    except TimeoutException:
+        logger.warning("Timed out waiting for application form to load")
+        return False
+
+
+def _switch_to_new_tab(driver: WebDriver, original_handles: List[str], timeout: int = 3) -> None:
+    """
+    Switch to a tab opened by the last click, if one opens within the timeout.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        original_handles: Window handles before the click
+        timeout: Maximum time to wait for a new tab in seconds
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.new_window_is_opened(original_handles)
+        )
+    except TimeoutException:
+        # The job opened in the current tab
+        _wait_for_page_ready(driver)
+        return
+        
+    logger.info("Job opened in new tab, switching to it")
+    new_tabs = [h for h in driver.window_handles if h not in original_handles]
+    if new_tabs:
+        driver.switch_to.window(new_tabs[0])
+        _wait_for_page_ready(driver)
+
 
 def navigate_to_jobs(driver: WebDriver, config: Dict[str, Any]) -> bool:
     """
@@ -79,24 +421,23 @@ def navigate_to_jobs(driver: WebDriver, config: Dict[str, Any]) -> bool:
     logger.info("Navigating to job search page")
     
     try:
+        job_criteria = config.get('job_criteria') or {}
+        
         # Check if direct URL navigation is configured
-        if config.get('job_criteria', {}).get('use_direct_url', False):
-            direct_url = config.get('job_criteria', {}).get('direct_url')
+        if job_criteria.get('use_direct_url', False):
+            direct_url = job_criteria.get('direct_url')
             if direct_url:
                 logger.info(f"Using direct URL navigation: {direct_url}")
                 driver.get(direct_url)
-                time.sleep(5)  # Wait for page to load
+                _wait_for_job_listings(driver)
                 return True
         
         # Navigate to job search URL
         driver.get(JOB_SEARCH_URL)
         
         # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((
-                getattr(By, JOB_NAV_SELECTORS["search_box"]["by"]),
-                JOB_NAV_SELECTORS["search_box"]["selector"]
-            ))
+        WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located(_RESOLVED_SELECTORS["search_box"])
         )
         
         logger.info("Job search page loaded successfully")
@@ -108,15 +449,9 @@ def navigate_to_jobs(driver: WebDriver, config: Dict[str, Any]) -> bool:
         try:
             logger.info("Trying alternative navigation to recommended jobs")
             driver.get(RECOMMENDED_JOBS_URL)
-            time.sleep(5)
-            
-            # Check if any job listings are visible
-            job_elements = driver.find_elements(
-                getattr(By, JOB_NAV_SELECTORS["job_listings"]["by"]),
-                JOB_NAV_SELECTORS["job_listings"]["selector"]
-            )
             
-            if job_elements:
+            # Check if any job listings become visible
+            if _wait_for_job_listings(driver):
                 logger.info("Recommended jobs page loaded successfully")
                 return True
                 
@@ -142,10 +477,13 @@ def apply_job_filters(driver: WebDriver, job_criteria: Dict[str, Any]) -> bool:
     success_flags = []
     
     try:
+        # Results currently shown, which applying a filter replaces
+        old_listing = _first_job_listing(driver)
+        
         # Apply keywords filter
         if "keywords" in job_criteria and job_criteria["keywords"]:
             keywords = job_criteria["keywords"]
-            if isinstance(keywords, list):
+            if isinstance(keywords, (list, tuple)):
                 keywords = " ".join(keywords)
                 
             keywords_success = _apply_keyword_filter(driver, keywords)
@@ -154,7 +492,7 @@ def apply_job_filters(driver: WebDriver, job_criteria: Dict[str, Any]) -> bool:
         # Apply location filter
         if "locations" in job_criteria and job_criteria["locations"]:
             locations = job_criteria["locations"]
-            if isinstance(locations, list):
+            if isinstance(locations, (list, tuple)):
                 locations = ", ".join(locations)
                 
             location_success = _apply_location_filter(driver, locations)
@@ -170,14 +508,11 @@ def apply_job_filters(driver: WebDriver, job_criteria: Dict[str, Any]) -> bool:
             # Note: This is often handled through post-filtering rather than UI interactions
             logger.info(f"Exclusion terms will be used for post-filtering: {job_criteria['exclude_terms']}")
         
-        # Allow time for filters to apply and results to load
-        time.sleep(5)
+        # Wait for filtered results to replace the previous ones
+        _wait_for_job_listings(driver, stale_element=old_listing)
         
         # Check if any job listings are visible
-        job_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["job_listings"]["by"]),
-            JOB_NAV_SELECTORS["job_listings"]["selector"]
-        )
+        job_elements = driver.find_elements(*_RESOLVED_SELECTORS["job_listings"])
         
         if job_elements:
             logger.info(f"Found {len(job_elements)} job listings after applying filters")
@@ -203,30 +538,28 @@ def _apply_keyword_filter(driver: WebDriver, keywords: str) -> bool:
     Returns:
         bool: True if filter was applied successfully, False otherwise
     """
+    old_listing = _first_job_listing(driver)
+    
     try:
         # Find and clear the search box
-        search_element = driver.find_element(
-            getattr(By, JOB_NAV_SELECTORS["search_box"]["by"]),
-            JOB_NAV_SELECTORS["search_box"]["selector"]
-        )
+        search_element = _wait_for_first(driver, "search_box")
+        if search_element is None:
+            raise NoSuchElementException("Search box not found")
         search_element.clear()
         
         # Enter keywords
         search_element.send_keys(keywords)
         
         # Click search button or press Enter
-        try:
-            search_button = driver.find_element(
-                getattr(By, JOB_NAV_SELECTORS["search_button"]["by"]),
-                JOB_NAV_SELECTORS["search_button"]["selector"]
-            )
+        search_button = _find_first(driver, "search_button")
+        if search_button:
             search_button.click()
-        except NoSuchElementException:
+        else:
             # If button not found, try pressing Enter
             search_element.send_keys(Keys.RETURN)
         
         # Wait for results to load
-        time.sleep(3)
+        _wait_for_job_listings(driver, stale_element=old_listing)
         
         logger.info(f"Applied keyword filter: {keywords}")
         return True
@@ -239,7 +572,7 @@ def _apply_keyword_filter(driver: WebDriver, keywords: str) -> bool:
                 f"document.querySelector('input[placeholder*=\"Keyword\"]').value = '{keywords}';"
                 f"document.querySelector('form').submit();"
             )
-            time.sleep(3)
+            _wait_for_job_listings(driver, stale_element=old_listing)
             
             logger.info(f"Applied keyword filter using JavaScript: {keywords}")
             return True
@@ -259,12 +592,13 @@ def _apply_location_filter(driver: WebDriver, locations: str) -> bool:
     Returns:
         bool: True if filter was applied successfully, False otherwise
     """
+    old_listing = _first_job_listing(driver)
+    
     try:
         # Find the location filter
-        location_element = driver.find_element(
-            getattr(By, JOB_NAV_SELECTORS["location_filter"]["by"]),
-            JOB_NAV_SELECTORS["location_filter"]["selector"]
-        )
+        location_element = _wait_for_first(driver, "location_filter")
+        if location_element is None:
+            raise NoSuchElementException("Location filter not found")
         location_element.clear()
         
         # Enter locations
@@ -273,7 +607,7 @@ def _apply_location_filter(driver: WebDriver, locations: str) -> bool:
         location_element.send_keys(Keys.RETURN)
         
         # Wait for results to update
-        time.sleep(2)
+        _wait_for_job_listings(driver, stale_element=old_listing)
         
         logger.info(f"Applied location filter: {locations}")
         return True
@@ -282,19 +616,14 @@ def _apply_location_filter(driver: WebDriver, locations: str) -> bool:
         
         # Try alternative approach - look for location filter by various attributes
         try:
-            location_inputs = driver.find_elements(By.XPATH, 
-                "//input[contains(@placeholder, 'Location') or "
-                "contains(@placeholder, 'City') or "
-                "contains(@id, 'location') or "
-                "contains(@class, 'location')]"
-            )
+            location_input = _wait_for_first(driver, "alternative_location_filter")
             
-            if location_inputs:
-                location_inputs[0].clear()
-                location_inputs[0].send_keys(locations)
+            if location_input:
+                location_input.clear()
+                location_input.send_keys(locations)
                 time.sleep(1)
-                location_inputs[0].send_keys(Keys.RETURN)
-                time.sleep(2)
+                location_input.send_keys(Keys.RETURN)
+                _wait_for_job_listings(driver, stale_element=old_listing)
                 
                 logger.info(f"Applied location filter using alternative selector: {locations}")
                 return True
@@ -315,12 +644,13 @@ def _apply_experience_filter(driver: WebDriver, experience: str) -> bool:
     Returns:
         bool: True if filter was applied successfully, False otherwise
     """
+    old_listing = _first_job_listing(driver)
+    
     try:
         # Find the experience filter
-        experience_element = driver.find_element(
-            getattr(By, JOB_NAV_SELECTORS["experience_filter"]["by"]),
-            JOB_NAV_SELECTORS["experience_filter"]["selector"]
-        )
+        experience_element = _wait_for_first(driver, "experience_filter")
+        if experience_element is None:
+            raise NoSuchElementException("Experience filter not found")
         experience_element.clear()
         
         # Enter experience
@@ -329,7 +659,7 @@ def _apply_experience_filter(driver: WebDriver, experience: str) -> bool:
         experience_element.send_keys(Keys.RETURN)
         
         # Wait for results to update
-        time.sleep(2)
+        _wait_for_job_listings(driver, stale_element=old_listing)
         
         logger.info(f"Applied experience filter: {experience}")
         return True
@@ -339,28 +669,30 @@ def _apply_experience_filter(driver: WebDriver, experience: str) -> bool:
         # Try alternative approach - look for experience filter dropdown
         try:
             # Look for experience dropdown or slider
-            exp_elements = driver.find_elements(By.XPATH, 
-                "//div[contains(text(), 'Experience') or contains(@class, 'experience')]"
-            )
+            exp_element = _wait_for_first(driver, "experience_dropdown")
             
-            if exp_elements:
+            if exp_element:
                 # Click to expand the dropdown
-                exp_elements[0].click()
-                time.sleep(1)
+                exp_element.click()
                 
                 # Try to find appropriate option based on experience value
                 year_min, year_max = parse_experience_range(experience)
                 
                 if year_min is not None and year_max is not None:
-                    # Look for a matching option
-                    exp_options = driver.find_elements(By.XPATH,
-                        f"//a[contains(text(), '{year_min}') and contains(text(), '{year_max}')] | "
-                        f"//label[contains(text(), '{year_min}') and contains(text(), '{year_max}')]"
-                    )
+                    # Wait for a matching option to appear in the dropdown; the
+                    # years are passed as script arguments, not spliced into a query
+                    try:
+                        exp_options = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                            lambda d: d.execute_script(
+                                _FIND_EXPERIENCE_OPTIONS_JS, str(year_min), str(year_max)
+                            )
+                        )
+                    except TimeoutException:
+                        exp_options = []
                     
                     if exp_options:
                         exp_options[0].click()
-                        time.sleep(2)
+                        _wait_for_job_listings(driver, stale_element=old_listing)
                         
                         logger.info(f"Applied experience filter via dropdown: {experience}")
                         return True
@@ -371,6 +703,7 @@ def _apply_experience_filter(driver: WebDriver, experience: str) -> bool:
             return False
 
 
+@lru_cache(maxsize=128)
 def parse_experience_range(experience: str) -> tuple:
     """
     Parse experience string into min and max years.
@@ -382,137 +715,91 @@ def parse_experience_range(experience: str) -> tuple:
         tuple: (min_years, max_years) or (None, None) if parsing fails
     """
     try:
-        # Remove "years" or "yr" text
-        experience = experience.lower().replace("years", "").replace("year", "").replace("yr", "").strip()
+        match = _EXPERIENCE_RE.fullmatch(experience.strip().lower())
+        if not match:
+            return None, None
+            
+        min_years = int(match.group(1))
         
-        if "-" in experience:
+        if match.group(2):
             # Range format: "3-5"
-            parts = experience.split("-")
-            min_years = int(parts[0].strip())
-            max_years = int(parts[1].strip())
-            return min_years, max_years
+            return min_years, int(match.group(2))
             
-        elif "+" in experience:
+        elif match.group(3):
             # Minimum format: "3+"
-            min_years = int(experience.replace("+", "").strip())
             return min_years, 30  # Use a high number for max
             
         else:
             # Exact format: "3"
-            years = int(experience.strip())
-            return years, years
+            return min_years, min_years
             
     except Exception:
         return None, None
 
 
-def get_job_listings(driver: WebDriver, exclude_terms: List[str] = None) -> List[Dict[str, Any]]:
+def iter_job_listings(driver: WebDriver, exclude_terms: List[str] = None) -> Iterator[Dict[str, Any]]:
     """
-    Get job listings from the current page, optionally filtering out jobs with exclude terms.
+    Iterate over job listings on the current page, skipping jobs with exclude terms.
+    
+    Jobs are yielded as they pass the filter, so callers can start processing
+    the first jobs before the remaining ones are filtered.
     
     Args:
         driver: Selenium WebDriver instance
         exclude_terms: List of terms to exclude from job titles/descriptions
     
-    Returns:
-        List[Dict]: List of job listings with details
+    Yields:
+        Dict: Job listing details
     """
-    logger.info("Getting job listings from current page")
-    
-    job_listings = []
+    # Match all exclude terms (case-insensitively) in a single pass over each job's text
+    exclude_pattern = (
+        re.compile("|".join(re.escape(term.casefold()) for term in exclude_terms))
+        if exclude_terms else None
+    )
     
     try:
         # Find all job listing elements
-        job_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["job_listings"]["by"]),
-            JOB_NAV_SELECTORS["job_listings"]["selector"]
-        )
+        job_elements = driver.find_elements(*_RESOLVED_SELECTORS["job_listings"])
         
         logger.info(f"Found {len(job_elements)} job elements on page")
         
-        for job_element in job_elements:
-            try:
-                # Extract job details
-                job_details = {}
-                
-                # Extract job title
-                try:
-                    title_element = job_element.find_element(By.XPATH, 
-                        ".//a[contains(@class, 'title')] | .//a[contains(@class, 'job-title')]"
-                    )
-                    job_details["title"] = title_element.text.strip()
-                    job_details["url"] = title_element.get_attribute("href")
-                except:
-                    # Try alternative approach for title
-                    try:
-                        title_element = job_element.find_element(By.XPATH, ".//a")
-                        job_details["title"] = title_element.text.strip()
-                        job_details["url"] = title_element.get_attribute("href")
-                    except:
-                        job_details["title"] = "Unknown Title"
-                        job_details["url"] = None
-                
-                # Extract company name
-                try:
-                    company_element = job_element.find_element(By.XPATH, 
-                        ".//a[contains(@class, 'company')] | .//a[contains(@class, 'org')]"
-                    )
-                    job_details["company"] = company_element.text.strip()
-                except:
-                    job_details["company"] = "Unknown Company"
-                
-                # Extract location
-                try:
-                    location_element = job_element.find_element(By.XPATH, 
-                        ".//*[contains(@class, 'location')] | .//*[contains(@class, 'loc')]"
-                    )
-                    job_details["location"] = location_element.text.strip()
-                except:
-                    job_details["location"] = "Unknown Location"
-                
-                # Extract experience
-                try:
-                    exp_element = job_element.find_element(By.XPATH, 
-                        ".//*[contains(text(), 'Year') or contains(text(), 'Experience')]"
-                    )
-                    job_details["experience"] = exp_element.text.strip()
-                except:
-                    job_details["experience"] = "Not specified"
-                
-                # Extract description snippet
-                try:
-                    desc_element = job_element.find_element(By.XPATH, 
-                        ".//*[contains(@class, 'desc') or contains(@class, 'description')]"
-                    )
-                    job_details["description"] = desc_element.text.strip()
-                except:
-                    job_details["description"] = ""
-                
-                # Check if job should be excluded based on exclude terms
-                if exclude_terms:
-                    should_exclude = False
-                    combined_text = f"{job_details['title']} {job_details['company']} {job_details['description']}".lower()
-                    
-                    for term in exclude_terms:
-                        if term.lower() in combined_text:
-                            logger.debug(f"Excluding job with term '{term}': {job_details['title']}")
-                            should_exclude = True
-                            break
-                    
-                    if should_exclude:
-                        continue
+        # Extract the details of every card in one script call instead of a
+        # WebDriver round-trip per field per card. This also beats parsing
+        # driver.page_source locally: only the card fields cross the wire and
+        # the browser's own DOM is queried, with no second HTML parse
+        for job_details in driver.execute_script(_EXTRACT_JOB_CARDS_JS, job_elements):
+            # Check if job should be excluded based on exclude terms
+            if exclude_pattern:
+                combined_text = f"{job_details['title']} {job_details['company']} {job_details['description']}".casefold()
                 
-                job_listings.append(job_details)
-                
-            except Exception as job_e:
-                logger.error(f"Error extracting job details: {str(job_e)}")
-        
-        logger.info(f"Extracted {len(job_listings)} job listings after filtering")
-        return job_listings
+                excluded = exclude_pattern.search(combined_text)
+                if excluded:
+                    logger.debug(f"Excluding job with term '{excluded.group(0)}': {job_details['title']}")
+                    continue
+            
+            yield job_details
         
     except Exception as e:
         logger.error(f"Error getting job listings: {str(e)}")
-        return []
+
+
+def get_job_listings(driver: WebDriver, exclude_terms: List[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get job listings from the current page, optionally filtering out jobs with exclude terms.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        exclude_terms: List of terms to exclude from job titles/descriptions
+    
+    Returns:
+        List[Dict]: List of job listings with details
+    """
+    logger.info("Getting job listings from current page")
+    
+    job_listings = list(iter_job_listings(driver, exclude_terms))
+    
+    logger.info(f"Extracted {len(job_listings)} job listings after filtering")
+    return job_listings
 
 
 def move_to_next_job(driver: WebDriver) -> bool:
@@ -526,107 +813,79 @@ def move_to_next_job(driver: WebDriver) -> bool:
         bool: True if successfully moved to next job, False if no more jobs
     """
     try:
-        # Check if we're on a job details page or listing page
+        # Check if we're on a job details page or listing page; each of these
+        # properties is a WebDriver round-trip, so read them once
         current_url = driver.current_url
         current_window = driver.current_window_handle
+        handles = driver.window_handles
         
         # Check if we have multiple tabs open (jobs often open in new tabs)
-        if len(driver.window_handles) > 1:
+        if len(handles) > 1:
             logger.info("Detected multiple browser tabs")
             # Close current tab if it's a job detail page
             if "/job-listings-" in current_url or "/jobdetail/" in current_url:
                 driver.close()
                 # Switch back to the main window (job listings)
-                driver.switch_to.window(driver.window_handles[0])
-                time.sleep(2)  # Wait for tab switch
+                handles = [h for h in handles if h != current_window]
+                driver.switch_to.window(handles[0])
             else:
                 # If we're already on the listing page, close any other tabs
-                for handle in driver.window_handles:
+                for handle in handles:
                     if handle != current_window:
                         driver.switch_to.window(handle)
                         driver.close()
                 # Switch back to main window
                 driver.switch_to.window(current_window)
+                handles = [current_window]
         elif "/job-listings-" in current_url or "/jobdetail/" in current_url:
             # We're on a job details page, go back to search results
             driver.back()
-            time.sleep(3)
         
-        # Find all job listings
-        job_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["job_listings"]["by"]),
-            JOB_NAV_SELECTORS["job_listings"]["selector"]
-        )
+        # Find all job listings, once the page has rendered any; readyState
+        # alone is reached before the results page renders its job cards
+        _wait_for_job_listings(driver)
+        job_elements = driver.find_elements(*_RESOLVED_SELECTORS["job_listings"])
         
         if not job_elements:
             # Try alternative selectors for Naukri Campus
-            job_elements = driver.find_elements(By.XPATH, 
-                "//div[contains(@class, 'jobTuple')] | //div[contains(@class, 'job-card')] | "
-                "//article[contains(@class, 'job')] | //div[contains(@class, 'job-container')]"
-            )
+            job_elements = driver.find_elements(*_RESOLVED_SELECTORS["alternative_job_listings"])
             
         if not job_elements:
             logger.warning("No job listings found on current page")
             return False
         
-        # Find the active/highlighted job
-        active_job = None
-        try:
-            active_job = driver.find_element(By.XPATH, 
-                "//article[contains(@class, 'active') or contains(@class, 'selected')] | "
-                "//div[contains(@class, 'active') or contains(@class, 'selected')]"
-            )
-        except NoSuchElementException:
-            # If no active job, select the first one
-            active_job = job_elements[0]
+        # Find the active/highlighted job; if there is none, select the first one
+        active_jobs = driver.find_elements(*_RESOLVED_SELECTORS["active_job"])
+        active_job = active_jobs[0] if active_jobs else job_elements[0]
         
-        # Find the index of the active job
-        active_index = -1
-        for i, job in enumerate(job_elements):
-            if job.id == active_job.id:
-                active_index = i
-                break
+        # Find the index of the active job (WebElements compare by their
+        # element reference locally, without a WebDriver call)
+        active_index = job_elements.index(active_job) if active_job in job_elements else -1
         
         # Select the next job
         if active_index >= 0 and active_index < len(job_elements) - 1:
             next_job = job_elements[active_index + 1]
             
-            # Save the current window handles before clicking
-            original_handles = driver.window_handles
+            # Window handles before clicking, to detect a newly opened tab
+            original_handles = handles
             
-            # Try to click on the job title
+            # Click on the job title, or the job element directly if it has
+            # none or its click fails (e.g. intercepted by an overlay)
+            title_element = _find_first(next_job, "job_card_link")
             try:
-                title_element = next_job.find_element(By.XPATH, 
-                    ".//a[contains(@class, 'title')] | .//a[contains(@class, 'job-title')] | .//a"
-                )
+                if title_element is None:
+                    raise NoSuchElementException("Job card has no link")
+                title_text = title_element.text
                 title_element.click()
-                logger.info(f"Moved to next job: {title_element.text}")
-                time.sleep(3)
-                
-                # Check if a new tab was opened
-                if len(driver.window_handles) > len(original_handles):
-                    logger.info("Job opened in new tab, switching to it")
-                    new_tabs = [h for h in driver.window_handles if h not in original_handles]
-                    if new_tabs:
-                        driver.switch_to.window(new_tabs[0])
-                        time.sleep(2)  # Wait for tab to load
-                
-                return True
-            except:
-                # Try clicking the job element directly
+                logger.info(f"Moved to next job: {title_text}")
+            except WebDriverException:
                 next_job.click()
                 logger.info("Moved to next job using direct click")
-                time.sleep(3)
-                
-                # Check if a new tab was opened
-                if len(driver.window_handles) > len(original_handles):
-                    logger.info("Job opened in new tab, switching to it")
-                    new_tabs = [h for h in driver.window_handles if h not in original_handles]
-                    if new_tabs:
-                        driver.switch_to.window(new_tabs[0])
-                        time.sleep(2)  # Wait for tab to load
-                
-                return True
+            
+            # Check if a new tab was opened
+            _switch_to_new_tab(driver, original_handles)
+            
+            return True
                 
         elif active_index == len(job_elements) - 1:
             # We're at the last job on this page, try moving to next page
@@ -652,41 +911,38 @@ def _move_to_next_page(driver: WebDriver) -> bool:
     """
     try:
         # Find the next page button
-        next_page_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["next_page"]["by"]),
-            JOB_NAV_SELECTORS["next_page"]["selector"]
-        )
+        next_page_elements = driver.find_elements(*_RESOLVED_SELECTORS["next_page"])
         
         if not next_page_elements:
             logger.warning("No next page button found")
             return False
         
+        old_listing = _first_job_listing(driver)
+        
         for element in next_page_elements:
             if element.is_displayed() and element.is_enabled():
                 element.click()
                 logger.info("Navigated to next page of job listings")
-                time.sleep(5)  # Wait for page to load
+                _wait_for_job_listings(driver, stale_element=old_listing)
                 
-                # Get the first job on the new page
-                job_elements = driver.find_elements(
-                    getattr(By, JOB_NAV_SELECTORS["job_listings"]["by"]),
-                    JOB_NAV_SELECTORS["job_listings"]["selector"]
-                )
+                # Title links of the listings, in page order, so the first
+                # belongs to the first job on the new page
+                title_elements = driver.find_elements(*_RESOLVED_SELECTORS["listing_titles"])
                 
-                if job_elements:
-                    # Try to click on the job title
-                    try:
-                        title_element = job_elements[0].find_element(By.XPATH, 
-                            ".//a[contains(@class, 'title')] | .//a[contains(@class, 'job-title')]"
-                        )
-                        title_element.click()
-                        logger.info(f"Selected first job on new page: {title_element.text}")
-                        time.sleep(3)
-                    except:
-                        # Try clicking the job element directly
-                        job_elements[0].click()
+                try:
+                    if not title_elements:
+                        raise NoSuchElementException("No job title links on new page")
+                    title_text = title_elements[0].text
+                    title_elements[0].click()
+                    logger.info(f"Selected first job on new page: {title_text}")
+                    _wait_for_page_ready(driver)
+                except WebDriverException:
+                    # Try clicking the job element directly
+                    first_job = _first_job_listing(driver)
+                    if first_job is not None:
+                        first_job.click()
                         logger.info("Selected first job on new page using direct click")
-                        time.sleep(3)
+                        _wait_for_page_ready(driver)
                 
                 return True
         
@@ -709,16 +965,11 @@ def is_apply_button_available(driver: WebDriver) -> bool:
         bool: True if apply button is available, False otherwise
     """
     try:
-        apply_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["apply_button"]["by"]),
-            JOB_NAV_SELECTORS["apply_button"]["selector"]
-        )
+        # Disabled and hidden buttons are excluded by the selector itself, so
+        # only rendering (e.g. CSS display) is left to check per candidate
+        apply_elements = driver.find_elements(*_RESOLVED_SELECTORS["apply_button"])
         
-        for element in apply_elements:
-            if element.is_displayed() and element.is_enabled():
-                return True
-        
-        return False
+        return any(element.is_displayed() for element in apply_elements)
         
     except Exception as e:
         logger.error(f"Error checking for apply button: {str(e)}")
@@ -736,16 +987,24 @@ def click_apply_button(driver: WebDriver) -> bool:
         bool: True if apply button was clicked successfully, False otherwise
     """
     try:
-        apply_elements = driver.find_elements(
-            getattr(By, JOB_NAV_SELECTORS["apply_button"]["by"]),
-            JOB_NAV_SELECTORS["apply_button"]["selector"]
-        )
+        # Window handles before clicking, as some jobs apply on a company site
+        original_handles = driver.window_handles
+        
+        # Find and click the button in the browser in a single call, instead
+        # of checking visibility and state of each candidate over WebDriver
+        if driver.execute_script(_CLICK_APPLY_JS):
+            logger.info("Clicked apply button using JavaScript")
+            _wait_for_application_form(driver, original_handles)
+            return True
+        
+        # Fall back to a native click on the selector matches
+        apply_elements = driver.find_elements(*_RESOLVED_SELECTORS["apply_button"])
         
         for element in apply_elements:
-            if element.is_displayed() and element.is_enabled():
+            if element.is_displayed():
                 element.click()
                 logger.info("Clicked apply button")
-                time.sleep(3)  # Wait for application form to load
+                _wait_for_application_form(driver, original_handles)
                 return True
         
         logger.warning("Apply button not found or not clickable")
@@ -753,29 +1012,7 @@ def click_apply_button(driver: WebDriver) -> bool:
         
     except Exception as e:
         logger.error(f"Error clicking apply button: {str(e)}")
-        
-        # Try alternative approach using JavaScript
-        try:
-            result = driver.execute_script("""
-                var buttons = document.querySelectorAll('button');
-                for (var i = 0; i < buttons.length; i++) {
-                    if (buttons[i].textContent.toLowerCase().includes('apply')) {
-                        buttons[i].click();
-                        return true;
-                    }
-                }
-                return false;
-            """)
-            
-            if result:
-                logger.info("Clicked apply button using JavaScript")
-                time.sleep(3)
-                return True
-                
-            return False
-        except Exception as js_e:
-            logger.error(f"JavaScript click apply button failed: {str(js_e)}")
-            return False
+        return False
 
 
 def get_current_job_details(driver: WebDriver) -> Dict[str, Any]:
@@ -798,59 +1035,18 @@ def get_current_job_details(driver: WebDriver) -> Dict[str, Any]:
     }
     
     try:
-        # Extract job title
-        try:
-            title_elements = driver.find_elements(By.XPATH, 
-                "//h1[contains(@class, 'title')] | //div[contains(@class, 'title')] | //h1"
-            )
-            if title_elements:
-                job_details["title"] = title_elements[0].text.strip()
-        except:
-            pass
-        
-        # Extract company name
-        try:
-            company_elements = driver.find_elements(By.XPATH, 
-                "//a[contains(@class, 'company')] | //a[contains(@class, 'org')] | "
-                "//div[contains(@class, 'company')] | //div[contains(text(), 'Company:')]/following-sibling::*"
-            )
-            if company_elements:
-                job_details["company"] = company_elements[0].text.strip()
-        except:
-            pass
-        
-        # Extract location
-        try:
-            location_elements = driver.find_elements(By.XPATH, 
-                "//*[contains(@class, 'location')] | //*[contains(@class, 'loc')] | "
-                "//*[contains(text(), 'Location:')]/following-sibling::*"
-            )
-            if location_elements:
-                job_details["location"] = location_elements[0].text.strip()
-        except:
-            pass
-        
-        # Extract experience
-        try:
-            exp_elements = driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'Year') or contains(text(), 'Experience')]/parent::* | "
-                "//*[contains(text(), 'Experience:')]/following-sibling::*"
-            )
-            if exp_elements:
-                job_details["experience"] = exp_elements[0].text.strip()
-        except:
-            pass
+        # Extract every field from the first element matching its selectors
+        # in a single script call rather than a round-trip per field. Fetching
+        # driver.page_source to parse locally would be a round-trip too, and
+        # would transfer the whole document to read five short strings
+        texts = driver.execute_script(
+            _FIRST_MATCH_TEXTS_JS,
+            [[list(_RESOLVED_SELECTORS[key]) for key in selector_keys] for _, selector_keys in _DETAIL_FIELDS]
+        )
         
-        # Extract description
-        try:
-            desc_elements = driver.find_elements(By.XPATH, 
-                "//*[contains(@class, 'job-desc') or contains(@class, 'description') or "
-                "contains(@id, 'job-desc') or contains(@id, 'job-description')]"
-            )
-            if desc_elements:
-                job_details["description"] = desc_elements[0].text.strip()
-        except:
-            pass
+        for (field, _), text in zip(_DETAIL_FIELDS, texts):
+            if text is not None:
+                job_details[field] = text
         
         logger.info(f"Extracted current job details: {job_details['title']} at {job_details['company']}")
         return job_details
@@ -4,23 +4,38 @@ Login Module
 This module handles authentication on Naukri.com.
 """
 
+import os
+import json
 import time
-from typing import Dict, Any
+import tempfile
+from typing import Dict, Any, Callable, Optional, Tuple
 
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, WebDriverException
+)
 
 from src.utils.logger import get_logger
-from src.automation.browser_automation import safe_click, safe_send_keys, is_element_present
+from src.automation.browser_automation import WAIT_POLL_FREQUENCY
 
 logger = get_logger()
 
 # Naukri.com login URL
 NAUKRI_LOGIN_URL = "https://www.naukri.com/nlogin/login"
 
+# Naukri.com logout URL
+NAUKRI_LOGOUT_URL = "https://www.naukri.com/nlogin/logout"
+
+# Naukri.com home page, loaded so that saved cookies can be set on its domain
+NAUKRI_HOME_URL = "https://www.naukri.com"
+
+# File in which the session cookies of a successful login are kept
+SESSION_FILE = os.path.expanduser("~/.naukri_session.json")
+
 # Element selectors for login form
 LOGIN_SELECTORS = {
     "email_field": {
@@ -65,6 +80,467 @@ ALTERNATIVE_SELECTORS = {
     }
 }
 
+# Fills and submits the login form with arguments[0] (username) and
+# arguments[1] (password). Fields are looked up by the ALTERNATIVE_SELECTORS
+# names first and by input type second, and values go through the native
+# setter like in _SUBMIT_LOGIN_JS; returns false if either field is missing
+_ALTERNATIVE_LOGIN_JS = """
+    var email = document.querySelector('[name="email"]') ||
+                document.querySelector('input[type="email"]');
+    var password = document.querySelector('[name="password"]') ||
+                   document.querySelector('input[type="password"]');
+    if (!email || !password) {
+        return false;
+    }
+    
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    [[email, arguments[0]], [password, arguments[1]]].forEach(function (entry) {
+        setValue.call(entry[0], entry[1]);
+        entry[0].dispatchEvent(new Event('input', {bubbles: true}));
+        entry[0].dispatchEvent(new Event('change', {bubbles: true}));
+    });
+    
+    var button = document.querySelector('button.loginButton');
+    if (button) {
+        button.click();
+    } else {
+        (email.form || document.querySelector('form')).submit();
+    }
+    return true;
+"""
+
+# Fills the primary login form and clicks the login button. Takes the email
+# and password field IDs, the login button XPath, the username and the
+# password; values go through the native setter so framework-bound inputs
+# see the change. Returns false if any element is missing
+_SUBMIT_LOGIN_JS = """
+    var email = document.getElementById(arguments[0]);
+    var password = document.getElementById(arguments[1]);
+    var button = document.evaluate(arguments[2], document, null,
+                                   XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!email || !password || !button) {
+        return false;
+    }
+    
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    [[email, arguments[3]], [password, arguments[4]]].forEach(function (entry) {
+        setValue.call(entry[0], entry[1]);
+        entry[0].dispatchEvent(new Event('input', {bubbles: true}));
+        entry[0].dispatchEvent(new Event('change', {bubbles: true}));
+    });
+    
+    button.click();
+    return true;
+"""
+
+# Logged-in indicators resolved once into (By strategy, selector) locators:
+# primary indicator, alternative indicator, then any logout link
+_LOGGED_IN_PROBES = (
+    (getattr(By, LOGIN_SELECTORS["logged_in_indicator"]["by"]), LOGIN_SELECTORS["logged_in_indicator"]["selector"]),
+    (getattr(By, ALTERNATIVE_SELECTORS["logged_in_indicator"]["by"]), ALTERNATIVE_SELECTORS["logged_in_indicator"]["selector"]),
+    (By.XPATH, "//a[contains(text(), 'Logout')]"),
+)
+
+# User menu that holds the logout control
+_PROFILE_MENU_LOCATOR = (By.CSS_SELECTOR, "div[class*='user'], div[class*='profile'], div[class*='account']")
+
+# Logout controls: links are matched by href through CSS, while matching on
+# the "Logout" label needs XPath
+_LOGOUT_LINK_LOCATOR = (By.CSS_SELECTOR, "a[href*='logout']")
+_LOGOUT_TEXT_LOCATOR = (By.XPATH, "//a[contains(text(), 'Logout')] | //button[contains(text(), 'Logout')]")
+
+# Clicks the first rendered element matched by the (By strategy, selector)
+# pairs in arguments[0], tried in order, and returns whether one was found
+_CLICK_FIRST_VISIBLE_JS = """
+    var locators = arguments[0];
+    for (var i = 0; i < locators.length; i++) {
+        var elements = [];
+        if (locators[i][0] === 'xpath') {
+            var snapshot = document.evaluate(locators[i][1], document, null,
+                                             XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var j = 0; j < snapshot.snapshotLength; j++) {
+                elements.push(snapshot.snapshotItem(j));
+            }
+        } else {
+            elements = document.querySelectorAll(locators[i][1]);
+        }
+        
+        for (var k = 0; k < elements.length; k++) {
+            if (elements[k].getClientRects().length > 0) {
+                elements[k].click();
+                return true;
+            }
+        }
+    }
+    return false;
+"""
+
+# Lower-case URL fragments of pages only reachable when logged in
+_LOGGED_IN_URL_MARKERS = ("myprofile", "dashboard", "home")
+
+# Locator of the primary email field, used to detect the login form
+_EMAIL_FIELD_LOCATOR = (getattr(By, LOGIN_SELECTORS["email_field"]["by"]), LOGIN_SELECTORS["email_field"]["selector"])
+
+# Locators of the primary email field, password field and login button
+_LOGIN_FORM_LOCATORS = tuple(
+    (getattr(By, LOGIN_SELECTORS[key]["by"]), LOGIN_SELECTORS[key]["selector"])
+    for key in ("email_field", "password_field", "login_button")
+)
+
+# Seconds for which an is_logged_in result is reused
+LOGGED_IN_CACHE_TTL = 0.5
+
+# Last is_logged_in result per driver as (monotonic time, logged in)
+_logged_in_cache: Dict[int, Tuple[float, bool]] = {}
+
+# Returns true if any (By strategy, selector) pair in arguments[0] matches an
+# element, or the lower-cased URL contains any marker in arguments[1]
+_LOGGED_IN_JS = """
+    var found = arguments[0].some(function (locator) {
+        var by = locator[0], selector = locator[1];
+        if (by === 'xpath') {
+            return document.evaluate(selector, document, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+        }
+        if (by === 'class name') {
+            return document.getElementsByClassName(selector).length > 0;
+        }
+        if (by === 'id') {
+            return document.getElementById(selector) !== null;
+        }
+        if (by === 'name') {
+            return document.getElementsByName(selector).length > 0;
+        }
+        return document.querySelector(selector) !== null;
+    });
+    var url = window.location.href.toLowerCase();
+    return found || arguments[1].some(function (marker) {
+        return url.indexOf(marker) !== -1;
+    });
+"""
+
+# Returns [element, text] for the first element with the class name in
+# arguments[0], or else for the first rendered error, alert or notification
+# element, or [null, ''] if there is none. The [class*=] selectors keep the
+# substring match of the old XPath contains() scan, and offsetParent stands
+# in for a per-element is_displayed() call
+_ERROR_ELEMENT_JS = """
+    var primary = document.getElementsByClassName(arguments[0])[0];
+    if (primary) {
+        return [primary, primary.innerText];
+    }
+    
+    var candidates = document.querySelectorAll(
+        "[class*='error'], [class*='alert'], [class*='notification']");
+    for (var i = 0; i < candidates.length; i++) {
+        var text = candidates[i].offsetParent !== null && candidates[i].innerText.trim();
+        if (text) {
+            return [candidates[i], text];
+        }
+    }
+    return [null, ''];
+"""
+
+# Returns the text of the error found by _ERROR_ELEMENT_JS
+_ERROR_MESSAGE_JS = """
+    return (function () {""" + _ERROR_ELEMENT_JS + """}).apply(null, arguments)[1];
+"""
+
+# Polls in the page until the user is logged in, a new login error is shown
+# or arguments[3] milliseconds pass, checking every arguments[4] milliseconds.
+# Takes the _LOGGED_IN_JS locators and URL markers, the error class name, and
+# the error element and text shown before the submit (arguments[5] and [6]),
+# which do not count as an outcome while unchanged. Resolves with
+# [logged in, error message]
+_LOGIN_OUTCOME_JS = """
+    var isLoggedIn = function () {""" + _LOGGED_IN_JS + """};
+    var readError = function () {""" + _ERROR_ELEMENT_JS + """};
+    var probes = arguments[0], markers = arguments[1], errorClass = arguments[2];
+    var timeoutMs = arguments[3], pollMs = arguments[4];
+    var previousElement = arguments[5], previousText = arguments[6];
+    var done = arguments[arguments.length - 1];
+    var started = Date.now();
+    
+    (function poll() {
+        if (isLoggedIn(probes, markers)) {
+            done([true, '']);
+            return;
+        }
+        var error = readError(errorClass);
+        var isNew = error[1] && (error[0] !== previousElement || error[1] !== previousText);
+        if (isNew || Date.now() - started >= timeoutMs) {
+            done([false, error[1] || '']);
+            return;
+        }
+        setTimeout(poll, pollMs);
+    })();
+"""
+
+
+def _wait_until(driver: WebDriver, condition: Callable[[WebDriver], Any], timeout: int = 10) -> bool:
+    """
+    Wait for a condition on the driver, without raising on timeout.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        condition: Callable returning a truthy value once the wait is over
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        bool: True if the condition was met, False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _read_error(driver: WebDriver) -> Tuple[Optional[WebElement], str]:
+    """
+    Get the login error currently shown, if any.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        Tuple[Optional[WebElement], str]: Error element and its text, or
+        (None, "") if no error is shown
+    """
+    try:
+        error_element, error_text = driver.execute_script(
+            _ERROR_ELEMENT_JS, LOGIN_SELECTORS["error_message"]["selector"]
+        )
+        return error_element, error_text or ""
+    except Exception as e:
+        logger.error(f"Error reading login error message: {str(e)}")
+        return None, ""
+
+
+def _login_settled(
+    driver: WebDriver,
+    previous_error: Tuple[Optional[WebElement], str] = (None, "")
+) -> bool:
+    """
+    Check whether a submitted login has either succeeded or shown an error.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        previous_error: Error element and text shown before the submit, which
+            do not count as an outcome while unchanged
+    
+    Returns:
+        bool: True if the user is logged in or a new error message is shown
+    """
+    if is_logged_in(driver):
+        return True
+    
+    error_element, error_text = _read_error(driver)
+    return bool(error_text) and (error_element != previous_error[0] or error_text != previous_error[1])
+
+
+def _wait_for_login_outcome(
+    driver: WebDriver,
+    previous_error: Tuple[Optional[WebElement], str] = (None, ""),
+    timeout: int = 10
+) -> Tuple[bool, str]:
+    """
+    Wait for a submitted login to either succeed or show an error.
+    
+    The page is polled by an async script, so the wait ends as soon as the
+    outcome is visible instead of after a WebDriver polling round-trip. If
+    the submit navigates away, the script is dropped with the old document
+    and the outcome is polled from the new page instead.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        previous_error: Error element and text shown before the submit, as
+            returned by _read_error; an error only ends the wait once the
+            element or its text differs, so a retry does not return at once
+            on the previous attempt's error
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        Tuple[bool, str]: Whether the user is logged in, and the error message
+        shown (empty if none)
+    """
+    try:
+        logged_in, error_message = driver.execute_async_script(
+            _LOGIN_OUTCOME_JS,
+            _LOGGED_IN_PROBES,
+            _LOGGED_IN_URL_MARKERS,
+            LOGIN_SELECTORS["error_message"]["selector"],
+            timeout * 1000,
+            WAIT_POLL_FREQUENCY * 1000,
+            previous_error[0],
+            previous_error[1]
+        )
+    except WebDriverException:
+        _wait_until(driver, lambda d: _login_settled(d, previous_error), timeout)
+        logged_in = is_logged_in(driver)
+        error_message = "" if logged_in else get_error_message(driver)
+    
+    _logged_in_cache[id(driver)] = (time.monotonic(), logged_in)
+    return logged_in, error_message
+
+
+def _page_ready(driver: WebDriver) -> bool:
+    """
+    Check whether the current document has finished parsing.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        bool: True if the document is no longer loading
+    """
+    return driver.execute_script("return document.readyState") != "loading"
+
+
+def _on_login_page(driver: WebDriver) -> bool:
+    """
+    Check whether the driver is currently on the login page.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        bool: True if the current URL is the login page
+    """
+    return "nlogin/login" in driver.current_url.lower()
+
+
+def _on_logged_out_page(driver: WebDriver) -> bool:
+    """
+    Check whether the driver is on a page only shown to logged-out users.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        bool: True if the current URL is the login page or the bare home page
+    """
+    url = driver.current_url.lower().split("?")[0].rstrip("/")
+    return "nlogin/login" in url or url == NAUKRI_HOME_URL
+
+
+def _find_login_form(driver: WebDriver) -> Tuple[WebElement, ...]:
+    """
+    Wait for the primary login form elements to become usable.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        Tuple[WebElement, ...]: Email field, password field and login button
+    """
+    wait = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY)
+    return tuple(wait.until(EC.element_to_be_clickable(locator)) for locator in _LOGIN_FORM_LOCATORS)
+
+
+def _type_credentials(form_elements: Tuple[WebElement, ...], credentials: Dict[str, str]) -> None:
+    """
+    Type the credentials into the login form and click the login button.
+    
+    Args:
+        form_elements: Email field, password field and login button
+        credentials: Dictionary containing username (email) and password
+    """
+    email_field, password_field, login_button = form_elements
+    
+    email_field.clear()
+    email_field.send_keys(credentials["username"])
+    password_field.clear()
+    password_field.send_keys(credentials["password"])
+    login_button.click()
+
+
+def _save_session(driver: WebDriver, username: str) -> None:
+    """
+    Save the session cookies of the logged-in user to SESSION_FILE.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        username: Username the session belongs to
+    """
+    temp_path = None
+    try:
+        # The cookies grant access to the account, so they are written to a
+        # temporary file that mkstemp creates readable by the owner only, and
+        # moved into place once complete
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(SESSION_FILE), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"username": username, "cookies": driver.get_cookies()}, f)
+        
+        os.replace(temp_path, SESSION_FILE)
+        temp_path = None
+        logger.debug(f"Session saved to {SESSION_FILE}")
+    except Exception as e:
+        logger.warning(f"Could not save session: {str(e)}")
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _restore_session(driver: WebDriver, username: str) -> bool:
+    """
+    Load the cookies saved in SESSION_FILE and check whether they still log
+    the user in.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        username: Username to log in as; a session saved for another
+            account is not restored
+    
+    Returns:
+        bool: True if the restored session is logged in, False otherwise
+    """
+    if not os.path.exists(SESSION_FILE):
+        return False
+    
+    try:
+        with open(SESSION_FILE) as f:
+            session = json.load(f)
+        
+        if not isinstance(session, dict) or session.get("username") != username:
+            logger.info("Saved session belongs to a different account, not restoring it")
+            return False
+        
+        # Cookies can only be added for the domain currently loaded
+        if "naukri.com" not in driver.current_url.lower():
+            driver.get(NAUKRI_HOME_URL)
+        
+        # Skip cookies the browser rejects (e.g. scoped to another subdomain)
+        # instead of giving up on the whole session
+        for cookie in session.get("cookies", []):
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f"Skipping saved cookie {cookie.get('name')}: {e.__class__.__name__}")
+        
+        driver.refresh()
+        _logged_in_cache.pop(id(driver), None)
+        
+        if _wait_until(driver, is_logged_in, timeout=3):
+            return True
+        
+        logger.info("Saved session has expired")
+    except Exception as e:
+        logger.warning(f"Could not restore saved session: {str(e)}")
+    
+    return False
+
+
+def _clear_session() -> None:
+    """
+    Delete the saved session cookies, if any.
+    """
+    try:
+        if os.path.exists(SESSION_FILE):
+            os.remove(SESSION_FILE)
+    except Exception as e:
+        logger.warning(f"Could not delete saved session: {str(e)}")
+
 
 def login_to_naukri(driver: WebDriver, credentials: Dict[str, str], max_retries: int = 3) -> bool:
     """
@@ -80,63 +556,73 @@ def login_to_naukri(driver: WebDriver, credentials: Dict[str, str], max_retries:
     """
     logger.info("Attempting to log in to Naukri.com")
     
-    # Navigate to login page
-    driver.get(NAUKRI_LOGIN_URL)
+    if is_logged_in(driver):
+        logger.info("Already logged in")
+        return True
+    
+    # Reuse the cookies of an earlier login before filling in the form
+    if _restore_session(driver, credentials["username"]):
+        logger.info("Logged in with saved session")
+        return True
+    
+    # Navigate to login page unless the driver is already there
+    if not _on_login_page(driver):
+        driver.get(NAUKRI_LOGIN_URL)
     
     # Wait for page to load
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, LOGIN_SELECTORS["email_field"]["selector"]))
+        WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located(_EMAIL_FIELD_LOCATOR)
         )
         logger.info("Login page loaded successfully")
     except TimeoutException:
         logger.warning("Login page elements not found with primary selectors. Trying alternative approach.")
         return _try_alternative_login(driver, credentials, max_retries)
     
+    # Login form elements, found on the first attempt that needs them
+    form_elements = None
+    
     # Perform login attempts
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"Login attempt {attempt}")
             
-            # Fill in email
-            if not safe_send_keys(
-                driver, 
-                LOGIN_SELECTORS["email_field"]["by"], 
-                LOGIN_SELECTORS["email_field"]["selector"], 
-                credentials["username"]
-            ):
-                logger.error("Failed to enter email")
-                continue
+            # Error left over from an earlier attempt, not an outcome of this one
+            previous_error = _read_error(driver)
             
-            # Fill in password
-            if not safe_send_keys(
-                driver, 
-                LOGIN_SELECTORS["password_field"]["by"], 
-                LOGIN_SELECTORS["password_field"]["selector"], 
+            # Fill in both fields and click login in a single script call
+            submitted = driver.execute_script(
+                _SUBMIT_LOGIN_JS,
+                LOGIN_SELECTORS["email_field"]["selector"],
+                LOGIN_SELECTORS["password_field"]["selector"],
+                LOGIN_SELECTORS["login_button"]["selector"],
+                credentials["username"],
                 credentials["password"]
-            ):
-                logger.error("Failed to enter password")
-                continue
+            )
             
-            # Click login button
-            if not safe_click(
-                driver, 
-                LOGIN_SELECTORS["login_button"]["by"], 
-                LOGIN_SELECTORS["login_button"]["selector"]
-            ):
-                logger.error("Failed to click login button")
-                continue
+            if not submitted:
+                logger.warning("Login form not filled by script. Typing credentials instead.")
+                
+                # Reuse the form elements found on an earlier attempt, and
+                # look them up again only if the form has been re-rendered
+                try:
+                    if form_elements is None:
+                        form_elements = _find_login_form(driver)
+                    _type_credentials(form_elements, credentials)
+                except StaleElementReferenceException:
+                    form_elements = _find_login_form(driver)
+                    _type_credentials(form_elements, credentials)
             
-            # Wait for login to complete
-            time.sleep(3)  # Allow time for the login process
+            # Wait for login to complete or fail
+            logged_in, error_message = _wait_for_login_outcome(driver, previous_error)
             
             # Check if login was successful
-            if is_logged_in(driver):
+            if logged_in:
                 logger.info("Login successful")
+                _save_session(driver, credentials["username"])
                 return True
             
             # Check for error messages
-            error_message = get_error_message(driver)
             if error_message:
                 logger.error(f"Login failed: {error_message}")
                 
@@ -145,9 +631,6 @@ def login_to_naukri(driver: WebDriver, credentials: Dict[str, str], max_retries:
                     logger.error("Invalid credentials. Aborting login attempts.")
                     return False
             
-            # Wait before next attempt
-            time.sleep(2)
-            
         except Exception as e:
             logger.error(f"Error during login attempt: {str(e)}")
         
@@ -171,62 +654,33 @@ def _try_alternative_login(driver: WebDriver, credentials: Dict[str, str], max_r
     Returns:
         bool: True if login was successful, False otherwise
     """
-    # Refresh the page to start clean
-    driver.refresh()
-    time.sleep(3)
+    # Return to the login page if a previous attempt navigated away; the
+    # form is refilled from scratch, so there is no need to reload it otherwise
+    if not _on_login_page(driver):
+        driver.get(NAUKRI_LOGIN_URL)
+        _wait_until(driver, _page_ready)
     
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"Alternative login attempt {attempt}")
             
-            # Try to find elements with alternative selectors
-            try:
-                email_field = driver.find_element(
-                    getattr(By, ALTERNATIVE_SELECTORS["email_field"]["by"]), 
-                    ALTERNATIVE_SELECTORS["email_field"]["selector"]
-                )
-                email_field.clear()
-                email_field.send_keys(credentials["username"])
-                
-                password_field = driver.find_element(
-                    getattr(By, ALTERNATIVE_SELECTORS["password_field"]["by"]), 
-                    ALTERNATIVE_SELECTORS["password_field"]["selector"]
-                )
-                password_field.clear()
-                password_field.send_keys(credentials["password"])
-                
-                login_button = driver.find_element(
-                    getattr(By, ALTERNATIVE_SELECTORS["login_button"]["by"]), 
-                    ALTERNATIVE_SELECTORS["login_button"]["selector"]
-                )
-                login_button.click()
-                
-                # Wait for login to complete
-                time.sleep(5)
-                
-                # Check if login was successful
-                if is_logged_in(driver):
-                    logger.info("Alternative login successful")
-                    return True
-                
-            except NoSuchElementException:
-                logger.warning("Alternative selectors not found")
+            # Error left over from an earlier attempt, not an outcome of this one
+            previous_error = _read_error(driver)
             
-            # As a last resort, try using JavaScript to submit the form
-            try:
-                logger.info("Attempting to login using JavaScript")
-                driver.execute_script(
-                    f"document.querySelector('input[type=\"email\"]').value = '{credentials['username']}'; "
-                    f"document.querySelector('input[type=\"password\"]').value = '{credentials['password']}'; "
-                    f"document.querySelector('form').submit();"
-                )
-                time.sleep(5)
-                
-                if is_logged_in(driver):
-                    logger.info("JavaScript login successful")
-                    return True
-            except Exception as js_error:
-                logger.error(f"JavaScript login failed: {str(js_error)}")
+            # Fill and submit the form in one script, using the alternative
+            # selectors and falling back to the input types
+            if not driver.execute_script(_ALTERNATIVE_LOGIN_JS, credentials["username"], credentials["password"]):
+                logger.warning("Alternative login fields not found")
+                continue
+            
+            # Wait for login to complete or fail
+            logged_in, _ = _wait_for_login_outcome(driver, previous_error)
+            
+            # Check if login was successful
+            if logged_in:
+                logger.info("Alternative login successful")
+                _save_session(driver, credentials["username"])
+                return True
             
         except Exception as e:
             logger.error(f"Error during alternative login attempt: {str(e)}")
@@ -239,52 +693,32 @@ def is_logged_in(driver: WebDriver) -> bool:
     """
     Check if user is logged in by looking for indicators on the page.
     
+    All indicators are checked by one script in the browser, and the result is
+    reused for LOGGED_IN_CACHE_TTL seconds since retry and wait loops call this
+    repeatedly.
+    
     Args:
         driver: Selenium WebDriver instance
     
     Returns:
         bool: True if user is logged in, False otherwise
     """
-    # First try the primary indicator
-    try:
-        logged_in = is_element_present(
-            driver, 
-            LOGIN_SELECTORS["logged_in_indicator"]["by"], 
-            LOGIN_SELECTORS["logged_in_indicator"]["selector"]
-        )
-        
-        if logged_in:
-            return True
-    except Exception:
-        pass
-    
-    # If primary indicator check fails, try alternative
-    try:
-        logged_in = is_element_present(
-            driver, 
-            ALTERNATIVE_SELECTORS["logged_in_indicator"]["by"], 
-            ALTERNATIVE_SELECTORS["logged_in_indicator"]["selector"]
-        )
-        
-        if logged_in:
-            return True
-    except Exception:
-        pass
+    now = time.monotonic()
+    cached = _logged_in_cache.get(id(driver))
+    if cached and now - cached[0] < LOGGED_IN_CACHE_TTL:
+        return cached[1]
     
-    # Check if logout link exists anywhere on the page
     try:
-        logout_exists = len(driver.find_elements(By.XPATH, "//a[contains(text(), 'Logout')]")) > 0
-        if logout_exists:
-            return True
-    except Exception:
-        pass
-    
-    # Check URL for indicators of being logged in
-    current_url = driver.current_url.lower()
-    if "myprofile" in current_url or "dashboard" in current_url or "home" in current_url:
-        return True
+        # Primary and alternative indicators, a logout link, or a logged-in URL
+        logged_in = bool(driver.execute_script(
+            _LOGGED_IN_JS, _LOGGED_IN_PROBES, _LOGGED_IN_URL_MARKERS
+        ))
+    except Exception as e:
+        logger.error(f"Error checking login state: {str(e)}")
+        logged_in = False
     
-    return False
+    _logged_in_cache[id(driver)] = (now, logged_in)
+    return logged_in
 
 
 def get_error_message(driver: WebDriver) -> str:
@@ -298,29 +732,10 @@ def get_error_message(driver: WebDriver) -> str:
         str: Error message text, or empty string if no error
     """
     try:
-        error_elements = driver.find_elements(
-            getattr(By, LOGIN_SELECTORS["error_message"]["by"]), 
-            LOGIN_SELECTORS["error_message"]["selector"]
-        )
-        
-        if error_elements:
-            return error_elements[0].text
-    except Exception:
-        pass
-    
-    # Look for any visible error messages on the page
-    try:
-        error_candidates = driver.find_elements(By.XPATH, 
-            "//*[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'notification')]"
-        )
-        
-        for element in error_candidates:
-            if element.is_displayed() and element.text.strip():
-                return element.text.strip()
-    except Exception:
-        pass
-    
-    return ""
+        return driver.execute_script(_ERROR_MESSAGE_JS, LOGIN_SELECTORS["error_message"]["selector"]) or ""
+    except Exception as e:
+        logger.error(f"Error reading login error message: {str(e)}")
+        return ""
 
 
 def logout_from_naukri(driver: WebDriver) -> bool:
@@ -336,41 +751,35 @@ def logout_from_naukri(driver: WebDriver) -> bool:
     logger.info("Attempting to log out from Naukri.com")
     
     try:
-        # Try to find and click on user menu/profile icon first
-        profile_elements = driver.find_elements(By.XPATH, 
-            "//div[contains(@class, 'user') or contains(@class, 'profile') or contains(@class, 'account')]"
-        )
-        
-        for element in profile_elements:
-            if element.is_displayed():
-                element.click()
-                time.sleep(1)
-                break
+        # Try to find and click on user menu/profile icon first; visibility
+        # is checked in the page instead of an is_displayed() call per match
+        driver.execute_script(_CLICK_FIRST_VISIBLE_JS, [_PROFILE_MENU_LOCATOR])
         
-        # Look for logout link/button
-        logout_elements = driver.find_elements(By.XPATH, 
-            "//a[contains(text(), 'Logout') or contains(@href, 'logout')] | //button[contains(text(), 'Logout')]"
-        )
+        # Look for logout link/button, giving the menu a moment to open
+        _wait_until(driver, EC.any_of(
+            EC.presence_of_element_located(_LOGOUT_LINK_LOCATOR),
+            EC.presence_of_element_located(_LOGOUT_TEXT_LOCATOR)
+        ), timeout=3)
         
-        for element in logout_elements:
-            if element.is_displayed():
-                element.click()
-                time.sleep(3)
-                
-                # Check if logout was successful
-                if not is_logged_in(driver):
-                    logger.info("Logout successful")
-                    return True
-                break
+        if driver.execute_script(_CLICK_FIRST_VISIBLE_JS, [_LOGOUT_LINK_LOCATOR, _LOGOUT_TEXT_LOCATOR]):
+            _wait_until(driver, lambda d: not is_logged_in(d))
+            
+            # Check if logout was successful
+            if not is_logged_in(driver):
+                logger.info("Logout successful")
+                _clear_session()
+                return True
         
         logger.warning("Could not find logout elements. Trying direct logout URL.")
         
         # Try navigating to logout URL directly
-        driver.get("https://www.naukri.com/nlogin/logout")
-        time.sleep(3)
+        driver.get(NAUKRI_LOGOUT_URL)
         
-        if not is_logged_in(driver):
+        # The endpoint redirects to the login or marketing home page once the
+        # session is gone, so only probe the page if it ended up elsewhere
+        if _on_logged_out_page(driver) or _wait_until(driver, lambda d: not is_logged_in(d)):
             logger.info("Logout by URL successful")
+            _clear_session()
             return True
         
         logger.error("Failed to log out")
@@ -5,17 +5,23 @@ This module handles uploading and updating resumes on Naukri.com.
 """
 
 import os
+import re
+import random
+import stat
 import time
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 from src.utils.logger import get_logger
-from src.automation.browser_automation import safe_click, safe_send_keys, is_element_present, wait_for_element
+from src.automation.browser_automation import (
+    safe_click, safe_send_keys, is_element_present, WAIT_POLL_FREQUENCY
+)
 
 logger = get_logger()
 
@@ -63,6 +69,110 @@ ALTERNATIVE_SELECTORS = {
     }
 }
 
+# Resume file extensions accepted by Naukri.com
+ACCEPTED_RESUME_EXTENSIONS = frozenset({'.pdf', '.doc', '.docx', '.rtf', '.txt'})
+
+# Largest resume file accepted, in bytes (2MB)
+MAX_RESUME_SIZE_BYTES = 2 * 1024 * 1024
+
+# Delay between update attempts in seconds: doubles from the base after each
+# failed attempt up to the cap, plus up to RETRY_JITTER of random jitter
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 4
+RETRY_JITTER = 0.3
+
+# Selectors resolved once into (By strategy, selector) locator tuples
+_RESOLVED_SELECTORS = {
+    key: (getattr(By, value["by"]), value["selector"])
+    for key, value in RESUME_SELECTORS.items()
+}
+
+# XPaths of elements whose visible text confirms an upload, cheapest and most
+# specific first: the success message, the resume date, then any other
+# success indicator, which has to test the text of every node
+_UPLOAD_SUCCESS_XPATHS = (
+    RESUME_SELECTORS["success_message"]["selector"],
+    RESUME_SELECTORS["resume_date"]["selector"],
+    "//*[contains(@class, 'success') or contains(@class, 'Success') or "
+    "contains(text(), 'success') or contains(text(), 'Success') or "
+    "contains(text(), 'updated') or contains(text(), 'uploaded')]"
+)
+
+# Returns the trimmed text of the first rendered element with any text,
+# trying the XPaths in arguments[0] in order and stopping at the first one
+# that yields a result, or null if there is none
+_FIRST_VISIBLE_TEXT_JS = """
+    var xpaths = arguments[0];
+    for (var i = 0; i < xpaths.length; i++) {
+        var result = document.evaluate(xpaths[i], document, null,
+                                       XPathResult.ORDERED_NODE_ITERATOR_TYPE, null);
+        for (var node = result.iterateNext(); node; node = result.iterateNext()) {
+            var text = node.getClientRects().length > 0 && node.innerText.trim();
+            if (text) {
+                return text;
+            }
+        }
+    }
+    return null;
+"""
+
+# Any file input, used when the primary upload input is missing
+_FILE_INPUT_LOCATOR = (By.XPATH, ALTERNATIVE_SELECTORS["upload_button"]["selector"])
+
+# Any button that looks like it saves or uploads the resume
+_ANY_SAVE_BUTTON_LOCATOR = (
+    By.XPATH,
+    "//button[contains(text(), 'Save') or contains(text(), 'SAVE') or "
+    "contains(text(), 'Upload') or contains(text(), 'UPLOAD') or "
+    "contains(@class, 'save') or contains(@class, 'primary')]"
+)
+
+# Any text mentioning a resume, used to tell whether one is on the profile
+_RESUME_MENTION_LOCATOR = (By.XPATH, "//*[contains(text(), 'Resume') or contains(text(), 'CV')]")
+
+# Any text containing a resume file name
+_RESUME_FILE_NAME_XPATH = (
+    "//*[contains(text(), '.pdf') or contains(text(), '.doc') or "
+    "contains(text(), '.rtf') or contains(text(), '.txt')]"
+)
+
+# Resume file extension in a file name; the format is its upper-cased group
+_RESUME_FORMAT_RE = re.compile(r'\.(pdf|docx?|rtf|txt)', re.IGNORECASE)
+
+# Makes the first file input visible so that it can receive keys
+_REVEAL_FILE_INPUT_JS = """
+    var inputs = document.querySelectorAll('input[type="file"]');
+    if (inputs.length > 0) {
+        inputs[0].style.display = 'block';
+        inputs[0].style.opacity = '1';
+        inputs[0].style.visibility = 'visible';
+    }
+"""
+
+# Clicks the first button whose text mentions saving or uploading and
+# returns whether one was found
+_CLICK_SAVE_BUTTON_JS = """
+    var buttons = document.querySelectorAll('button');
+    for (var i = 0; i < buttons.length; i++) {
+        if (buttons[i].textContent.toLowerCase().includes('save') || 
+            buttons[i].textContent.toLowerCase().includes('upload')) {
+            buttons[i].click();
+            return true;
+        }
+    }
+    return false;
+"""
+
+
+@dataclass(frozen=True)
+class ResumeFile:
+    """
+    Resume file that passed validation, resolved once for all upload attempts.
+    """
+    abs_path: str
+    size: int
+    ext: str
+
 
 def update_resume(driver: WebDriver, resume_path: str, max_retries: int = 3) -> bool:
     """
@@ -78,26 +188,27 @@ def update_resume(driver: WebDriver, resume_path: str, max_retries: int = 3) ->
     """
     logger.info(f"Attempting to update resume with file: {resume_path}")
     
-    # Validate resume file
-    if not _validate_resume_file(resume_path):
+    # Validate resume file before navigating: it costs a single stat call,
+    # far less than the page load, and an invalid file then needs no load
+    resume = _validate_resume_file(resume_path)
+    if resume is None:
         logger.error("Resume file validation failed")
         return False
     
-    # Navigate to profile page
-    driver.get(RESUME_PROFILE_URL)
+    # Navigate to profile page unless it is already open; the wait below
+    # covers a page that is still loading
+    if not driver.current_url.startswith(RESUME_PROFILE_URL):
+        driver.get(RESUME_PROFILE_URL)
     
     # Wait for page to load
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((
-                getattr(By, RESUME_SELECTORS["edit_resume_button"]["by"]),
-                RESUME_SELECTORS["edit_resume_button"]["selector"]
-            ))
+        WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located(_RESOLVED_SELECTORS["edit_resume_button"])
         )
         logger.info("Profile page loaded successfully")
     except TimeoutException:
         logger.warning("Profile page elements not found with primary selectors. Trying alternative approach.")
-        return _try_alternative_resume_upload(driver, resume_path, max_retries)
+        return _try_alternative_resume_upload(driver, resume, max_retries)
     
     # Perform resume update attempts
     for attempt in range(1, max_retries + 1):
@@ -114,34 +225,24 @@ def update_resume(driver: WebDriver, resume_path: str, max_retries: int = 3) ->
                 
                 # Try direct navigation to resume upload page
                 driver.get(RESUME_UPLOAD_URL)
-                time.sleep(3)
             
-            # Wait for upload button to be visible
-            if not wait_for_element(
-                driver,
-                RESUME_SELECTORS["upload_button"]["by"],
-                RESUME_SELECTORS["upload_button"]["selector"],
-                timeout=10
-            ):
+            # Wait for the upload input and keep the element the wait returns
+            try:
+                upload_element = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.presence_of_element_located(_RESOLVED_SELECTORS["upload_button"])
+                )
+            except TimeoutException:
                 logger.error("Upload button not found")
                 continue
             
-            # Send the resume file path to the upload input
-            upload_element = driver.find_element(
-                getattr(By, RESUME_SELECTORS["upload_button"]["by"]),
-                RESUME_SELECTORS["upload_button"]["selector"]
-            )
-            
-            # Use absolute path to avoid issues
-            absolute_resume_path = os.path.abspath(resume_path)
-            upload_element.send_keys(absolute_resume_path)
+            # Send the resume file path to the upload input, using the
+            # absolute path to avoid issues
+            upload_element.send_keys(resume.abs_path)
             
             logger.info("Resume file selected")
             
-            # Wait for file to be processed
-            time.sleep(3)
-            
-            # Click save button
+            # Click save button; safe_click waits for it to become clickable,
+            # which covers the time taken to process the file
             if not safe_click(
                 driver,
                 RESUME_SELECTORS["save_button"]["by"],
@@ -150,16 +251,28 @@ def update_resume(driver: WebDriver, resume_path: str, max_retries: int = 3) ->
                 logger.error("Failed to click save button")
                 continue
             
-            # Wait for save to complete
-            time.sleep(5)
+            # Wait for save to complete, up to the delay previously slept. A
+            # success message already confirms the upload; only on timeout
+            # are the other success indicators checked
+            try:
+                success_message = WebDriverWait(driver, 5, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    lambda d: d.execute_script(_FIRST_VISIBLE_TEXT_JS, [RESUME_SELECTORS["success_message"]["selector"]])
+                )
+                logger.info(f"Success message found: {success_message}")
+                upload_confirmed = True
+            except TimeoutException:
+                upload_confirmed = _check_upload_success(driver)
             
-            # Check for success message
-            if _check_upload_success(driver):
+            if upload_confirmed:
                 logger.info("Resume updated successfully")
                 return True
             
-            # Wait before next attempt
-            time.sleep(2)
+            # Back off before the next attempt: short after the first failure,
+            # longer if failures persist, with jitter to avoid a fixed cadence
+            time.sleep(
+                min(RETRY_BACKOFF_BASE * 2 ** (attempt - 1), RETRY_BACKOFF_CAP) +
+                random.uniform(0, RETRY_JITTER)
+            )
             
         except Exception as e:
             logger.error(f"Error during resume update: {str(e)}")
@@ -167,18 +280,18 @@ def update_resume(driver: WebDriver, resume_path: str, max_retries: int = 3) ->
         # If we're on the last attempt, try alternative method
         if attempt == max_retries:
             logger.warning("All standard resume update attempts failed. Trying alternative approach.")
-            return _try_alternative_resume_upload(driver, resume_path, 1)
+            return _try_alternative_resume_upload(driver, resume, 1)
     
     return False
 
 
-def _try_alternative_resume_upload(driver: WebDriver, resume_path: str, max_retries: int) -> bool:
+def _try_alternative_resume_upload(driver: WebDriver, resume: ResumeFile, max_retries: int) -> bool:
     """
     Try alternative resume upload approach if the standard approach fails.
     
     Args:
         driver: Selenium WebDriver instance
-        resume_path: Path to the resume file
+        resume: Validated resume file
         max_retries: Maximum number of attempts
     
     Returns:
@@ -192,23 +305,21 @@ def _try_alternative_resume_upload(driver: WebDriver, resume_path: str, max_retr
         try:
             logger.info(f"Alternative resume update attempt {attempt}")
             
+            # File inputs found in this attempt, reused by the fallback below
+            file_inputs = []
+            
             # Try to find elements with alternative selectors
             try:
                 # Look for any file input
-                file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
+                file_inputs = driver.find_elements(*_FILE_INPUT_LOCATOR)
                 
                 if file_inputs:
                     # Use the first file input found
-                    absolute_resume_path = os.path.abspath(resume_path)
-                    file_inputs[0].send_keys(absolute_resume_path)
+                    file_inputs[0].send_keys(resume.abs_path)
                     logger.info("Resume file selected with alternative selector")
                     
                     # Look for any save/submit button
-                    save_buttons = driver.find_elements(By.XPATH, 
-                        "//button[contains(text(), 'Save') or contains(text(), 'SAVE') or "
-                        "contains(text(), 'Upload') or contains(text(), 'UPLOAD') or "
-                        "contains(@class, 'save') or contains(@class, 'primary')]"
-                    )
+                    save_buttons = driver.find_elements(*_ANY_SAVE_BUTTON_LOCATOR)
                     
                     if save_buttons:
                         # Click the first save button found
@@ -232,37 +343,29 @@ def _try_alternative_resume_upload(driver: WebDriver, resume_path: str, max_retr
             try:
                 logger.info("Attempting to upload resume using JavaScript")
                 
-                # Find any file input via JavaScript
-                driver.execute_script("""
-                    var inputs = document.querySelectorAll('input[type="file"]');
-                    if (inputs.length > 0) {
-                        inputs[0].style.display = 'block';
-                        inputs[0].style.opacity = '1';
-                        inputs[0].style.visibility = 'visible';
-                    }
-                """)
+                # Chrome sets the file on the input, hidden or not, through the
+                # DevTools protocol; other browsers need it revealed for keys
+                file_selected = _set_file_input_via_cdp(driver, resume.abs_path)
                 
-                time.sleep(1)
-                
-                # Try again to find file inputs
-                file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                
-                if file_inputs:
-                    absolute_resume_path = os.path.abspath(resume_path)
-                    file_inputs[0].send_keys(absolute_resume_path)
+                # find_elements also returns hidden inputs, so there is nothing
+                # to reveal if the lookup above found none
+                if not file_selected and file_inputs:
+                    # Make the file input visible via JavaScript
+                    driver.execute_script(_REVEAL_FILE_INPUT_JS)
                     
+                    time.sleep(1)
+                    
+                    # The script only restyles the input, so reuse the element
+                    # unless the page has re-rendered it since
+                    try:
+                        file_inputs[0].send_keys(resume.abs_path)
+                    except StaleElementReferenceException:
+                        driver.find_element(*_FILE_INPUT_LOCATOR).send_keys(resume.abs_path)
+                    file_selected = True
+                
+                if file_selected:
                     # Find and click any save button
-                    driver.execute_script("""
-                        var buttons = document.querySelectorAll('button');
-                        for (var i = 0; i < buttons.length; i++) {
-                            if (buttons[i].textContent.toLowerCase().includes('save') || 
-                                buttons[i].textContent.toLowerCase().includes('upload')) {
-                                buttons[i].click();
-                                return true;
-                            }
-                        }
-                        return false;
-                    """)
+                    driver.execute_script(_CLICK_SAVE_BUTTON_JS)
                     
                     time.sleep(5)
                     
@@ -280,50 +383,82 @@ def _try_alternative_resume_upload(driver: WebDriver, resume_path: str, max_retr
     return False
 
 
-def _validate_resume_file(resume_path: str) -> bool:
+def _set_file_input_via_cdp(driver: WebDriver, file_path: str) -> bool:
     """
-    Validate that the resume file exists and is of an acceptable type.
+    Set a file on the first file input using the Chrome DevTools protocol.
     
     Args:
-        resume_path: Path to the resume file
+        driver: Selenium WebDriver instance
+        file_path: Absolute path of the file to set
     
     Returns:
-        bool: True if file is valid, False otherwise
+        bool: True if the file was set, False if the browser has no DevTools
+        support or the page has no file input
     """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    
     try:
-        # Check if file exists
-        if not os.path.isfile(resume_path):
-            logger.error(f"Resume file not found: {resume_path}")
-            return False
+        document = driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})
+        node = driver.execute_cdp_cmd("DOM.querySelector", {
+            "nodeId": document["root"]["nodeId"],
+            "selector": "input[type='file']"
+        })
         
-        # Check file extension
-        _, extension = os.path.splitext(resume_path)
-        extension = extension.lower()
-        
-        acceptable_extensions = ['.pdf', '.doc', '.docx', '.rtf', '.txt']
-        
-        if extension not in acceptable_extensions:
-            logger.error(f"Resume file has invalid extension: {extension}. "
-                         f"Acceptable extensions are: {', '.join(acceptable_extensions)}")
+        if not node.get("nodeId"):
             return False
         
-        # Check file size (max 2MB)
-        max_size_bytes = 2 * 1024 * 1024
-        file_size = os.path.getsize(resume_path)
-        
-        if file_size > max_size_bytes:
-            logger.error(f"Resume file is too large: {file_size} bytes. "
-                         f"Maximum size is {max_size_bytes} bytes (2MB)")
-            return False
-        
-        logger.info(f"Resume file validation successful: {resume_path}")
+        driver.execute_cdp_cmd("DOM.setFileInputFiles", {"files": [file_path], "nodeId": node["nodeId"]})
+        logger.info("Resume file set through DevTools")
         return True
         
     except Exception as e:
-        logger.error(f"Error validating resume file: {str(e)}")
+        logger.warning(f"Could not set resume file through DevTools: {str(e)}")
         return False
 
 
+def _validate_resume_file(resume_path: str) -> Optional[ResumeFile]:
+    """
+    Validate that the resume file exists and is of an acceptable type.
+    
+    Args:
+        resume_path: Path to the resume file
+    
+    Returns:
+        Optional[ResumeFile]: The validated file, or None if it is invalid
+    """
+    # Check file extension first, which needs no filesystem access
+    extension = os.path.splitext(resume_path)[1].lower()
+    
+    if extension not in ACCEPTED_RESUME_EXTENSIONS:
+        logger.error(f"Resume file has invalid extension: {extension}. "
+                     f"Acceptable extensions are: {', '.join(sorted(ACCEPTED_RESUME_EXTENSIONS))}")
+        return None
+    
+    # Check that the file exists and its size with a single stat call; only
+    # the filesystem calls can fail here, so only OSError is caught
+    try:
+        file_stat = os.stat(resume_path)
+        absolute_path = os.path.abspath(resume_path)
+    except OSError as e:
+        logger.error(f"Resume file not found: {resume_path} ({str(e)})")
+        return None
+    
+    if not stat.S_ISREG(file_stat.st_mode):
+        logger.error(f"Resume file not found: {resume_path}")
+        return None
+    
+    file_size = file_stat.st_size
+    
+    if file_size > MAX_RESUME_SIZE_BYTES:
+        logger.error(f"Resume file is too large: {file_size} bytes. "
+                     f"Maximum size is {MAX_RESUME_SIZE_BYTES} bytes (2MB)")
+        return None
+    
+    logger.info(f"Resume file validation successful: {resume_path}")
+    return ResumeFile(abs_path=absolute_path, size=file_size, ext=extension)
+
+
 def _check_upload_success(driver: WebDriver) -> bool:
     """
     Check if resume upload was successful by looking for success indicators.
@@ -335,39 +470,14 @@ def _check_upload_success(driver: WebDriver) -> bool:
         bool: True if upload was successful, False otherwise
     """
     try:
-        # Check for success message
-        success_elements = driver.find_elements(
-            getattr(By, RESUME_SELECTORS["success_message"]["by"]),
-            RESUME_SELECTORS["success_message"]["selector"]
-        )
-        
-        for element in success_elements:
-            if element.is_displayed() and element.text.strip():
-                logger.info(f"Success message found: {element.text}")
-                return True
-        
-        # Check for resume date/timestamp update
-        resume_date_elements = driver.find_elements(
-            getattr(By, RESUME_SELECTORS["resume_date"]["by"]),
-            RESUME_SELECTORS["resume_date"]["selector"]
-        )
-        
-        for element in resume_date_elements:
-            if element.is_displayed() and element.text.strip():
-                logger.info(f"Resume date information found: {element.text}")
-                return True
-        
-        # Look for any success indicators
-        success_indicators = driver.find_elements(By.XPATH,
-            "//*[contains(@class, 'success') or contains(@class, 'Success') or "
-            "contains(text(), 'success') or contains(text(), 'Success') or "
-            "contains(text(), 'updated') or contains(text(), 'uploaded')]"
-        )
+        # Success message, resume date and any other success indicators are
+        # checked for visible text in the page by one script call, which
+        # stops at the first indicator found
+        success_text = driver.execute_script(_FIRST_VISIBLE_TEXT_JS, _UPLOAD_SUCCESS_XPATHS)
         
-        for element in success_indicators:
-            if element.is_displayed() and element.text.strip():
-                logger.info(f"Success indicator found: {element.text}")
-                return True
+        if success_text:
+            logger.info(f"Success indicator found: {success_text}")
+            return True
         
         logger.warning("No success indicators found for resume upload")
         return False
@@ -395,53 +505,41 @@ def get_resume_status(driver: WebDriver) -> Dict[str, Any]:
     }
     
     try:
-        # Navigate to profile page
+        # Navigate to profile page and wait, up to the delay previously
+        # slept, for the resume section to render
         driver.get(RESUME_PROFILE_URL)
-        time.sleep(3)
         
         # Check if resume exists
-        resume_elements = driver.find_elements(By.XPATH, 
-            "//*[contains(text(), 'Resume') or contains(text(), 'CV')]"
-        )
-        
-        if resume_elements:
+        try:
+            WebDriverWait(driver, 3, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                EC.presence_of_element_located(_RESUME_MENTION_LOCATOR)
+            )
             status["has_resume"] = True
+        except TimeoutException:
+            logger.debug("No resume mentioned on the profile page")
         
-        # Get last updated date
-        date_elements = driver.find_elements(
-            getattr(By, RESUME_SELECTORS["resume_date"]["by"]),
-            RESUME_SELECTORS["resume_date"]["selector"]
+        # The driver has no implicit wait, so the probes below return at
+        # once for elements that are absent instead of stalling on each
+        
+        # Get last updated date, filtering for visible text in the page
+        last_updated = driver.execute_script(
+            _FIRST_VISIBLE_TEXT_JS, [RESUME_SELECTORS["resume_date"]["selector"]]
         )
         
-        for element in date_elements:
-            if element.is_displayed() and element.text.strip():
-                status["last_updated"] = element.text.strip()
-                break
+        if last_updated:
+            status["last_updated"] = last_updated
         
-        # Try to get resume name and format
-        resume_info_elements = driver.find_elements(By.XPATH,
-            "//*[contains(text(), '.pdf') or contains(text(), '.doc') or "
-            "contains(text(), '.docx') or contains(text(), '.rtf')]"
-        )
+        # Try to get resume name and format from the first visible file
+        # name, found in the page by one script call
+        resume_name = driver.execute_script(_FIRST_VISIBLE_TEXT_JS, [_RESUME_FILE_NAME_XPATH])
         
-        for element in resume_info_elements:
-            if element.is_displayed() and element.text.strip():
-                text = element.text.strip()
-                status["resume_name"] = text
-                
-                # Extract format
-                if ".pdf" in text.lower():
-                    status["resume_format"] = "PDF"
-                elif ".doc" in text.lower():
-                    status["resume_format"] = "DOC"
-                elif ".docx" in text.lower():
-                    status["resume_format"] = "DOCX"
-                elif ".rtf" in text.lower():
-                    status["resume_format"] = "RTF"
-                elif ".txt" in text.lower():
-                    status["resume_format"] = "TXT"
-                
-                break
+        if resume_name:
+            status["resume_name"] = resume_name
+            
+            # Extract format
+            format_match = _RESUME_FORMAT_RE.search(resume_name)
+            if format_match:
+                status["resume_format"] = format_match.group(1).upper()
         
         logger.info(f"Retrieved resume status: {status}")
         return status
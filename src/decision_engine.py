@@ -6,17 +6,106 @@ It manages the feedback loop by capturing the UI state, analyzing it, and determ
 """
 
 import os
+import json
 import time
+import hashlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 
 from selenium.webdriver import Remote as WebDriver
-from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from src.ai.ocr_module import extract_text_from_screenshot
+from src.ai.ocr_module import extract_text_from_screenshot, warm_up_ocr
 from src.ai.object_detection import detect_ui_elements
 from src.ai.llm_decision import get_llm_decision
 from src.utils.logger import get_logger
-from src.utils.helper_functions import take_screenshot, wait_for_page_load
+from src.utils.helper_functions import take_screenshot_array, wait_for_page_load
+from src.automation.browser_automation import BY_METHODS, WAIT_POLL_FREQUENCY
+
+# Number of LLM decisions kept for reuse on identical page states
+_DECISION_CACHE_SIZE = 128
+
+# Page text and UI element counts that reach the LLM prompt, and so decide
+# whether two page states would produce the same prompt
+_PROMPT_TEXT_CHARS = 3000
+_PROMPT_UI_ELEMENTS = 20
+
+# Seconds to wait for an action to replace the current document. Clicks only
+# sometimes navigate, so they get a short window; other actions never do
+_NAVIGATION_WAITS = {'click': 1, 'navigate': 10, 'next_job': 10}
+
+# Seconds to wait for document.readyState to reach "complete"
+_READY_STATE_WAIT = 5
+
+# Throttle delay added per consecutive step that did not load a new page,
+# capped at the configured delay_between_actions
+_THROTTLE_STEP = 0.2
+
+
+def _xpath_literal(text: str) -> str:
+    """
+    Quote a string for use as an XPath 1.0 literal.
+    
+    Args:
+        text: Text to quote, which may contain single and double quotes
+    
+    Returns:
+        str: XPath expression evaluating to the text
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    
+    # XPath 1.0 has no escapes, so splice the single quotes in with concat()
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+@lru_cache(maxsize=256)
+def _text_xpath(text: str) -> str:
+    """
+    Build the XPath for elements whose text contains the given string.
+    
+    Args:
+        text: Text the element should contain
+    
+    Returns:
+        str: XPath selector
+    """
+    return f"//*[contains(text(), {_xpath_literal(text)})]"
+
+
+@lru_cache(maxsize=256)
+def _label_input_xpath(label: str) -> str:
+    """
+    Build the XPath for the first input following a label with the given text.
+    
+    Args:
+        label: Text the label should contain
+    
+    Returns:
+        str: XPath selector
+    """
+    return f"//label[contains(text(), {_xpath_literal(label)})]/following::input[1]"
+
+
+def _remove_screenshot(file_path: str) -> None:
+    """
+    Delete a screenshot that dropped out of the retention window.
+    
+    Args:
+        file_path: Path of the screenshot to delete
+    """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
 
 
 class DecisionEngine:
@@ -30,6 +119,14 @@ class DecisionEngine:
         applications_submitted: Number of job applications submitted
         max_applications: Maximum number of applications to submit
         screenshots_dir: Directory to save screenshots
+        ocr_config: OCR section of the configuration
+        llm_config: LLM section of the configuration
+        delay_between_actions: Maximum throttle delay between actions in seconds
+        decision_cache: LRU cache of LLM decisions keyed by page state
+        perception_pool: Worker threads running OCR and UI detection concurrently
+        screenshot_writer: Worker thread writing and deleting screenshot files
+        max_screenshots: Number of loop screenshots kept on disk (0 keeps all)
+        saved_screenshots: Paths of the kept screenshots, oldest first
     """
     
     def __init__(self, driver: WebDriver, config: Dict[str, Any]):
@@ -46,9 +143,20 @@ class DecisionEngine:
         self.applications_submitted = 0
         self.max_applications = config['job_criteria']['max_applications_per_session']
         self.screenshots_dir = config['files']['screenshot_directory']
+        self.ocr_config = config['ocr']
+        self.llm_config = config['llm']
+        self.delay_between_actions = config['application']['delay_between_actions']
+        self.decision_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.perception_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="perception")
+        self.screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+        self.max_screenshots = int(config['files'].get('max_screenshots', 50))
+        self.saved_screenshots: 'deque[str]' = deque()
         
         # Create screenshots directory if it doesn't exist
         os.makedirs(self.screenshots_dir, exist_ok=True)
+        
+        # Load OCR resources in the background so the first page is not slower
+        self.perception_pool.submit(warm_up_ocr, self.ocr_config)
     
     def run_application_loop(self) -> int:
         """
@@ -59,29 +167,36 @@ class DecisionEngine:
         """
         self.logger.info("Starting application loop")
         
+        # Whether the previous step completed an application
+        completed_previous = False
+        
+        # Steps in a row that did not load a new page, used to throttle requests
+        consecutive_fast_steps = 0
+        
         while self.applications_submitted < self.max_applications:
             try:
-                # Take a screenshot of the current page
-                screenshot_path = take_screenshot(self.driver, self.screenshots_dir)
-                self.logger.info(f"Screenshot taken: {screenshot_path}")
-                
-                # Extract text from the screenshot using OCR
-                extracted_text = extract_text_from_screenshot(screenshot_path, self.config['ocr'])
-                self.logger.debug(f"Extracted text: {extracted_text[:200]}...")
+                # Capture and analyze the current page
+                extracted_text, ui_elements = self._capture_page_state()
                 
-                # Detect UI elements in the screenshot
-                ui_elements = detect_ui_elements(screenshot_path)
-                self.logger.debug(f"Detected {len(ui_elements)} UI elements")
+                # Get the next action from the LLM, reusing the decision made
+                # for an identical page state unless an application was just
+                # completed and the page state may be left over from it
+                next_action, cache_key = self._get_decision(extracted_text, ui_elements, use_cache=not completed_previous)
+                action_type = next_action['action_type']
+                completed_previous = bool(next_action.get('completed_application', False))
+                self.logger.info(f"Next action decided: {action_type}")
                 
-                # Get the next action from the LLM
-                next_action = get_llm_decision(extracted_text, ui_elements, self.config['llm'])
-                self.logger.info(f"Next action decided: {next_action['action_type']}")
+                # Remember the current document to detect navigation by the action
+                old_root = self.driver.find_element(By.TAG_NAME, "html")
+                navigation_wait = _NAVIGATION_WAITS.get(action_type, 0)
                 
                 # Execute the action
                 success = self._execute_action(next_action)
                 
                 if not success:
-                    self.logger.warning(f"Failed to execute action: {next_action['action_type']}")
+                    self.logger.warning(f"Failed to execute action: {action_type}")
+                    # Only replay decisions that worked; ask the LLM again next time
+                    self.decision_cache.pop(cache_key, None)
                     # Try an alternative approach if primary action failed
                     if not self._handle_action_failure(next_action):
                         self.logger.error("Failed to recover from action failure. Moving to next job listing.")
@@ -89,18 +204,21 @@ class DecisionEngine:
                         continue
                 
                 # If we completed an application, increment the counter
-                if next_action.get('completed_application', False):
+                if completed_previous:
                     self.applications_submitted += 1
                     self.logger.info(f"Application submitted successfully. Total: {self.applications_submitted}")
                     
                     # Navigate to the next job listing
                     self._navigate_to_next_job_listing()
+                    navigation_wait = _NAVIGATION_WAITS['next_job']
                 
-                # Wait for the page to load after the action
-                wait_for_page_load(self.driver)
-                
-                # Small delay to prevent overloading the site
-                time.sleep(self.config['application']['delay_between_actions'])
+                # Wait for the page to settle after the action; a new page load
+                # already paces requests, so only throttle runs of in-page steps
+                if self._wait_for_page_settled(old_root, navigation_wait):
+                    consecutive_fast_steps = 0
+                else:
+                    consecutive_fast_steps += 1
+                    time.sleep(min(_THROTTLE_STEP * consecutive_fast_steps, self.delay_between_actions))
                 
             except WebDriverException as e:
                 self.logger.error(f"WebDriver error: {str(e)}")
@@ -113,6 +231,127 @@ class DecisionEngine:
         self.logger.info(f"Application loop completed. Submitted {self.applications_submitted} applications.")
         return self.applications_submitted
     
+    def _wait_for_page_settled(self, old_root: Any, navigation_wait: float) -> bool:
+        """
+        Wait for the page to be ready after an action.
+        
+        Args:
+            old_root: Root element of the document before the action
+            navigation_wait: Seconds to wait for the document to be replaced
+            
+        Returns:
+            bool: Whether the action loaded a new document
+        """
+        navigated = False
+        if navigation_wait:
+            try:
+                WebDriverWait(self.driver, navigation_wait, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.staleness_of(old_root)
+                )
+                navigated = True
+            except TimeoutException:
+                pass
+        
+        self._wait_for_ready_state()
+        return navigated
+    
+    def _wait_for_ready_state(self) -> None:
+        """Wait for document.readyState to reach "complete", logging on timeout."""
+        try:
+            WebDriverWait(self.driver, _READY_STATE_WAIT, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            self.logger.warning("Timed out waiting for page to finish loading")
+    
+    def close(self) -> None:
+        """Shut down the worker threads, finishing pending screenshot writes."""
+        self.perception_pool.shutdown(wait=True)
+        self.screenshot_writer.shutdown(wait=True)
+    
+    def _capture_page_state(self, prefix: str = None) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Take a screenshot and extract its text and UI elements.
+        
+        The screenshot is decoded once and the same image is passed to OCR and
+        UI detection; they only fall back to the saved file if decoding failed.
+        Both run concurrently, as tesseract works in a subprocess and OpenCV
+        releases the GIL, so the step takes as long as the slower of the two.
+        
+        Args:
+            prefix: Optional prefix for the screenshot filename
+            
+        Returns:
+            Tuple[str, List[Dict[str, Any]]]: Extracted text and detected UI elements
+        """
+        screenshot_path, screenshot = take_screenshot_array(
+            self.driver, self.screenshots_dir, prefix, executor=self.screenshot_writer
+        )
+        self.logger.info(f"Screenshot taken: {screenshot_path}")
+        
+        # Keep only the most recent screenshots; the writer thread handles
+        # tasks in order, so a file is never deleted before it is written
+        if screenshot_path:
+            self.saved_screenshots.append(screenshot_path)
+            while self.max_screenshots > 0 and len(self.saved_screenshots) > self.max_screenshots:
+                self.screenshot_writer.submit(_remove_screenshot, self.saved_screenshots.popleft())
+        image = screenshot if screenshot is not None else screenshot_path
+        
+        # Extract text using OCR while detecting UI elements in the screenshot
+        ocr_future = self.perception_pool.submit(extract_text_from_screenshot, image, self.ocr_config)
+        ui_future = self.perception_pool.submit(detect_ui_elements, image)
+        
+        extracted_text = ocr_future.result()
+        self.logger.debug(f"Extracted text: {extracted_text[:200]}...")
+        
+        ui_elements = ui_future.result()
+        self.logger.debug(f"Detected {len(ui_elements)} UI elements")
+        
+        return extracted_text, ui_elements
+    
+    def _get_decision(
+        self,
+        extracted_text: str,
+        ui_elements: List[Dict[str, Any]],
+        use_cache: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Get the next action from the LLM, reusing cached decisions.
+        
+        Decisions are keyed on the page text and UI elements that make up the
+        prompt, so a hit returns what the same prompt was answered with before.
+        Waits (including the fallback returned on LLM errors) and actions that
+        complete an application are never cached.
+        
+        Args:
+            extracted_text: Text extracted from the screenshot
+            ui_elements: List of detected UI elements
+            use_cache: Whether a cached decision may be returned
+            
+        Returns:
+            Tuple[Dict[str, Any], str]: Decision dictionary with action type and
+                parameters, and the cache key of the page state
+        """
+        cache_key = hashlib.sha256(json.dumps(
+            [extracted_text[:_PROMPT_TEXT_CHARS], ui_elements[:_PROMPT_UI_ELEMENTS]],
+            sort_keys=True,
+            default=str
+        ).encode('utf-8')).hexdigest()
+        
+        if use_cache and cache_key in self.decision_cache:
+            self.decision_cache.move_to_end(cache_key)
+            self.logger.info("Reusing cached LLM decision for identical page state")
+            return dict(self.decision_cache[cache_key]), cache_key
+        
+        action = get_llm_decision(extracted_text, ui_elements, self.llm_config)
+        
+        if action['action_type'] != 'wait' and not action.get('completed_application', False):
+            self.decision_cache[cache_key] = dict(action)
+            if len(self.decision_cache) > _DECISION_CACHE_SIZE:
+                self.decision_cache.popitem(last=False)
+        
+        return action, cache_key
+    
     def _execute_action(self, action: Dict[str, Any]) -> bool:
         """
         Execute the action decided by the LLM.
@@ -151,15 +390,12 @@ class DecisionEngine:
     
     def _handle_click_action(self, action: Dict[str, Any]) -> None:
         """Handle click action using different strategies."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
         import pyautogui
         
         # Try different strategies to click the element
         if 'selector' in action:
             # Try to click using Selenium selector
-            by_method = getattr(By, action['selector_type'].upper())
+            by_method = BY_METHODS[action['selector_type'].upper()]
             element = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((by_method, action['selector']))
             )
@@ -170,7 +406,7 @@ class DecisionEngine:
             pyautogui.click(x, y)
         elif 'element_text' in action:
             # Try to click on element containing specific text
-            elements = self.driver.find_elements(By.XPATH, f"//*[contains(text(), '{action['element_text']}')]")
+            elements = self.driver.find_elements(By.XPATH, _text_xpath(action['element_text']))
             if elements:
                 elements[0].click()
             else:
@@ -180,12 +416,8 @@ class DecisionEngine:
     
     def _handle_type_action(self, action: Dict[str, Any]) -> None:
         """Handle type action using different strategies."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
         if 'selector' in action:
-            by_method = getattr(By, action['selector_type'].upper())
+            by_method = BY_METHODS[action['selector_type'].upper()]
             element = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((by_method, action['selector']))
             )
@@ -193,10 +425,7 @@ class DecisionEngine:
             element.send_keys(action['text'])
         elif 'element_label' in action:
             # Try to find input field by associated label
-            elements = self.driver.find_elements(
-                By.XPATH, 
-                f"//label[contains(text(), '{action['element_label']}')]/following::input[1]"
-            )
+            elements = self.driver.find_elements(By.XPATH, _label_input_xpath(action['element_label']))
             if elements:
                 elements[0].clear()
                 elements[0].send_keys(action['text'])
@@ -207,12 +436,8 @@ class DecisionEngine:
     
     def _handle_select_action(self, action: Dict[str, Any]) -> None:
         """Handle select action for dropdown menus."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait, Select
-        from selenium.webdriver.support import expected_conditions as EC
-        
         if 'selector' in action:
-            by_method = getattr(By, action['selector_type'].upper())
+            by_method = BY_METHODS[action['selector_type'].upper()]
             element = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((by_method, action['selector']))
             )
@@ -234,9 +459,10 @@ class DecisionEngine:
         if 'scroll_amount' in action:
             self.driver.execute_script(f"window.scrollBy(0, {action['scroll_amount']});")
         elif 'scroll_to_element' in action and 'selector' in action:
-            from selenium.webdriver.common.by import By
-            by_method = getattr(By, action['selector_type'].upper())
-            element = self.driver.find_element(by_method, action['selector'])
+            by_method = BY_METHODS[action['selector_type'].upper()]
+            element = WebDriverWait(self.driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                EC.presence_of_element_located((by_method, action['selector']))
+            )
             self.driver.execute_script("arguments[0].scrollIntoView();", element)
         else:
             raise ValueError("Insufficient information to perform scroll action")
@@ -255,19 +481,13 @@ class DecisionEngine:
         
         try:
             # Take another screenshot to reassess the situation
-            screenshot_path = take_screenshot(self.driver, self.screenshots_dir, "recovery")
-            
-            # Extract text again
-            extracted_text = extract_text_from_screenshot(screenshot_path, self.config['ocr'])
-            
-            # Detect UI elements again
-            ui_elements = detect_ui_elements(screenshot_path)
+            extracted_text, ui_elements = self._capture_page_state("recovery")
             
             # Get a recovery action from the LLM
             recovery_action = get_llm_decision(
                 extracted_text, 
                 ui_elements, 
-                self.config['llm'],
+                self.llm_config,
                 context={"recovery": True, "failed_action": action}
             )
             
@@ -289,18 +509,20 @@ class DecisionEngine:
         self.logger.warning(f"Attempting to recover from WebDriver error: {str(error)}")
         
         try:
-            # Try refreshing the page
+            # Try refreshing the page; refresh() returns once the new document
+            # is loaded, so only readiness remains to be confirmed
             self.driver.refresh()
-            wait_for_page_load(self.driver)
+            self._wait_for_ready_state()
             self.logger.info("Page refreshed successfully")
-        except:
+        except WebDriverException as e:
+            self.logger.warning(f"Refresh failed ({type(e).__name__}): {str(e)}")
             try:
                 # If refresh fails, try navigating back
                 self.driver.back()
-                wait_for_page_load(self.driver)
+                self._wait_for_ready_state()
                 self.logger.info("Navigated back successfully")
-            except:
-                self.logger.error("Failed to recover from WebDriver error")
+            except WebDriverException as e:
+                self.logger.error(f"Failed to recover from WebDriver error ({type(e).__name__}): {str(e)}")
     
     def _navigate_to_next_job_listing(self) -> None:
         """Navigate to the next job listing."""
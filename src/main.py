@@ -14,7 +14,7 @@ from typing import Dict, Any
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.utils.logger import setup_logger
-from src.utils.config_loader import load_config
+from src.utils.config_loader import load_config, freeze_config
 from src.automation.browser_automation import initialize_browser, close_browser
 from src.automation.login import login_to_naukri
 from src.automation.resume_upload import update_resume
@@ -64,6 +64,9 @@ def main():
     config = load_config(args.config)
     config = update_config_with_args(config, args)
     
+    # The configuration is final from here on; make it read-only
+    config = freeze_config(config)
+    
     # Create necessary directories
     create_required_directories(config)
     
@@ -71,6 +74,8 @@ def main():
     logger = setup_logger(config['files']['log_directory'])
     logger.info("Starting Job Application Automation System")
     
+    decision_engine = None
+    
     try:
         # Initialize browser
         logger.info("Initializing browser")
@@ -128,6 +133,10 @@ def main():
     except Exception as e:
         logger.exception(f"An error occurred: {str(e)}")
     finally:
+        # Release the decision engine's worker threads
+        if decision_engine is not None:
+            decision_engine.close()
+        
         # Ensure browser is closed
         try:
             close_browser(driver)
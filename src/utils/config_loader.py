@@ -5,13 +5,25 @@ This module handles loading and parsing configuration settings from YAML files.
 """
 
 import os
+import copy
 import yaml
 import json
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, Tuple
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Use the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Prefix of environment variables that override configuration settings
+ENV_OVERRIDE_PREFIX = "JOB_AUTOMATION_"
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
@@ -30,9 +42,11 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     logger.info(f"Loading configuration from {config_path}")
     
     try:
-        with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
-            
+        # The parsed file is cached until it changes; work on a copy so the
+        # overrides below never modify the cached result
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        config = copy.deepcopy(_read_yaml(os.path.abspath(config_path), mtime_ns))
+        
         logger.info("Configuration loaded successfully")
         
         # Load sensitive information from environment variables if available
@@ -56,13 +70,30 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         raise
 
 
+@lru_cache(maxsize=8)
+def _read_yaml(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file, memoized on its path and modification time.
+    
+    Args:
+        config_path: Absolute path to the YAML configuration file
+        mtime_ns: Modification time of the file, so edits invalidate the cache
+        
+    Returns:
+        Dict[str, Any]: Parsed configuration; callers must not modify it
+    """
+    with open(config_path, 'r') as config_file:
+        return yaml.load(config_file, Loader=_YamlLoader)
+
+
 def _apply_environment_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Apply environment variable overrides to the configuration.
     
     Environment variables take precedence over the YAML configuration.
     For example, the environment variable JOB_AUTOMATION_CREDENTIALS_USERNAME
-    would override config['credentials']['username'].
+    would override config['credentials']['username']. Any setting in an
+    existing section can be overridden this way.
     
     Args:
         config: The loaded configuration dictionary
@@ -72,28 +103,80 @@ def _apply_environment_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     logger.debug("Checking for environment variable overrides")
     
-    # Look for credentials in environment variables
-    if 'credentials' in config:
-        username_env = os.environ.get('JOB_AUTOMATION_CREDENTIALS_USERNAME')
-        if username_env:
-            config['credentials']['username'] = username_env
-            logger.debug("Applied username from environment variable")
-            
-        password_env = os.environ.get('JOB_AUTOMATION_CREDENTIALS_PASSWORD')
-        if password_env:
-            config['credentials']['password'] = password_env
-            logger.debug("Applied password from environment variable")
-    
-    # Look for API keys in environment variables
-    if 'llm' in config:
-        api_key_env = os.environ.get('JOB_AUTOMATION_LLM_API_KEY')
-        if api_key_env:
-            config['llm']['api_key'] = api_key_env
-            logger.debug("Applied LLM API key from environment variable")
+    for name, value in sorted(os.environ.items()):
+        if not name.startswith(ENV_OVERRIDE_PREFIX) or not value:
+            continue
+        
+        target = _resolve_override_target(config, name[len(ENV_OVERRIDE_PREFIX):].lower())
+        if target is None:
+            logger.debug(f"Ignoring environment variable {name}: no matching configuration section")
+            continue
+        
+        section, key = target
+        section[key] = _coerce_override(value, section.get(key))
+        
+        # Only the variable name is logged, as values may be secrets
+        logger.debug(f"Applied {name} from environment variable")
     
     return config
 
 
+def _resolve_override_target(config: Dict[str, Any], name: str) -> Optional[Tuple[Dict[str, Any], str]]:
+    """
+    Find the setting an environment variable name refers to.
+    
+    Config keys may themselves contain underscores (e.g. api_key), so the name
+    is matched against the existing keys rather than split on every underscore.
+    
+    Args:
+        config: The loaded configuration dictionary
+        name: Lowercased variable name without the prefix (e.g. "llm_api_key")
+        
+    Returns:
+        Optional[Tuple]: The section dictionary and key to set, or None if the
+            name does not start with an existing section
+    """
+    section = None
+    node = config
+    while isinstance(node, dict):
+        if section is not None and name in node:
+            return node, name
+        
+        # Descend into the longest matching subsection
+        subsections = [key for key, value in node.items()
+                       if isinstance(value, dict) and name.startswith(f"{key}_")]
+        if not subsections:
+            break
+        
+        key = max(subsections, key=len)
+        section = node = node[key]
+        name = name[len(key) + 1:]
+    
+    # Settings not present in the YAML are added to the deepest matched section
+    return (section, name) if section is not None and name else None
+
+
+def _coerce_override(value: str, current: Any) -> Any:
+    """
+    Convert an environment variable value to the type of the setting it replaces.
+    
+    Args:
+        value: Raw environment variable value
+        current: Current value of the setting, or None if it is not set
+        
+    Returns:
+        Any: Converted value; strings are kept for new or string settings
+    """
+    if isinstance(current, bool):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(current, (int, float)):
+        try:
+            return type(current)(value)
+        except ValueError:
+            logger.warning(f"Expected a {type(current).__name__} override, keeping it as text")
+    return value
+
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """
     Validate the configuration to ensure all required fields are present.
@@ -140,6 +223,26 @@ def validate_config(config: Dict[str, Any]) -> bool:
     return True
 
 
+def freeze_config(config: Any) -> Any:
+    """
+    Make a read-only copy of a configuration.
+    
+    Dictionaries become MappingProxyType views and lists become tuples, so
+    accidental mutation anywhere downstream raises a TypeError.
+    
+    Args:
+        config: Configuration dictionary (or any value within one)
+        
+    Returns:
+        Any: Read-only copy of the configuration
+    """
+    if isinstance(config, Mapping):
+        return MappingProxyType({key: freeze_config(value) for key, value in config.items()})
+    if isinstance(config, list):
+        return tuple(freeze_config(value) for value in config)
+    return config
+
+
 def save_config(config: Dict[str, Any], config_path: str = "config.yaml") -> bool:
     """
     Save configuration to YAML file.
@@ -158,7 +261,7 @@ def save_config(config: Dict[str, Any], config_path: str = "config.yaml") -> boo
         os.makedirs(os.path.dirname(os.path.abspath(config_path)), exist_ok=True)
         
         with open(config_path, 'w') as config_file:
-            yaml.dump(config, config_file, default_flow_style=False)
+            yaml.dump(config, config_file, Dumper=_YamlDumper, default_flow_style=False)
             
         logger.info("Configuration saved successfully")
         return True
@@ -197,7 +300,8 @@ def create_default_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         },
         'ocr': {
             'tesseract_path': 'C:/Program Files/Tesseract-OCR/tesseract.exe',
-            'language': 'eng'
+            'language': 'eng',
+            'scale': 1.0
         },
         'llm': {
             'provider': 'openai',
@@ -227,6 +331,20 @@ def create_default_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     return default_config
 
 
+@lru_cache(maxsize=1024)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """
+    Split a dot-notation config path into its keys, memoized per path.
+    
+    Args:
+        key_path: Dot-notation path (e.g., "browser.type")
+        
+    Returns:
+        Tuple[str, ...]: Keys in lookup order
+    """
+    return tuple(key_path.split('.'))
+
+
 def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None) -> Any:
     """
     Get a value from the configuration using a dot-notation path.
@@ -239,11 +357,9 @@ def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None)
     Returns:
         Any: The requested configuration value or the default
     """
-    keys = key_path.split('.')
-    
     try:
         value = config
-        for key in keys:
+        for key in _split_key_path(key_path):
             value = value[key]
         return value
     except (KeyError, TypeError):
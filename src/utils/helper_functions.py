@@ -6,12 +6,16 @@ This module provides various utility functions used throughout the application.
 
 import os
 import time
+import base64
 import datetime
-import random
 import string
 import re
+from concurrent.futures import Executor
+from urllib.parse import urlparse
 from typing import Dict, Any, Optional, List, Tuple
 
+import cv2
+import numpy as np
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -21,6 +25,71 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Polling interval (seconds) for explicit waits
+WAIT_POLL_FREQUENCY = 0.1
+
+# google-re2 matches in linear time regardless of input, which matters for
+# the patterns run over long scraped text; it is optional
+try:
+    import re2 as _linear_re
+except ImportError:
+    _linear_re = re
+
+# Extra compile flags keeping \d, \s and \w to ASCII; RE2 classes are ASCII
+# already and its compile() takes an options object, not re flags
+_ASCII_FLAGS = (re.ASCII,) if _linear_re is re else ()
+
+
+class _DigitTable(dict):
+    """str.translate table keeping digit characters, filled in as they are seen."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if chr(codepoint).isdigit() else None
+        self[codepoint] = value
+        return value
+
+
+# Translation table used by extract_digits
+_DIGIT_TABLE = _DigitTable()
+
+# strptime formats that datetime.fromisoformat parses identically for
+# zero-padded input, with the length of such input
+_ISO_FORMAT_LENGTHS = {
+    '%Y-%m-%d': 10,
+    '%Y-%m-%d %H:%M:%S': 19,
+    '%Y-%m-%dT%H:%M:%S': 19,
+}
+
+# Strings parse_bool treats as true
+_TRUE_STRINGS = frozenset({'yes', 'true', 't', 'y', '1', 'on'})
+
+# Directories already created by _ensure_directory
+_ensured_directories = set()
+
+# Characters used by generate_random_string
+_RANDOM_STRING_ALPHABET = (string.ascii_letters + string.digits).encode('ascii')
+
+# Byte values below this limit map evenly onto the alphabet; the rest are
+# dropped so every character is equally likely
+_RANDOM_BYTE_LIMIT = 256 - 256 % len(_RANDOM_STRING_ALPHABET)
+
+# bytes.translate arguments mapping random bytes onto the alphabet
+_RANDOM_BYTE_TABLE = bytes(
+    _RANDOM_STRING_ALPHABET[b % len(_RANDOM_STRING_ALPHABET)] for b in range(256)
+)
+_RANDOM_BYTE_REJECTS = bytes(range(_RANDOM_BYTE_LIMIT, 256))
+
+# Email addresses
+_EMAIL_RE = _linear_re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', *_ASCII_FLAGS)
+
+# Basic pattern for phone numbers
+_PHONE_RE = _linear_re.compile(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', *_ASCII_FLAGS)
+
+# str.translate table replacing characters not allowed in filenames
+_FILENAME_TABLE = str.maketrans(
+    {c: '_' for c in '<>:"/\\|?*' + ''.join(chr(i) for i in range(0x20))}
+)
+
 
 def create_required_directories(config: Dict[str, Any]) -> None:
     """
@@ -38,43 +107,60 @@ def create_required_directories(config: Dict[str, Any]) -> None:
     
     for directory in directories:
         if directory:
-            os.makedirs(directory, exist_ok=True)
-            logger.debug(f"Created directory: {directory}")
+            _ensure_directory(directory)
+            logger.debug("Created directory: {}", directory)
 
 
-def wait_for_page_load(driver: WebDriver, timeout: int = 30) -> bool:
+def _ensure_directory(directory: str) -> None:
+    """
+    Create a directory if needed, remembering it so later calls skip the syscalls.
+    
+    Args:
+        directory: Directory to create
+    """
+    directory = os.path.abspath(directory)
+    if directory not in _ensured_directories:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_directories.add(directory)
+
+
+def wait_for_page_load(driver: WebDriver, timeout: int = 30, post_load_settle: float = 0.0) -> bool:
     """
     Wait for the page to load completely.
     
     Args:
         driver: Selenium WebDriver instance
         timeout: Maximum time to wait in seconds
+        post_load_settle: Extra seconds to wait after loading, for dynamic content
     
     Returns:
         bool: True if page loaded successfully, False otherwise
     """
     try:
         # Wait for the document to be in ready state
-        start_time = time.time()
-        
-        # First, check document.readyState
-        ready_state_complete = False
-        while not ready_state_complete and time.time() - start_time < timeout:
-            ready_state_complete = driver.execute_script("return document.readyState") == "complete"
-            if not ready_state_complete:
-                time.sleep(0.5)
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
         
-        # Wait a bit more for any dynamic content to load
-        time.sleep(1)
+        if post_load_settle > 0:
+            time.sleep(post_load_settle)
         
         logger.debug("Page loaded successfully")
         return True
+    except TimeoutException:
+        logger.warning(f"Page did not finish loading within {timeout}s")
+        return False
     except Exception as e:
         logger.error(f"Error waiting for page to load: {str(e)}")
         return False
 
 
-def take_screenshot(driver: WebDriver, directory: str, prefix: str = None) -> str:
+def take_screenshot(
+    driver: WebDriver,
+    directory: str,
+    prefix: str = None,
+    executor: Optional[Executor] = None
+) -> str:
     """
     Take a screenshot of the current browser window.
     
@@ -82,32 +168,140 @@ def take_screenshot(driver: WebDriver, directory: str, prefix: str = None) -> st
         driver: Selenium WebDriver instance
         directory: Directory to save screenshot
         prefix: Optional prefix for the screenshot filename
+        executor: Optional executor to write the file on, so the caller does
+            not wait for the disk; the path is returned before it is written
     
     Returns:
         str: Path to the saved screenshot
     """
     try:
-        # Create the directory if it doesn't exist
-        os.makedirs(directory, exist_ok=True)
-        
-        # Generate a filename with timestamp
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        if prefix:
-            filename = f"{prefix}_{timestamp}.png"
-        else:
-            filename = f"screenshot_{timestamp}.png"
+        png_bytes = _capture_png(driver)
         
         # Save the screenshot
-        file_path = os.path.join(directory, filename)
-        driver.save_screenshot(file_path)
+        file_path = _screenshot_file_path(directory, prefix)
+        if executor is not None:
+            executor.submit(_write_screenshot, file_path, png_bytes)
+        else:
+            _write_screenshot(file_path, png_bytes)
         
-        logger.debug(f"Screenshot saved: {file_path}")
         return file_path
     except Exception as e:
         logger.error(f"Error taking screenshot: {str(e)}")
         return ""
 
 
+def take_screenshot_array(
+    driver: WebDriver,
+    directory: str,
+    prefix: str = None,
+    executor: Optional[Executor] = None
+) -> Tuple[str, Optional[np.ndarray]]:
+    """
+    Take a screenshot of the current browser window and keep it in memory.
+    
+    The PNG is fetched from the browser once, written to disk as-is and decoded
+    once, so the returned image can be shared by OCR and UI detection instead
+    of each of them reading the file back.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        directory: Directory to save screenshot
+        prefix: Optional prefix for the screenshot filename
+        executor: Optional executor to write the file on, so the caller does
+            not wait for the disk; the path may be returned before the file is
+            written, unless decoding failed and callers need the file instead
+    
+    Returns:
+        Tuple[str, Optional[np.ndarray]]: Path to the screenshot and the
+            decoded BGR image, or ("", None) on failure
+    """
+    try:
+        png_bytes = _capture_png(driver)
+        image = cv2.imdecode(np.frombuffer(png_bytes, np.uint8), cv2.IMREAD_COLOR)
+        
+        # Save the screenshot
+        file_path = _screenshot_file_path(directory, prefix)
+        if executor is not None and image is not None:
+            executor.submit(_write_screenshot, file_path, png_bytes)
+        else:
+            _write_screenshot(file_path, png_bytes)
+        
+        return file_path, image
+    except Exception as e:
+        logger.error(f"Error taking screenshot: {str(e)}")
+        return "", None
+
+
+def _capture_png(driver: WebDriver) -> bytes:
+    """
+    Capture the current viewport as PNG bytes.
+    
+    Chromium drivers are asked through the DevTools protocol with
+    optimizeForSpeed, which trades PNG compression ratio for encoding time;
+    other drivers, or browsers rejecting the command, use the WebDriver
+    screenshot endpoint.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        bytes: PNG-encoded screenshot
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'png',
+                'captureBeyondViewport': False,
+                'optimizeForSpeed': True,
+            })
+            return base64.b64decode(result['data'])
+        except WebDriverException as e:
+            logger.debug("CDP screenshot failed, using WebDriver: {}", e.__class__.__name__)
+    
+    return driver.get_screenshot_as_png()
+
+
+def _write_screenshot(file_path: str, png_bytes: bytes) -> None:
+    """
+    Write encoded screenshot bytes to a file.
+    
+    Args:
+        file_path: Path to save the screenshot
+        png_bytes: PNG-encoded screenshot
+    """
+    try:
+        with open(file_path, 'wb') as f:
+            f.write(png_bytes)
+        logger.debug("Screenshot saved: {}", file_path)
+    except Exception as e:
+        logger.error(f"Error saving screenshot {file_path}: {str(e)}")
+
+
+def _screenshot_file_path(directory: str, prefix: str = None) -> str:
+    """
+    Build a timestamped screenshot path, creating the directory if needed.
+    
+    Args:
+        directory: Directory to save screenshot
+        prefix: Optional prefix for the screenshot filename
+    
+    Returns:
+        str: Path for the new screenshot
+    """
+    # Create the directory if it doesn't exist
+    _ensure_directory(directory)
+    
+    # Generate a filename with timestamp; include microseconds since several
+    # screenshots can be taken within the same second
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    if prefix:
+        filename = f"{prefix}_{timestamp}.png"
+    else:
+        filename = f"screenshot_{timestamp}.png"
+    
+    return os.path.join(directory, filename)
+
+
 def generate_random_string(length: int = 8) -> str:
     """
     Generate a random string of the specified length.
@@ -118,8 +312,14 @@ def generate_random_string(length: int = 8) -> str:
     Returns:
         str: Random string
     """
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    chunks = []
+    remaining = length
+    while remaining > 0:
+        chunk = os.urandom(remaining).translate(_RANDOM_BYTE_TABLE, _RANDOM_BYTE_REJECTS)
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    
+    return b''.join(chunks).decode('ascii')
 
 
 def extract_digits(text: str) -> str:
@@ -132,7 +332,7 @@ def extract_digits(text: str) -> str:
     Returns:
         str: String containing only digits
     """
-    return ''.join(filter(str.isdigit, text))
+    return text.translate(_DIGIT_TABLE)
 
 
 def extract_emails(text: str) -> List[str]:
@@ -145,8 +345,7 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List[str]: List of email addresses
     """
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
 
 def extract_phone_numbers(text: str) -> List[str]:
@@ -159,9 +358,7 @@ def extract_phone_numbers(text: str) -> List[str]:
     Returns:
         List[str]: List of phone numbers
     """
-    # Basic pattern for phone numbers
-    phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    return re.findall(phone_pattern, text)
+    return _PHONE_RE.findall(text)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -174,12 +371,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    # Replace invalid characters with underscores
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1F]'
-    sanitized = re.sub(invalid_chars, '_', filename)
-    
-    # Trim whitespace and ensure it's not empty
-    sanitized = sanitized.strip()
+    # Replace invalid characters with underscores, then trim whitespace
+    # and ensure it's not empty
+    sanitized = filename.translate(_FILENAME_TABLE).strip()
     if not sanitized:
         sanitized = "file"
     
@@ -215,7 +409,7 @@ def get_current_timestamp() -> str:
     Returns:
         str: Formatted timestamp
     """
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
 def extract_domain_from_url(url: str) -> Optional[str]:
@@ -229,24 +423,34 @@ def extract_domain_from_url(url: str) -> Optional[str]:
         Optional[str]: Domain name or None if extraction fails
     """
     try:
-        domain_pattern = r'(?:https?://)?(?:www\.)?([^/]+)'
-        match = re.search(domain_pattern, url)
-        if match:
-            return match.group(1)
-        return None
-    except Exception:
+        # Without a scheme urlparse treats the host as part of the path
+        host = urlparse(url if '://' in url else f"http://{url}").hostname
+    except ValueError:
+        # Malformed netloc, e.g. an unterminated IPv6 literal
         return None
+    
+    if host and host.startswith('www.'):
+        return host[4:]
+    return host or None
 
 
-def retry_function(func, max_retries: int = 3, delay: int = 2, *args, **kwargs):
+def retry_function(
+    func,
+    *args,
+    max_retries: int = 3,
+    delay: float = 2,
+    retry_on: Tuple[type, ...] = (Exception,),
+    **kwargs
+):
     """
-    Retry a function multiple times with delay.
+    Retry a function multiple times with exponential backoff.
     
     Args:
         func: Function to retry
-        max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
         *args: Positional arguments for the function
+        max_retries: Maximum number of retry attempts
+        delay: Delay before the first retry in seconds, doubled after each attempt
+        retry_on: Exception types that trigger a retry; others propagate
         **kwargs: Keyword arguments for the function
     
     Returns:
@@ -255,10 +459,11 @@ def retry_function(func, max_retries: int = 3, delay: int = 2, *args, **kwargs):
     for attempt in range(max_retries):
         try:
             return func(*args, **kwargs)
-        except Exception as e:
-            logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
+        except retry_on as e:
+            # Arguments are only formatted if a sink accepts the record
+            logger.warning("Attempt {}/{} failed: {}", attempt + 1, max_retries, e)
             if attempt < max_retries - 1:
-                time.sleep(delay)
+                time.sleep(delay * (2 ** attempt))
     
     logger.error(f"All {max_retries} attempts failed")
     return None
@@ -277,7 +482,21 @@ def format_date(date_string: str, input_format: str, output_format: str) -> str:
         str: Formatted date string
     """
     try:
-        date_obj = datetime.datetime.strptime(date_string, input_format)
+        date_obj = None
+        
+        # Zero-padded ISO dates go through the C-level ISO parser; it accepts
+        # more layouts than the format allows, so the result must format back
+        # to the input, otherwise strptime's rules apply
+        if _ISO_FORMAT_LENGTHS.get(input_format) == len(date_string):
+            try:
+                date_obj = datetime.datetime.fromisoformat(date_string)
+                if date_obj.strftime(input_format) != date_string:
+                    date_obj = None
+            except ValueError:
+                pass
+        
+        if date_obj is None:
+            date_obj = datetime.datetime.strptime(date_string, input_format)
         return date_obj.strftime(output_format)
     except Exception as e:
         logger.error(f"Error formatting date: {str(e)}")
@@ -298,7 +517,7 @@ def parse_bool(value: Any) -> bool:
         return value
     
     if isinstance(value, str):
-        return value.lower() in ('yes', 'true', 't', 'y', '1')
+        return value.strip().lower() in _TRUE_STRINGS
     
     if isinstance(value, (int, float)):
         return value != 0
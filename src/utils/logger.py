@@ -6,7 +6,9 @@ This module provides a custom logger for the application with appropriate format
 
 import os
 import sys
+import inspect
 import logging
+import threading
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from datetime import datetime
 from typing import Optional
@@ -22,8 +24,32 @@ DEFAULT_LOG_FORMAT = (
     "<level>{message}</level>"
 )
 
-# Global logger instance
+# Log format for file handlers
+FILE_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Global logger instance, and the lock guarding its first initialization
 _logger = None
+_logger_lock = threading.Lock()
+
+
+def _link_latest_log(log_file: str, latest_log: str) -> bool:
+    """
+    Make latest_log a symbolic link to log_file.
+    
+    Args:
+        log_file: Path of the current log file
+        latest_log: Path of the link to create, replacing any existing file
+    
+    Returns:
+        bool: True if the link was created, False if symlinks are not supported
+    """
+    try:
+        if os.path.lexists(latest_log):
+            os.remove(latest_log)
+        os.symlink(os.path.basename(log_file), latest_log)
+        return True
+    except (OSError, NotImplementedError):
+        return False
 
 
 def setup_logger(log_directory: str = "logs", log_level: str = "INFO") -> loguru_logger:
@@ -50,32 +76,41 @@ def setup_logger(log_directory: str = "logs", log_level: str = "INFO") -> loguru
     # Configure loguru logger
     loguru_logger.remove()  # Remove default handler
     
-    # Add console handler
+    # Add console handler; only emit color codes to a terminal
     loguru_logger.add(
         sys.stderr,
         format=DEFAULT_LOG_FORMAT,
         level=log_level,
-        colorize=True
+        colorize=sys.stderr.isatty()
     )
     
-    # Add file handler for the timestamped log
+    # Add file handler for the timestamped log; enqueue moves the writes to a
+    # background thread so logging calls do not wait for the disk
     loguru_logger.add(
         log_file,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=FILE_LOG_FORMAT,
         level=log_level,
         rotation="10 MB",  # Rotate when file reaches 10 MB
         retention="1 month",  # Keep logs for 1 month
-        compression="zip"  # Compress rotated logs
+        compression="zip",  # Compress rotated logs
+        enqueue=True
     )
     
-    # Add file handler for the "latest.log" file
-    loguru_logger.add(
-        latest_log,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level=log_level,
-        rotation="1 day",  # Rotate daily
-        retention=3,  # Keep only last 3 days
-    )
+    # Point "latest.log" at the timestamped log rather than writing every
+    # message twice; fall back to a second file where symlinks are unavailable
+    if not _link_latest_log(log_file, latest_log):
+        loguru_logger.add(
+            latest_log,
+            format=FILE_LOG_FORMAT,
+            level=log_level,
+            rotation="1 day",  # Rotate daily
+            retention=3,  # Keep only last 3 days
+            enqueue=True
+        )
+    
+    # Route standard library logging through the same sinks; records below
+    # the configured level are dropped before they are even created
+    logging.basicConfig(handlers=[InterceptHandler()], level=log_level.upper(), force=True)
     
     # Set global logger
     _logger = loguru_logger
@@ -94,59 +129,48 @@ def get_logger() -> loguru_logger:
     """
     global _logger
     
+    # Double-checked so concurrent first calls do not register the sinks twice
     if _logger is None:
-        _logger = setup_logger()
+        with _logger_lock:
+            if _logger is None:
+                _logger = setup_logger()
         
     return _logger
 
 
-# Optional: Legacy-style logging adapter for compatibility with libraries expecting standard logging
-class StandardLibraryLoggerAdapter:
+class InterceptHandler(logging.Handler):
     """
-    Adapter that makes loguru work with libraries expecting standard library logger.
-    """
-    
-    def __init__(self, logger):
-        self.logger = logger
-    
-    def debug(self, msg, *args, **kwargs):
-        self.logger.debug(msg, *args, **kwargs)
-    
-    def info(self, msg, *args, **kwargs):
-        self.logger.info(msg, *args, **kwargs)
+    Handler that forwards standard library log records to loguru.
     
-    def warning(self, msg, *args, **kwargs):
-        self.logger.warning(msg, *args, **kwargs)
-    
-    def error(self, msg, *args, **kwargs):
-        self.logger.error(msg, *args, **kwargs)
-    
-    def exception(self, msg, *args, **kwargs):
-        self.logger.exception(msg, *args, **kwargs)
+    Records keep the level and source location of the original logging call,
+    so third-party libraries using the logging module end up in the same sinks.
+    """
     
-    def critical(self, msg, *args, **kwargs):
-        self.logger.critical(msg, *args, **kwargs)
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level = loguru_logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        
+        # Skip the logging module's own frames to report the original caller
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+        
+        loguru_logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
 def get_standard_logger(name: str = "job_automation") -> logging.Logger:
     """
     Get a standard library compatible logger.
     
+    Its records are forwarded to the loguru sinks once setup_logger has run.
+    
     Args:
         name: Logger name
     
     Returns:
         logging.Logger: Standard library compatible logger
     """
-    logger = logging.getLogger(name)
-    
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    
-    return logger 
\ No newline at end of file
+    return logging.getLogger(name)